@@ -5,46 +5,117 @@ Uses FREE APIs: Gemini (via direct SDK) + Groq (fast interviewer)
 """
 
 import os
-from typing import Dict
+import asyncio
+import logging
+from typing import Dict, List
 from langchain_groq import ChatGroq
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 import json
-import re
-import base64
+
+# Per-call diagnostics go through a level-gated logger instead of print().
+# Set AGENTS_LOG=DEBUG to restore the full trace; the default WARNING keeps
+# string formatting and stdout flushes off the per-turn hot path (debug
+# calls use %-style args so the message is never built when gated off).
+log = logging.getLogger("agents")
+log.setLevel(os.getenv("AGENTS_LOG", "WARNING"))
+if not log.handlers:
+    log.addHandler(logging.StreamHandler())
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def parse_json_response(raw_content: str) -> Dict:
+    """
+    Parse an LLM JSON response, tolerating markdown code fences.
+    Uses orjson when installed (2-5x faster than stdlib json).
+    """
+    raw_content = raw_content.strip()
+
+    # Remove markdown code blocks if present
+    if raw_content.startswith('```'):
+        lines = raw_content.split('\n')
+        raw_content = '\n'.join(lines[1:-1]) if len(lines) > 2 else raw_content
+        raw_content = raw_content.replace('```json', '').replace('```', '').strip()
+
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw_content)
+    return json.loads(raw_content)
 
 try:
     import google.generativeai as genai
     GEMINI_AVAILABLE = True
 except ImportError:
     GEMINI_AVAILABLE = False
-    print("⚠️ google-generativeai not installed. Run: pip install google-generativeai")
+    log.warning("⚠️ google-generativeai not installed. Run: pip install google-generativeai")
 
 try:
-    from tavily import TavilyClient
-    TAVILY_AVAILABLE = True
+    import diskcache
+    DISKCACHE_AVAILABLE = True
 except ImportError:
-    TAVILY_AVAILABLE = False
-    print("⚠️ tavily-python not installed. Install for web search: pip install tavily-python")
+    DISKCACHE_AVAILABLE = False
+    log.warning("⚠️ diskcache not installed. Install for company intel caching: pip install diskcache")
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Shared pooled HTTP clients for all Groq LLM instances. Keep-alive +
+# TLS session reuse saves the ~50-150ms handshake otherwise paid per call.
+if HTTPX_AVAILABLE:
+    _http_limits = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+    shared_http_client = httpx.Client(limits=_http_limits, timeout=30)
+    shared_async_http_client = httpx.AsyncClient(limits=_http_limits, timeout=30)
+else:
+    shared_http_client = None
+    shared_async_http_client = None
 
 # Initialize LLMs (FREE APIS)
-# Load API keys from Streamlit secrets (Cloud) or .env (Local)
-import streamlit as st
-from dotenv import load_dotenv
+# Load API keys from Streamlit secrets (Cloud) or .env (Local).
+# streamlit/dotenv are imported lazily inside the loaders so `import agents`
+# from a CLI tool or test doesn't drag the whole Streamlit runtime in,
+# and lru_cache keeps reruns from re-reading secrets/.env.
+import functools
 
-# Try Streamlit secrets first (for Cloud deployment), then .env (for local)
-try:
-    google_api_key = st.secrets["GOOGLE_API_KEY"]
-    groq_api_key = st.secrets["GROQ_API_KEY"]
-    print("🔐 Using Streamlit Cloud secrets")
-except (FileNotFoundError, KeyError):
-    # Fallback to .env for local development
-    load_dotenv()
-    google_api_key = os.getenv("GOOGLE_API_KEY")
-    groq_api_key = os.getenv("GROQ_API_KEY")
-    print("🔐 Using local .env file")
-
-print(f"🔑 Google API Key: {'✅ Found' if google_api_key and google_api_key != 'your_google_api_key_here' else '❌ Missing'}")
-print(f"🔑 Groq API Key: {'✅ Found' if groq_api_key and groq_api_key != 'your_groq_api_key_here' else '❌ Missing'}")
+
+@functools.lru_cache(maxsize=1)
+def _load_api_keys():
+    """Return (google_api_key, groq_api_key) from st.secrets or .env."""
+    # Try Streamlit secrets first (for Cloud deployment), then .env (for local)
+    try:
+        import streamlit as st
+        google_key = st.secrets["GOOGLE_API_KEY"]
+        groq_key = st.secrets["GROQ_API_KEY"]
+        log.info("🔐 Using Streamlit Cloud secrets")
+    except (ImportError, FileNotFoundError, KeyError):
+        # Fallback to .env for local development
+        from dotenv import load_dotenv
+        load_dotenv()
+        google_key = os.getenv("GOOGLE_API_KEY")
+        groq_key = os.getenv("GROQ_API_KEY")
+        log.info("🔐 Using local .env file")
+    return google_key, groq_key
+
+
+@functools.lru_cache(maxsize=1)
+def _load_tavily_key():
+    """Return the Tavily API key from st.secrets or the environment."""
+    try:
+        import streamlit as st
+        return st.secrets.get("TAVILY_API_KEY")
+    except (ImportError, FileNotFoundError, KeyError, AttributeError):
+        return os.getenv("TAVILY_API_KEY")
+
+
+google_api_key, groq_api_key = _load_api_keys()
+
+log.info(f"🔑 Google API Key: {'✅ Found' if google_api_key and google_api_key != 'your_google_api_key_here' else '❌ Missing'}")
+log.info(f"🔑 Groq API Key: {'✅ Found' if groq_api_key and groq_api_key != 'your_groq_api_key_here' else '❌ Missing'}")
 
 # Configure Gemini (using google-generativeai SDK directly - no auth issues!)
 if GEMINI_AVAILABLE and google_api_key and google_api_key != "your_google_api_key_here":
@@ -53,53 +124,403 @@ if GEMINI_AVAILABLE and google_api_key and google_api_key != "your_google_api_ke
         # Use the best available models from November 2025
         gemini_flash_model = genai.GenerativeModel('gemini-2.5-flash')  # Fast & smart
         gemini_pro_model = genai.GenerativeModel('gemini-2.5-pro')  # Most intelligent
-        print("✅ Gemini 2.5 configured successfully (Flash + Pro)")
+        log.info("✅ Gemini 2.5 configured successfully (Flash + Pro)")
     except Exception as e:
         gemini_flash_model = None
         gemini_pro_model = None
-        print(f"⚠️ Gemini configuration failed: {e}")
+        log.warning(f"⚠️ Gemini configuration failed: {e}")
 else:
     gemini_flash_model = None
     gemini_pro_model = None
-    print("⚠️ Gemini not configured. Set GOOGLE_API_KEY in .env or Streamlit secrets")
+    log.warning("⚠️ Gemini not configured. Set GOOGLE_API_KEY in .env or Streamlit secrets")
 
 # Groq: Super fast (for live interviewer)
 groq_llm = None
+groq_json_llm = None
+groq_interviewer_llm = None
 if groq_api_key and groq_api_key != "your_groq_api_key_here":
     try:
+        # All Groq instances share the pooled clients so sync and async
+        # calls alike reuse warm connections
+        _groq_pool = {}
+        if shared_http_client:
+            _groq_pool = {
+                "http_client": shared_http_client,
+                "http_async_client": shared_async_http_client
+            }
         groq_llm = ChatGroq(
             model="llama-3.3-70b-versatile",
             temperature=0.7,
-            api_key=groq_api_key
+            api_key=groq_api_key,
+            **_groq_pool
+        )
+        # Latency-critical voice of the product: specdec variant has the same
+        # quality at ~40% higher throughput. Questions are 2-4 sentences, so
+        # cap max_tokens instead of paying for an open-ended generation.
+        groq_interviewer_llm = ChatGroq(
+            model="llama-3.3-70b-specdec",
+            temperature=0.7,
+            api_key=groq_api_key,
+            max_tokens=300,
+            **_groq_pool
         )
+        # Small fast model for structured JSON extraction (Profiler/Critic).
+        # temperature=0 for determinism, JSON mode so output is always parseable.
+        groq_json_llm = ChatGroq(
+            model="llama-3.1-8b-instant",
+            temperature=0.0,
+            api_key=groq_api_key,
+            model_kwargs={"response_format": {"type": "json_object"}},
+            **_groq_pool
+        )
+    except Exception as e:
+        log.warning(f"⚠️ Groq unavailable: {e}")
+
+# Explicit Gemini context caches: cache_name -> model built from cached content
+_context_cache_models = {}
+
+
+def create_session_context_cache(state: Dict, ttl_seconds: int = 3600):
+    """
+    Create an explicit Gemini context cache for the per-session static blob
+    (resume + JD + company intel + profile + strategy). Gemini then reuses
+    the cached prefill on every call instead of re-tokenizing ~2-4k tokens
+    per question. Stores the handle in state['context_cache_name'].
+    """
+    if not GEMINI_AVAILABLE or not gemini_flash_model:
+        return None
+
+    profile = state.get('profile_analysis', {})
+    static_blob = f"""CANDIDATE RESUME:
+{state.get('resume_text_compact') or state.get('resume_text', '')}
+
+JOB DESCRIPTION:
+{state.get('job_description_compact') or state.get('job_description', '')}
+
+COMPANY CONTEXT:
+{state.get('company_intel', '')}
+
+CANDIDATE PROFILE:
+- Strengths: {profile.get('strengths', [])}
+- Areas to Probe: {profile.get('weaknesses', [])}
+
+INTERVIEW STRATEGY:
+{state.get('question_strategy', '')}"""
+
+    try:
+        import datetime
+        cached = genai.caching.CachedContent.create(
+            model='models/gemini-2.5-flash',
+            contents=[static_blob],
+            ttl=datetime.timedelta(seconds=ttl_seconds)
+        )
+        state['context_cache_name'] = cached.name
+        log.info(f"✅ Created Gemini context cache '{cached.name}' ({len(static_blob)} chars)")
+        return cached.name
     except Exception as e:
-        print(f"⚠️ Groq unavailable: {e}")
+        # Context caching needs a minimum token count and a paid tier - fall
+        # back silently to sending the full prompt each turn
+        log.warning(f"⚠️ Gemini context cache unavailable: {e}")
+        return None
+
 
 # Wrapper class to make Gemini work like LangChain LLM
 class GeminiWrapper:
-    def __init__(self, model, temperature=0.7):
+    def __init__(self, model, temperature=0.7, json_mode=False):
         self.model = model
         self.temperature = temperature
-    
-    def invoke(self, messages):
-        # Extract text from messages
-        if isinstance(messages, list):
-            # Handle list of messages
-            prompt = "\n".join([msg.content if hasattr(msg, 'content') else str(msg) for msg in messages])
-        else:
-            prompt = str(messages)
-        
+        # Constrained decoding: Gemini emits valid JSON directly, so no
+        # markdown fences to strip and no parse-failure retries
+        self.json_mode = json_mode
+
+    def _generation_config(self):
+        if self.json_mode:
+            return genai.types.GenerationConfig(
+                temperature=self.temperature,
+                response_mime_type="application/json"
+            )
+        return genai.types.GenerationConfig(temperature=self.temperature)
+
+    def _model_for(self, cached_content):
+        """Resolve the model, rebuilding from a context cache when given."""
+        if not cached_content:
+            return self.model
+        model = _context_cache_models.get(cached_content)
+        if model is None:
+            cached = genai.caching.CachedContent.get(cached_content)
+            model = genai.GenerativeModel.from_cached_content(cached)
+            _context_cache_models[cached_content] = model
+        return model
+
+    def _extract_prompt(self, messages):
+        # Extract text (and media parts) from messages. Plain-text messages
+        # collapse to a single prompt string; multimodal content becomes a
+        # parts list that generate_content accepts directly - raw bytes go
+        # through untouched, the SDK handles wire encoding itself.
+        if not isinstance(messages, list):
+            return str(messages)
+
+        parts = []
+        for msg in messages:
+            content = msg.content if hasattr(msg, 'content') else msg
+            if isinstance(content, list):
+                for part in content:
+                    if isinstance(part, dict):
+                        if part.get('type') == 'text':
+                            parts.append(part['text'])
+                        elif 'data' in part:
+                            parts.append({
+                                "mime_type": part.get("mime_type", "image/jpeg"),
+                                "data": part["data"]
+                            })
+                        else:
+                            parts.append(str(part))
+                    else:
+                        parts.append(str(part))
+            else:
+                parts.append(content if isinstance(content, str) else str(content))
+
+        if all(isinstance(p, str) for p in parts):
+            return "\n".join(parts)
+        return parts
+
+    def invoke(self, messages, cached_content=None):
+        prompt = self._extract_prompt(messages)
+
         # Generate response
-        generation_config = genai.types.GenerationConfig(temperature=self.temperature)
-        response = self.model.generate_content(prompt, generation_config=generation_config)
-        
+        generation_config = self._generation_config()
+        response = self._model_for(cached_content).generate_content(prompt, generation_config=generation_config)
+
         # Return in LangChain format
         class Response:
             def __init__(self, content):
                 self.content = content
-        
+
+        return Response(response.text)
+
+    async def ainvoke(self, messages, cached_content=None):
+        """Async variant using google-generativeai's native async API."""
+        prompt = self._extract_prompt(messages)
+
+        generation_config = self._generation_config()
+        response = await self._model_for(cached_content).generate_content_async(prompt, generation_config=generation_config)
+
+        class Response:
+            def __init__(self, content):
+                self.content = content
+
         return Response(response.text)
 
+    def stream(self, messages, cached_content=None):
+        """Yield response text chunks as they arrive (Gemini streaming API)."""
+        prompt = self._extract_prompt(messages)
+
+        generation_config = self._generation_config()
+        response = self._model_for(cached_content).generate_content(prompt, generation_config=generation_config, stream=True)
+        for chunk in response:
+            if chunk.text:
+                yield chunk.text
+
+# Resilience layer: a single 429/5xx from Groq or Gemini used to bubble
+# straight up and kill the session. Track recent outcomes per provider;
+# if >50% of the last 20 calls failed, the circuit opens and calls go
+# straight to the other provider.
+from collections import deque, Counter, OrderedDict
+import threading
+
+_failure_windows = {}
+
+# Lightweight observability: every provider attempt and cache lookup
+# bumps a counter here, surfaced in the sidebar. A refactor that
+# silently invalidates a cache key shows up as a climbing call count
+# instead of a surprise API bill. Process-wide, like the caches.
+llm_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def bump_stat(name: str) -> None:
+    with _stats_lock:
+        llm_stats[name] += 1
+
+
+def get_llm_stats() -> Dict:
+    with _stats_lock:
+        return dict(llm_stats)
+
+
+def _provider_of(llm_obj) -> str:
+    return "gemini" if isinstance(llm_obj, GeminiWrapper) else "groq"
+
+
+def _record_result(provider: str, ok: bool) -> None:
+    _failure_windows.setdefault(provider, deque(maxlen=20)).append(ok)
+    bump_stat(f"llm_{'ok' if ok else 'error'}:{provider}")
+
+
+def _circuit_open(provider: str) -> bool:
+    window = _failure_windows.get(provider)
+    if not window or len(window) < 10:
+        return False
+    return window.count(False) / len(window) > 0.5
+
+
+# Exact-match response cache shared by every ResilientLLM with cache=True.
+# Streamlit reruns and repeated sessions replay many prompts verbatim
+# (intro question templates, the critique rubric over an identical
+# answer); an exact replay can skip the provider round-trip entirely.
+# LRU-bounded; hits/misses show up in llm_stats.
+_RESPONSE_CACHE_SIZE = 256
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _response_cache_key(target, messages, kwargs) -> str:
+    import hashlib
+    model = getattr(target, 'model_name', None) or getattr(target, 'model', type(target).__name__)
+    parts = [repr(model)]
+    for m in messages if isinstance(messages, list) else [messages]:
+        parts.append(repr(getattr(m, 'content', m)))
+    parts.append(repr(sorted(kwargs.items())))
+    return hashlib.sha1("\x1f".join(parts).encode()).hexdigest()
+
+
+def _response_cache_get(key: str):
+    with _response_cache_lock:
+        if key in _response_cache:
+            _response_cache.move_to_end(key)
+            bump_stat("llm_response_cache_hit")
+            return _response_cache[key]
+    bump_stat("llm_response_cache_miss")
+    return None
+
+
+def _response_cache_put(key: str, value) -> None:
+    with _response_cache_lock:
+        _response_cache[key] = value
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > _RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+
+class ResilientLLM:
+    """
+    Retry-with-jitter + circuit-breaker wrapper around an LLM client.
+    Transient errors are retried with exponential backoff; when retries
+    run out (or the provider's circuit is open) the call fails over to
+    the other provider. Exposes the same invoke/ainvoke/stream surface.
+    """
+
+    def __init__(self, primary, fallback=None, attempts=3, cache=False):
+        self.primary = primary
+        self.fallback = fallback
+        self.attempts = attempts
+        # Exact-match replay cache; see _response_cache above. Only safe
+        # to enable where identical prompt -> identical reply is fine.
+        self.cache = cache
+
+    def _targets(self):
+        order = [self.primary]
+        if self.fallback is not None:
+            order.append(self.fallback)
+            if _circuit_open(_provider_of(self.primary)):
+                log.warning(f"   ⚡ Circuit open for {_provider_of(self.primary)}, trying {_provider_of(self.fallback)} first")
+                order.reverse()
+        return order
+
+    @staticmethod
+    def _clean_kwargs(target, kwargs):
+        # cached_content is a Gemini-only concept
+        if not isinstance(target, GeminiWrapper):
+            kwargs = {k: v for k, v in kwargs.items() if k != 'cached_content'}
+        return kwargs
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        import random
+        return min(8.0, 0.5 * (2 ** attempt)) * (0.5 + random.random())
+
+    def invoke(self, messages, **kwargs):
+        import time
+        cache_key = None
+        if self.cache:
+            cache_key = _response_cache_key(self.primary, messages, kwargs)
+            cached = _response_cache_get(cache_key)
+            if cached is not None:
+                return cached
+        last_error = None
+        for target in self._targets():
+            provider = _provider_of(target)
+            for attempt in range(self.attempts):
+                try:
+                    result = target.invoke(messages, **self._clean_kwargs(target, kwargs))
+                    _record_result(provider, True)
+                    if cache_key is not None:
+                        _response_cache_put(cache_key, result)
+                    return result
+                except Exception as e:
+                    last_error = e
+                    _record_result(provider, False)
+                    if attempt < self.attempts - 1:
+                        delay = self._backoff(attempt)
+                        log.warning(f"   ⚠️ {provider} call failed ({e}), retrying in {delay:.1f}s")
+                        time.sleep(delay)
+            log.warning(f"   ⚠️ {provider} exhausted retries, failing over" if self.fallback else f"   ❌ {provider} exhausted retries")
+        raise last_error
+
+    async def ainvoke(self, messages, **kwargs):
+        cache_key = None
+        if self.cache:
+            cache_key = _response_cache_key(self.primary, messages, kwargs)
+            cached = _response_cache_get(cache_key)
+            if cached is not None:
+                return cached
+        last_error = None
+        for target in self._targets():
+            provider = _provider_of(target)
+            for attempt in range(self.attempts):
+                try:
+                    result = await target.ainvoke(messages, **self._clean_kwargs(target, kwargs))
+                    _record_result(provider, True)
+                    if cache_key is not None:
+                        _response_cache_put(cache_key, result)
+                    return result
+                except Exception as e:
+                    last_error = e
+                    _record_result(provider, False)
+                    if attempt < self.attempts - 1:
+                        delay = self._backoff(attempt)
+                        log.warning(f"   ⚠️ {provider} call failed ({e}), retrying in {delay:.1f}s")
+                        await asyncio.sleep(delay)
+            log.warning(f"   ⚠️ {provider} exhausted retries, failing over" if self.fallback else f"   ❌ {provider} exhausted retries")
+        raise last_error
+
+    def stream(self, messages, **kwargs):
+        # Retrying mid-stream would duplicate already-yielded text, so only
+        # fail over while nothing has been emitted yet
+        yielded = False
+        last_error = None
+        for target in self._targets():
+            provider = _provider_of(target)
+            try:
+                if hasattr(target, 'stream'):
+                    for chunk in target.stream(messages, **self._clean_kwargs(target, kwargs)):
+                        yielded = True
+                        yield chunk
+                else:
+                    yield target.invoke(messages, **self._clean_kwargs(target, kwargs)).content
+                    yielded = True
+                _record_result(provider, True)
+                return
+            except Exception as e:
+                last_error = e
+                _record_result(provider, False)
+                if yielded:
+                    log.warning(f"   ⚠️ {provider} stream died mid-response: {e}")
+                    return
+                log.warning(f"   ⚠️ {provider} stream failed ({e}), trying next provider")
+        raise last_error
+
+
 # Map agents to optimal models
 if not gemini_flash_model and not groq_llm:
     raise RuntimeError("❌ No LLM configured! Please set GOOGLE_API_KEY in .env file (local) or Streamlit secrets (cloud)")
@@ -107,32 +528,85 @@ if not gemini_flash_model and not groq_llm:
 llm = groq_llm if groq_llm else GeminiWrapper(gemini_flash_model, 0.7)
 strict_llm = GeminiWrapper(gemini_pro_model, 0.3) if gemini_pro_model else GeminiWrapper(gemini_flash_model, 0.3)
 vision_llm = GeminiWrapper(gemini_flash_model, 0.7)
+# JSON extraction is the small-fast-model sweet spot: ~50ms TTFT on the 8B
+# vs much more on Gemini Pro. Fall back to Gemini in constrained-JSON mode.
+if groq_json_llm:
+    json_llm = groq_json_llm
+elif gemini_flash_model:
+    json_llm = GeminiWrapper(gemini_flash_model, 0.0, json_mode=True)
+else:
+    json_llm = strict_llm
+
+# Wrap the shared handles with retry + cross-provider failover. When both
+# providers are configured, Groq-backed roles fall back to Gemini and
+# vice versa, mirroring the primary/secondary split above.
+if groq_llm and gemini_flash_model:
+    llm = ResilientLLM(llm, GeminiWrapper(gemini_flash_model, 0.7), cache=True)
+    strict_llm = ResilientLLM(strict_llm, groq_llm, cache=True)
+    json_llm = ResilientLLM(json_llm, GeminiWrapper(gemini_flash_model, 0.0, json_mode=True), cache=True)
+else:
+    llm = ResilientLLM(llm, cache=True)
+    strict_llm = ResilientLLM(strict_llm, cache=True)
+    json_llm = ResilientLLM(json_llm, cache=True)
 
 
-class ProfilerAgent:
+# Prompt-size hygiene: big PDF resumes arrive as 10k+ chars and get
+# re-injected into several prompts per session. Most of the excess is
+# boilerplate (contact lines, links); caps are in chars (~4 chars/token,
+# so 6000 chars ~ 1500 tokens) to avoid a tokenizer dependency.
+import re
+
+_CONTACT_RE = re.compile(r'(@|https?://|www\.|linkedin\.com|github\.com|\+?\d[\d\s().-]{8,}\d)', re.IGNORECASE)
+_SECTION_RE = re.compile(
+    r'^\s*(EXPERIENCE|WORK EXPERIENCE|EMPLOYMENT|EDUCATION|SKILLS|PROJECTS|'
+    r'CERTIFICATIONS|SUMMARY|OBJECTIVE|ACHIEVEMENTS|HOBBIES|INTERESTS)\s*:?\s*$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+def _strip_boilerplate(text: str) -> str:
+    """Drop short contact/link lines (emails, phones, profile URLs)."""
+    kept = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped and len(stripped) < 80 and _CONTACT_RE.search(stripped):
+            continue
+        kept.append(line)
+    return "\n".join(kept)
+
+
+def truncate_resume(text: str, max_chars: int = 6000, per_section_chars: int = 2000) -> str:
     """
-    Agent 1: The Profiler
-    Extracts structured insights from resume and job description.
-    Uses entity extraction and semantic comparison.
+    Compact a resume before it enters any prompt: strip contact
+    boilerplate, cap each section (EXPERIENCE/EDUCATION/...) so one
+    rambling section can't crowd out the rest, then hard-cap the total.
     """
-    
-    def __init__(self):
-        self.llm = strict_llm
-    
-    def run(self, state: Dict) -> Dict:
-        """
-        Analyzes resume vs job description to find strengths/gaps.
-        """
-        print(f"   📊 ProfilerAgent: Processing resume ({len(state.get('resume_text', ''))} chars)...")
-        print(f"   📊 ProfilerAgent: Analyzing job description ({len(state.get('job_description', ''))} chars)...")
-        
-        prompt = f"""You are an expert talent analyzer. Extract structured insights.
+    text = _strip_boilerplate(text)
+    pieces = _SECTION_RE.split(text)
+    if len(pieces) > 1:
+        out = [pieces[0].strip()[:per_section_chars]]
+        for header, body in zip(pieces[1::2], pieces[2::2]):
+            out.append(header.upper())
+            out.append(body.strip()[:per_section_chars])
+        text = "\n".join(p for p in out if p)
+    return text[:max_chars]
+
+
+def truncate_jd(text: str, max_chars: int = 3200) -> str:
+    """Compact a job description: strip link/contact lines, hard-cap length."""
+    return _strip_boilerplate(text)[:max_chars]
+
+
+# Templates are built once at import. Beyond skipping per-call f-string
+# assembly, a single literal guarantees the static part stays byte-identical
+# across calls, which provider prefix caches require.
+PROFILER_TEMPLATE = """You are an expert talent analyzer. Extract structured insights.
 
 RESUME:
-{state['resume_text']}
+{resume_text}
 
 JOB DESCRIPTION:
-{state['job_description']}
+{job_description}
 
 Analyze and return JSON with:
 1. "matched_skills": List of skills candidate has that match job
@@ -153,29 +627,130 @@ Example:
   "experience_level": "mid",
   "red_flags": []
 }}"""
-        
-        print(f"   📊 ProfilerAgent: Calling Gemini Flash for analysis...")
+
+CRITIC_RUBRIC = """You are a silent interview coach evaluating a candidate's answer.
+
+Evaluate using STAR method (Situation, Task, Action, Result):
+1. Did they answer the specific question asked?
+2. Was the answer structured (STAR for behavioral, clear logic for technical)?
+3. Did they show confidence or hesitation?
+4. Was it too brief or too rambling?
+5. Any red flags? (vague, defensive, off-topic)
+
+BE BRUTALLY HONEST. If answer was weak or didn't address the question, score 1-3. If excellent, score 9-10. Don't be nice.
+
+Return JSON:
+{"score":7,"strengths":"Clear structure","weaknesses":"Missing specific examples","tip":"Use STAR method with concrete metrics","sentiment":"confident"}
+
+CRITICAL: Return ONLY valid JSON. No markdown blocks, no explanations. Just pure JSON starting with {."""
+
+CRITIC_QA_TEMPLATE = """QUESTION: {question}
+ANSWER: {answer}"""
+
+
+class ProfilerAgent:
+    """
+    Agent 1: The Profiler
+    Extracts structured insights from resume and job description.
+    Uses entity extraction and semantic comparison.
+    """
+
+    def __init__(self):
+        self.llm = json_llm
+        # Identical (resume, JD) pairs never re-hit the LLM - users re-run
+        # the same inputs constantly while iterating
+        self.cache = diskcache.Cache("./.cache/profiler") if DISKCACHE_AVAILABLE else {}
+
+    @staticmethod
+    def _cache_key(state: Dict) -> str:
+        import hashlib
+        payload = (state.get('resume_text', '') + "\x00" + state.get('job_description', '')).encode()
+        # blake2b: not a security hash, just a fast identity key
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _cached_analysis(self, state: Dict):
+        try:
+            return self.cache.get(self._cache_key(state))
+        except Exception:
+            return None
+
+    def _store_analysis(self, state: Dict, analysis: Dict) -> None:
+        try:
+            if DISKCACHE_AVAILABLE:
+                self.cache.set(self._cache_key(state), analysis)
+            else:
+                self.cache[self._cache_key(state)] = analysis
+        except Exception as e:
+            log.warning(f"   ⚠️ ProfilerAgent: Cache write failed: {e}")
+
+    def _apply_cached(self, state: Dict, analysis: Dict) -> Dict:
+        log.debug("   📊 ProfilerAgent: Cache hit, skipping LLM call")
+        # Downstream agents read the compact copies even on a cache hit
+        state['resume_text_compact'] = truncate_resume(state.get('resume_text', ''))
+        state['job_description_compact'] = truncate_jd(state.get('job_description', ''))
+        state['profile_analysis'] = analysis
+        state['agent_reasoning'] = f"📊 Profiler: Found {len(analysis.get('matched_skills', []))} matching skills, identified {len(analysis.get('weaknesses', []))} areas to probe."
+        return state
+    
+    def run(self, state: Dict) -> Dict:
+        """
+        Analyzes resume vs job description to find strengths/gaps.
+        """
+        cached = self._cached_analysis(state)
+        bump_stat("profiler_cache_hit" if cached else "profiler_cache_miss")
+        if cached:
+            return self._apply_cached(state, cached)
+
+        prompt = self._build_prompt(state)
+
+        log.debug("   📊 ProfilerAgent: Calling Gemini Flash for analysis...")
         response = self.llm.invoke([HumanMessage(content=prompt)])
-        print(f"   📊 ProfilerAgent: Received {len(response.content)} chars response")
-        
+        log.debug("   📊 ProfilerAgent: Received %s chars response", len(response.content))
+
+        return self._apply_response(state, response)
+
+    async def arun(self, state: Dict) -> Dict:
+        """
+        Async version of run() - used to overlap with ResearcherAgent.
+        """
+        cached = self._cached_analysis(state)
+        bump_stat("profiler_cache_hit" if cached else "profiler_cache_miss")
+        if cached:
+            return self._apply_cached(state, cached)
+
+        prompt = self._build_prompt(state)
+
+        log.debug("   📊 ProfilerAgent: Calling LLM for analysis (async)...")
+        response = await self.llm.ainvoke([HumanMessage(content=prompt)])
+        log.debug("   📊 ProfilerAgent: Received %s chars response", len(response.content))
+
+        return self._apply_response(state, response)
+
+    def _build_prompt(self, state: Dict) -> str:
+        log.debug("   📊 ProfilerAgent: Processing resume (%s chars)...", len(state.get('resume_text', '')))
+        log.debug("   📊 ProfilerAgent: Analyzing job description (%s chars)...", len(state.get('job_description', '')))
+
+        # Compact once, then every downstream agent reads the compact copy
+        state['resume_text_compact'] = truncate_resume(state['resume_text'])
+        state['job_description_compact'] = truncate_jd(state['job_description'])
+
+        return PROFILER_TEMPLATE.format_map({
+            "resume_text": state['resume_text_compact'],
+            "job_description": state['job_description_compact']
+        })
+
+    def _apply_response(self, state: Dict, response) -> Dict:
         # Parse JSON response - NO FALLBACKS, BE STRICT
-        raw_content = response.content.strip()
-        
-        # Remove markdown code blocks if present
-        if raw_content.startswith('```'):
-            lines = raw_content.split('\n')
-            raw_content = '\n'.join(lines[1:-1]) if len(lines) > 2 else raw_content
-            raw_content = raw_content.replace('```json', '').replace('```', '').strip()
-        
         try:
-            analysis = json.loads(raw_content)
-            print(f"   📊 ProfilerAgent: ✅ Successfully parsed JSON")
+            analysis = parse_json_response(response.content)
+            log.debug("   📊 ProfilerAgent: ✅ Successfully parsed JSON")
         except Exception as e:
-            print(f"   ❌ ProfilerAgent: CRITICAL ERROR - JSON parsing failed")
-            print(f"   ❌ Error details: {str(e)}")
-            print(f"   ❌ Raw response (first 500 chars):\n{raw_content[:500]}")
+            log.error("   ❌ ProfilerAgent: CRITICAL ERROR - JSON parsing failed")
+            log.error(f"   ❌ Error details: {str(e)}")
+            log.error(f"   ❌ Raw response (first 500 chars):\n{response.content[:500]}")
             raise ValueError(f"ProfilerAgent failed to generate valid JSON. System cannot proceed without candidate profile analysis. LLM output was not valid JSON format.")
-        
+
+        self._store_analysis(state, analysis)
         state['profile_analysis'] = analysis
         state['agent_reasoning'] = f"📊 Profiler: Found {len(analysis.get('matched_skills', []))} matching skills, identified {len(analysis.get('weaknesses', []))} areas to probe."
         
@@ -190,44 +765,131 @@ class ResearcherAgent:
     """
     
     def __init__(self):
-        # Try Streamlit secrets first, then .env
+        # Imported here, not at module top: consumers that never research
+        # (tests, CLI tools) skip the dependency entirely
         try:
-            tavily_key = st.secrets.get("TAVILY_API_KEY")
-        except (FileNotFoundError, KeyError, AttributeError):
-            tavily_key = os.getenv("TAVILY_API_KEY")
-        
-        if TAVILY_AVAILABLE and tavily_key and tavily_key != "your_tavily_api_key_here":
+            from tavily import TavilyClient
+        except ImportError:
+            TavilyClient = None
+            log.warning("⚠️ tavily-python not installed. Install for web search: pip install tavily-python")
+
+        tavily_key = _load_tavily_key()
+        if TavilyClient and tavily_key and tavily_key != "your_tavily_api_key_here":
             self.tavily_client = TavilyClient(api_key=tavily_key)
         else:
             self.tavily_client = None
         self.llm = strict_llm
+
+        # Company culture doesn't change between sessions - cache intel on
+        # disk for a week so repeat companies skip Tavily + the LLM entirely
+        self.cache = diskcache.Cache("./.cache/researcher") if DISKCACHE_AVAILABLE else None
+        self.cache_ttl = 7 * 86400
+
+    @staticmethod
+    def _cache_key(company: str) -> str:
+        import hashlib
+        return hashlib.sha256(company.lower().strip().encode()).hexdigest()
+
+    def _cached_intel(self, company: str):
+        if not self.cache:
+            return None
+        return self.cache.get(self._cache_key(company))
+
+    def _store_intel(self, company: str, intel: str) -> None:
+        if self.cache:
+            try:
+                self.cache.set(self._cache_key(company), intel, expire=self.cache_ttl)
+            except Exception as e:
+                log.warning(f"   ⚠️ ResearcherAgent: Cache write failed: {e}")
     
     def run(self, state: Dict) -> Dict:
         """
         Searches web for company culture, interview style, and recent news.
         """
         company = state.get('company_name', 'the company')
-        print(f"   🔍 ResearcherAgent: Researching '{company}'...")
-        
+        log.debug("   🔍 ResearcherAgent: Researching '%s'...", company)
+
+        cached = self._cached_intel(company)
+        bump_stat("researcher_cache_hit" if cached else "researcher_cache_miss")
+        if cached:
+            log.debug("   🔍 ResearcherAgent: Cache hit for '%s' (%s chars)", company, len(cached))
+            state['company_intel'] = cached
+            state['agent_reasoning'] = f"🔍 Researcher: Loaded cached intel on {company}"
+            return state
+
         # Skip if Tavily not available
         if not self.tavily_client:
-            print(f"   🔍 ResearcherAgent: Tavily not configured, using fallback data")
-            state['company_intel'] = f"{company} values innovation, teamwork, and technical excellence. They use modern tech stack and agile methodologies."
-            state['agent_reasoning'] = "🔍 Researcher: Using default company profile (Tavily API not configured)"
+            return self._apply_fallback(state, company)
+
+        try:
+            results = self._search(company)
+            prompt = self._build_synthesis_prompt(company, results)
+
+            log.debug("   🔍 ResearcherAgent: Calling Gemini Flash to synthesize...")
+            response = self.llm.invoke([HumanMessage(content=prompt)])
+            self._apply_intel(state, company, results, response)
+
+        except Exception as e:
+            log.warning(f"   ⚠️ ResearcherAgent: Search failed ({e}), using fallback")
+            state['company_intel'] = f"{company} values innovation and technical excellence."
+            state['agent_reasoning'] = f"🔍 Researcher: Using fallback data (Search unavailable)"
+
+        return state
+
+    async def arun(self, state: Dict) -> Dict:
+        """
+        Async version of run() - used to overlap with ProfilerAgent.
+        Tavily's client is sync, so the search runs in a worker thread.
+        """
+        company = state.get('company_name', 'the company')
+        log.debug("   🔍 ResearcherAgent: Researching '%s' (async)...", company)
+
+        cached = self._cached_intel(company)
+        bump_stat("researcher_cache_hit" if cached else "researcher_cache_miss")
+        if cached:
+            log.debug("   🔍 ResearcherAgent: Cache hit for '%s' (%s chars)", company, len(cached))
+            state['company_intel'] = cached
+            state['agent_reasoning'] = f"🔍 Researcher: Loaded cached intel on {company}"
             return state
-        
+
+        if not self.tavily_client:
+            return self._apply_fallback(state, company)
+
         try:
-            # Search for company culture and interview style
-            search_query = f"{company} engineering culture interview process"
-            print(f"   🔍 ResearcherAgent: Searching Tavily for '{search_query}'...")
-            results = self.tavily_client.search(query=search_query, max_results=3)
-            print(f"   🔍 ResearcherAgent: Found {len(results.get('results', []))} results")
-            
-            # Synthesize findings
-            context = "\n\n".join([r.get('content', '') for r in results.get('results', [])])
-            print(f"   🔍 ResearcherAgent: Synthesizing {len(context)} chars of data...")
-            
-            prompt = f"""Summarize key insights about {company} in 3-4 sentences:
+            results = await asyncio.to_thread(self._search, company)
+            prompt = self._build_synthesis_prompt(company, results)
+
+            log.debug("   🔍 ResearcherAgent: Calling LLM to synthesize (async)...")
+            response = await self.llm.ainvoke([HumanMessage(content=prompt)])
+            self._apply_intel(state, company, results, response)
+
+        except Exception as e:
+            log.warning(f"   ⚠️ ResearcherAgent: Search failed ({e}), using fallback")
+            state['company_intel'] = f"{company} values innovation and technical excellence."
+            state['agent_reasoning'] = f"🔍 Researcher: Using fallback data (Search unavailable)"
+
+        return state
+
+    def _apply_fallback(self, state: Dict, company: str) -> Dict:
+        log.debug("   🔍 ResearcherAgent: Tavily not configured, using fallback data")
+        state['company_intel'] = f"{company} values innovation, teamwork, and technical excellence. They use modern tech stack and agile methodologies."
+        state['agent_reasoning'] = "🔍 Researcher: Using default company profile (Tavily API not configured)"
+        return state
+
+    def _search(self, company: str) -> Dict:
+        # Search for company culture and interview style
+        search_query = f"{company} engineering culture interview process"
+        log.debug("   🔍 ResearcherAgent: Searching Tavily for '%s'...", search_query)
+        results = self.tavily_client.search(query=search_query, max_results=3)
+        log.debug("   🔍 ResearcherAgent: Found %s results", len(results.get('results', [])))
+        return results
+
+    def _build_synthesis_prompt(self, company: str, results: Dict) -> str:
+        # Synthesize findings
+        context = "\n\n".join([r.get('content', '') for r in results.get('results', [])])
+        log.debug("   🔍 ResearcherAgent: Synthesizing %s chars of data...", len(context))
+
+        return f"""Summarize key insights about {company} in 3-4 sentences:
 
 SEARCH RESULTS:
 {context[:2000]}
@@ -239,19 +901,12 @@ Focus on:
 - What they look for in candidates
 
 Be specific and actionable."""
-            
-            print(f"   🔍 ResearcherAgent: Calling Gemini Flash to synthesize...")
-            response = self.llm.invoke([HumanMessage(content=prompt)])
-            state['company_intel'] = response.content
-            print(f"   🔍 ResearcherAgent: Generated {len(response.content)} char intel summary")
-            state['agent_reasoning'] = f"🔍 Researcher: Found {len(results.get('results', []))} sources on {company}'s interview culture"
-            
-        except Exception as e:
-            print(f"   ⚠️ ResearcherAgent: Search failed ({e}), using fallback")
-            state['company_intel'] = f"{company} values innovation and technical excellence."
-            state['agent_reasoning'] = f"🔍 Researcher: Using fallback data (Search unavailable)"
-        
-        return state
+
+    def _apply_intel(self, state: Dict, company: str, results: Dict, response) -> None:
+        state['company_intel'] = response.content
+        log.debug("   🔍 ResearcherAgent: Generated %s char intel summary", len(response.content))
+        state['agent_reasoning'] = f"🔍 Researcher: Found {len(results.get('results', []))} sources on {company}'s interview culture"
+        self._store_intel(company, response.content)
 
 
 class StrategyAgent:
@@ -269,8 +924,8 @@ class StrategyAgent:
         """
         profile = state.get('profile_analysis', {})
         company_intel = state.get('company_intel', '')
-        print(f"   🎯 StrategyAgent: Planning with {len(profile.get('matched_skills', []))} matched skills...")
-        print(f"   🎯 StrategyAgent: Considering {len(profile.get('missing_skills', []))} skill gaps...")
+        log.debug("   🎯 StrategyAgent: Planning with %s matched skills...", len(profile.get('matched_skills', [])))
+        log.debug("   🎯 StrategyAgent: Considering %s skill gaps...", len(profile.get('missing_skills', [])))
         
         prompt = f"""You are designing a realistic interview flow.
 
@@ -291,10 +946,10 @@ Create a strategic interview plan:
 
 Return a concise strategy (3-4 sentences)."""
         
-        print(f"   🎯 StrategyAgent: Calling Gemini Flash for strategy...")
+        log.debug("   🎯 StrategyAgent: Calling Gemini Flash for strategy...")
         response = self.llm.invoke([HumanMessage(content=prompt)])
         state['question_strategy'] = response.content
-        print(f"   🎯 StrategyAgent: Generated {len(response.content)} char strategy")
+        log.debug("   🎯 StrategyAgent: Generated %s char strategy", len(response.content))
         
         # Set initial persona
         if "supportive" in response.content.lower():
@@ -304,26 +959,160 @@ Return a concise strategy (3-4 sentences)."""
         else:
             state['interviewer_persona'] = "neutral"
         
-        print(f"   🎯 StrategyAgent: Set persona to '{state['interviewer_persona']}'")
+        log.debug("   🎯 StrategyAgent: Set persona to '%s'", state['interviewer_persona'])
         state['agent_reasoning'] = f"🎯 Strategy: Planned {state['interviewer_persona']} interview approach"
         
         return state
 
 
+# Compact interviewer rulebooks - the old multi-example prompt shipped
+# ~1.5-2k input tokens per question; these carry the same intent in a
+# fraction of the prefill cost and stay byte-identical across turns
+INTERVIEWER_DIRECTIVE = """You are a HIRING MANAGER filtering unqualified candidates, not a friendly chatbot.
+Demand specifics over vagueness, make every technical choice be justified, pressure-test solutions, correct wrong answers, and keep a cold, professional, rapid-fire tone."""
+
+STAGE_PROMPTS = {
+    "intro": "Ask a targeted opening about a key skill from the JD. NOT 'tell me about yourself'.",
+    "technical": "Ask a HARD role-specific technical question (system design, complexity, debugging). Expect them to explain in detail.",
+    "behavioral": "Ask a CHALLENGING behavioral question (failure, conflict, missed deadline). Demand names, dates, numbers, outcomes.",
+    "closing": "Probe a missing skill directly: how do they plan to ramp up? Be direct."
+}
+
+PERSONA_RULES = {
+    "supportive": "Professional but direct. Guide with leading questions, never give away answers.",
+    "neutral": "Standard tech interviewer - fact-checking, probing for depth, no fluff.",
+    "challenging": "Blunt senior staff engineer. Interrupt vague answers. Demand technical precision."
+}
+
+SEVERITY = {
+    "critical": "Unacceptable - push back hard and STAY on this topic until they give substance or admit they don't know.",
+    "weak": "Too vague - demand a concrete example with metrics; give at most one hint.",
+    "mediocre": "No depth - probe tradeoffs, edge cases, and what breaks at 10x load."
+}
+
+# Representative score per tier, used when the Interviewer runs speculatively
+# off the cheap tier classifier before the full Critic evaluation lands
+TIER_SCORES = {"critical": 2, "weak": 4, "mediocre": 6, "good": 8}
+
+
+def score_tier(score) -> str:
+    """Map a 1-10 Critic score onto the feedback tier the Interviewer uses."""
+    if score <= 2:
+        return "critical"
+    if score < 5:
+        return "weak"
+    if score < 7:
+        return "mediocre"
+    return "good"
+
+
+async def aclassify_answer_tier(question: str, answer: str) -> str:
+    """
+    Cheap speculative score-tier classifier on the fast 8B model.
+    The Interviewer only needs the tier (not the full evaluation JSON) to
+    pick its feedback branch, so this lets it start in parallel with the
+    Critic; a mismatch just means the question gets regenerated.
+    """
+    prompt = f"""Classify the quality of this interview answer as exactly one of:
+critical (non-answer, completely vague), weak (vague, no specifics), mediocre (some substance, no depth), good (specific and structured).
+
+QUESTION: {question}
+ANSWER: {answer}
+
+Return JSON: {{"tier": "weak"}}"""
+    try:
+        response = await json_llm.ainvoke([HumanMessage(content=prompt)])
+        tier = parse_json_response(response.content).get('tier', '')
+        if tier in TIER_SCORES:
+            return tier
+    except Exception as e:
+        log.warning(f"   ⚠️ Tier classifier failed ({e}), assuming mediocre")
+    return "mediocre"
+
+
 class InterviewerAgent:
     """
     Agent 3: The Simulation Director
     Conducts interview with dynamic persona injection.
     Adapts questions based on previous answers and feedback.
     """
-    
+
     def __init__(self):
-        self.llm = llm
-    
+        if groq_interviewer_llm:
+            fallback = GeminiWrapper(gemini_flash_model, 0.7) if gemini_flash_model else None
+            self.llm = ResilientLLM(groq_interviewer_llm, fallback)
+        else:
+            self.llm = llm
+
+    def _is_gemini(self) -> bool:
+        return isinstance(getattr(self.llm, 'primary', self.llm), GeminiWrapper)
+
     def run(self, state: Dict) -> Dict:
         """
         Generates next interview question based on context and previous feedback.
         """
+        cache_name = state.get('context_cache_name')
+        log.debug("   🎭 InterviewerAgent: Generating question with %s...", self.llm.__class__.__name__)
+        if self._is_gemini() and cache_name:
+            # Session blob lives in the Gemini context cache - send only the delta
+            messages = self._build_messages(state, include_static=False)
+            response = self.llm.invoke(messages, cached_content=cache_name)
+        else:
+            messages = self._build_messages(state)
+            response = self.llm.invoke(messages)
+        question = response.content.strip()
+        log.debug("   🎭 InterviewerAgent: Generated question (%s chars)", len(question))
+
+        return self._apply_question(state, question)
+
+    async def arun(self, state: Dict) -> Dict:
+        """
+        Async version of run() - used to overlap with the CriticAgent on
+        speculative turns (state carries a 'score_tier_hint').
+        """
+        cache_name = state.get('context_cache_name')
+        log.debug("   🎭 InterviewerAgent: Generating question with %s (async)...", self.llm.__class__.__name__)
+        if self._is_gemini() and cache_name:
+            messages = self._build_messages(state, include_static=False)
+            response = await self.llm.ainvoke(messages, cached_content=cache_name)
+        else:
+            messages = self._build_messages(state)
+            response = await self.llm.ainvoke(messages)
+        question = response.content.strip()
+        log.debug("   🎭 InterviewerAgent: Generated question (%s chars)", len(question))
+
+        return self._apply_question(state, question)
+
+    def run_stream(self, state: Dict):
+        """
+        Streaming variant of run(): yields question text chunks as they
+        arrive so the UI can render them immediately (st.write_stream),
+        then commits the full question to state like run() does.
+        """
+        messages = self._build_messages(state)
+
+        log.debug("   🎭 InterviewerAgent: Streaming question with %s...", self.llm.__class__.__name__)
+        chunks = []
+        for text in self._stream_llm(messages):
+            chunks.append(text)
+            yield text
+
+        question = "".join(chunks).strip()
+        log.debug("   🎭 InterviewerAgent: Streamed question (%s chars)", len(question))
+        self._apply_question(state, question)
+
+    def _stream_llm(self, messages: List):
+        """Stream chunks from either ChatGroq or GeminiWrapper."""
+        if hasattr(self.llm, 'stream'):
+            for chunk in self.llm.stream(messages):
+                content = chunk.content if hasattr(chunk, 'content') else str(chunk)
+                if content:
+                    yield content
+        else:
+            # No streaming support - fall back to one blocking chunk
+            yield self.llm.invoke(messages).content
+
+    def _build_messages(self, state: Dict, include_static: bool = True):
         stage = state.get('interview_stage', 'intro')
         persona = state.get('interviewer_persona', 'neutral')
         strategy = state.get('question_strategy', '')
@@ -332,91 +1121,58 @@ class InterviewerAgent:
         conversation = state.get('conversation_history', [])
         feedback = state.get('feedback_log', [])
         count = state.get('question_count', 0)
-        
-        print(f"   🎭 InterviewerAgent: Stage={stage}, Persona={persona}, Q#{count+1}")
-        print(f"   🎭 InterviewerAgent: {len(conversation)} messages in history")
-        
-        # Stage-specific instructions - REAL INTERVIEW QUESTIONS
-        stage_prompts = {
-            "intro": "Ask a targeted opening: 'Walk me through your experience with [KEY_SKILL from JD].' NOT 'tell me about yourself' - that's lazy.",
-            "technical": f"""Ask a HARD technical question about: {profile.get('weaknesses', ['their weak area'])[0]}.
-Examples:
-- 'Explain how you would design [SYSTEM] to handle 10M requests/day.'
-- 'What's the time complexity of [ALGORITHM] and why would you choose it over [ALTERNATIVE]?'
-- 'Debug this code: [SHOW CODE SNIPPET with bug]'
-Make it role-specific for {state.get('company_name', 'this company')}. Expect them to whiteboard/explain in detail.""",
-            "behavioral": """Ask a CHALLENGING behavioral question:
-- 'Tell me about a time you FAILED on a project. What went wrong?'
-- 'Describe a conflict with a coworker. How did you handle it?'
-- 'You missed a critical deadline. Walk me through your thought process.'
-DEMAND specifics: names, dates, numbers, outcomes. No generic answers.""",
-            "closing": "Ask about their weaknesses or gaps: 'You mentioned limited experience with [MISSING_SKILL]. How do you plan to ramp up?' Be direct."
-        }
-        
-        # Persona modifiers - STRICT INTERVIEW STYLE
-        persona_tones = {
-            "supportive": "Be professional but direct. If they struggle, guide them with leading questions, but don't give away answers.",
-            "neutral": "Be like a standard tech interviewer - professional, fact-checking, probing for depth. No fluff.",
-            "challenging": "You are a Senior Staff Engineer known for being tough. Be blunt about weak answers. Interrupt vague responses. Demand technical precision."
-        }
-        
-        # Build context from previous answer
+
+        log.debug("   \U0001f3ad InterviewerAgent: Stage=%s, Persona=%s, Q#%s", stage, persona, count+1)
+        log.debug("   \U0001f3ad InterviewerAgent: %s messages in history", len(conversation))
+
+        stage_prompt = STAGE_PROMPTS.get(stage, 'Continue the conversation naturally.')
+        if stage == "technical":
+            weaknesses = profile.get('weaknesses', ['their weak area'])
+            stage_prompt += f" Focus area: {weaknesses[0] if weaknesses else 'their weak area'}."
+
+        # Build compact context from the previous answer
         previous_context = ""
         feedback_instruction = ""
         if conversation and len(conversation) >= 2:
             last_q = conversation[-2].content if len(conversation) >= 2 else ""
             last_a = conversation[-1].content if len(conversation) >= 1 else ""
-            last_feedback = feedback[-1] if feedback else {}
-            last_score = last_feedback.get('score', 0)
-            
-            previous_context = f"""
-PREVIOUS QUESTION: {last_q}
+            tier_hint = state.get('score_tier_hint')
+
+            if tier_hint:
+                # Speculative turn: the true Critic score isn't in yet, so
+                # steer off the cheap tier classifier's verdict instead
+                last_score = TIER_SCORES[tier_hint]
+                previous_context = f"""PREVIOUS QUESTION: {last_q}
+CANDIDATE'S ANSWER: {last_a}
+INTERNAL ASSESSMENT: roughly {last_score}/10 ({tier_hint})"""
+                tier = tier_hint if tier_hint != "good" else None
+            else:
+                last_feedback = feedback[-1] if feedback else {}
+                last_score = last_feedback.get('score', 0)
+
+                previous_context = f"""PREVIOUS QUESTION: {last_q}
 CANDIDATE'S ANSWER: {last_a}
-INTERNAL ASSESSMENT: Score {last_score}/10 - {last_feedback.get('tip', '')}
-SENTIMENT: {last_feedback.get('sentiment', 'unknown')}
+INTERNAL ASSESSMENT: {last_score}/10 - {last_feedback.get('tip', '')} ({last_feedback.get('sentiment', 'unknown')})"""
+
+                tier = score_tier(last_score)
+                if tier == "good":
+                    tier = None
+            if tier:
+                feedback_instruction = f"Last answer scored {last_score}/10. {SEVERITY[tier]}"
+
+        # Prefix-cache friendly layout: everything constant for the session
+        # (directive, company intel, profile, strategy, persona) goes first in
+        # a byte-identical SystemMessage; the per-turn context goes last in
+        # the HumanMessage so provider prefix caching stays hot across turns.
+        system_prompt = f"""You are conducting a job interview for {state.get('company_name', 'a company')}.
+
+{INTERVIEWER_DIRECTIVE}
 """
-            
-            # Adjust follow-up based on performance - BE RUTHLESS
-            if last_score <= 2:
-                feedback_instruction = f"""
-🚨 CRITICAL FAILURE (scored {last_score}/10).
-Their answer was unacceptable. React like a REAL interviewer:
-
-IMMEDIATE PUSHBACK:
-- "I'm going to stop you there. That's not what I asked."
-- "Simply saying '{last_a[:30]}...' doesn't demonstrate the depth we need for this role."
-- "Let me rephrase: I need you to walk me through the TECHNICAL DETAILS of how you would..."
-
-DRILL DEEPER:
-- "You mentioned [X]. Explain the implementation. What data structures? What's the complexity?"
-- "That's too vague. Give me a SPECIFIC example with numbers and outcomes."
-- "No, that's incorrect. [Correct them]. Now, knowing that, how would you approach this?"
-
-Don't move on. STAY on this topic until they give substance or admit they don't know."""
-            elif last_score < 5:
-                feedback_instruction = f"""
-⚠️ WEAK ANSWER (scored {last_score}/10).
-They're being vague or surface-level. Challenge them:
-
-- "That's a good start, but I need more technical detail. Walk me through the architecture."
-- "You said '{last_a[:50]}...' - can you quantify that? What were the metrics? The impact?"
-- "I'm not convinced. Give me a concrete example where you personally implemented this."
-
-TEACHING MOMENT: If they're close, give ONE hint: "Think about [CONCEPT]. How does that apply here?"
-But don't give away the answer. Make them work for it."""
-            elif last_score < 7:
-                feedback_instruction = f"""
-⚡ MEDIOCRE (scored {last_score}/10).
-They answered but without depth. Probe for excellence:
-
-- "Interesting. Now explain the TRADEOFFS. Why did you choose X over Y?"
-- "Walk me through a specific edge case in that implementation."
-- "How would this scale? What breaks first at 10x load?"
-
-Real senior engineers don't just solve problems - they understand WHY."""
-        
-        prompt = f"""You are conducting a job interview for {state.get('company_name', 'a company')}.
 
+        if include_static:
+            # When a Gemini context cache holds the session blob, these
+            # sections are already in the cached prefix - skip resending
+            system_prompt += f"""
 COMPANY CONTEXT:
 {company_intel}
 
@@ -426,37 +1182,39 @@ CANDIDATE PROFILE:
 
 INTERVIEW STRATEGY:
 {strategy}
+"""
+
+        system_prompt += f"""
+YOUR PERSONA: {PERSONA_RULES[persona]}"""
+
+        # Rolling summary replaces the full transcript: one line per past
+        # question keeps earlier coverage visible at constant prompt cost
+        summary = state.get('running_summary', '')
+        covered = f"TOPICS ALREADY COVERED:\n{summary}\n" if summary else ""
 
-CURRENT STAGE: {stage.upper()}
-YOUR PERSONA: {persona_tones[persona]}
-{stage_prompts.get(stage, 'Continue the conversation naturally.')}
+        user_prompt = f"""CURRENT STAGE: {stage.upper()}
+{stage_prompt}
 
+{covered}
 {previous_context}
 
 {feedback_instruction}
 
-INTERVIEWER BEHAVIOR PROTOCOL:
-1. **Zero Tolerance for Vagueness**: If they say "I worked on X", interrupt: "HOW did you work on it? What was YOUR contribution?"
-2. **The Why Drill**: Every technical choice must be justified. "Why REST over GraphQL?" "Why Redis over Memcached?"
-3. **Catch Bullshit**: If they claim expertise but can't explain basics, call it out: "You mentioned 5 years of React, but can't explain hooks. Clarify your actual experience level."
-4. **Pressure Testing**: If they give a solution, attack it: "That design fails under [SCENARIO]. How do you handle that?"
-5. **Teach Through Failure**: If they're wrong, don't just move on. Correct them: "No, that's incorrect because [REASON]. Now, knowing this, how would you solve it?"
-6. **Tone**: Cold, professional, rapid-fire. No "great answer!" Just "Understood. Next question:" or "That's insufficient. Elaborate."
+Return ONLY the question/statement, no preamble."""
 
-CRITICAL: You are a HIRING MANAGER, not a friendly chatbot. Your job is to FILTER unqualified candidates, not encourage everyone.
+        return [SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)]
+
+    def _apply_question(self, state: Dict, question: str) -> Dict:
+        stage = state.get('interview_stage', 'intro')
+        persona = state.get('interviewer_persona', 'neutral')
+        conversation = state.get('conversation_history', [])
+        count = state.get('question_count', 0)
 
-Return ONLY the question/statement, no preamble."""
-        
-        print(f"   🎭 InterviewerAgent: Generating question with {self.llm.__class__.__name__}...")
-        response = self.llm.invoke([HumanMessage(content=prompt)])
-        question = response.content.strip()
-        print(f"   🎭 InterviewerAgent: Generated question ({len(question)} chars)")
-        
         state['current_question'] = question
         state['conversation_history'] = conversation + [AIMessage(content=question)]
         state['question_count'] = count + 1
         state['agent_reasoning'] = f"🎤 Interviewer: Asking {stage} question (#{count + 1}) in {persona} tone"
-        
+
         return state
 
 
@@ -466,67 +1224,76 @@ class CriticAgent:
     Silently evaluates answers using STAR method.
     Provides coaching tips without interrupting interview flow.
     """
-    
+
     def __init__(self):
-        self.llm = strict_llm
+        self.llm = json_llm
     
     def run(self, state: Dict) -> Dict:
         """
         Analyzes user's answer using STAR framework and provides score.
         """
-        question = state.get('current_question', '')
         answer = state.get('current_answer', '')
-        stage = state.get('interview_stage', 'intro')
-        
+
         if not answer:
-            print(f"   🤔 CriticAgent: No answer to evaluate, skipping...")
+            log.debug("   🤔 CriticAgent: No answer to evaluate, skipping...")
             return state
-        
-        print(f"   🤔 CriticAgent: Evaluating {len(answer)} char answer...")
-        
-        prompt = f"""You are a silent interview coach evaluating a candidate's answer.
 
-QUESTION: {question}
-ANSWER: {answer}
+        log.debug("   🤔 CriticAgent: Evaluating %s char answer...", len(answer))
+        log.debug("   🤔 CriticAgent: Calling LLM for evaluation...")
+        response = self.llm.invoke(self._build_messages(state))
 
-Evaluate using STAR method (Situation, Task, Action, Result):
-1. Did they answer the specific question asked?
-2. Was the answer structured (STAR for behavioral, clear logic for technical)?
-3. Did they show confidence or hesitation?
-4. Was it too brief or too rambling?
-5. Any red flags? (vague, defensive, off-topic)
+        return self._apply_evaluation(state, response)
 
-BE BRUTALLY HONEST. If answer was weak or didn't address the question, score 1-3. If excellent, score 9-10. Don't be nice.
+    async def arun(self, state: Dict) -> Dict:
+        """
+        Async version of run() - used to overlap with the InterviewerAgent
+        on speculative turns.
+        """
+        answer = state.get('current_answer', '')
 
-Return JSON:
-{{"score":7,"strengths":"Clear structure","weaknesses":"Missing specific examples","tip":"Use STAR method with concrete metrics","sentiment":"confident"}}
+        if not answer:
+            log.debug("   🤔 CriticAgent: No answer to evaluate, skipping...")
+            return state
 
-CRITICAL: Return ONLY valid JSON. No markdown blocks, no explanations. Just pure JSON starting with {{."""
-        
-        print(f"   🤔 CriticAgent: Calling Gemini Flash for evaluation...")
-        response = self.llm.invoke([HumanMessage(content=prompt)])
-        
-        raw_content = response.content.strip()
-        
-        # Remove markdown code blocks if present
-        if raw_content.startswith('```'):
-            lines = raw_content.split('\n')
-            raw_content = '\n'.join(lines[1:-1]) if len(lines) > 2 else raw_content
-            raw_content = raw_content.replace('```json', '').replace('```', '').strip()
-        
+        log.debug("   🤔 CriticAgent: Evaluating %s char answer (async)...", len(answer))
+        response = await self.llm.ainvoke(self._build_messages(state))
+
+        return self._apply_evaluation(state, response)
+
+    def _build_messages(self, state: Dict):
+        # Static rubric first (stable prefix for provider caching), the
+        # per-turn Q/A pair last in its own message
+        user_prompt = CRITIC_QA_TEMPLATE.format_map({
+            "question": state.get('current_question', ''),
+            "answer": state.get('current_answer', '')
+        })
+
+        return [SystemMessage(content=CRITIC_RUBRIC), HumanMessage(content=user_prompt)]
+
+    def _apply_evaluation(self, state: Dict, response) -> Dict:
         try:
-            evaluation = json.loads(raw_content)
-            print(f"   🤔 CriticAgent: ✅ Successfully parsed evaluation JSON")
+            evaluation = parse_json_response(response.content)
+            log.debug("   🤔 CriticAgent: ✅ Successfully parsed evaluation JSON")
         except Exception as e:
-            print(f"   ❌ CriticAgent: CRITICAL ERROR - JSON parsing failed")
-            print(f"   ❌ Error details: {str(e)}")
-            print(f"   ❌ Raw response (first 500 chars):\n{raw_content[:500]}")
+            log.error("   ❌ CriticAgent: CRITICAL ERROR - JSON parsing failed")
+            log.error(f"   ❌ Error details: {str(e)}")
+            log.error(f"   ❌ Raw response (first 500 chars):\n{response.content[:500]}")
             raise ValueError(f"CriticAgent failed to generate valid JSON. Cannot evaluate candidate answer quality without proper scoring.")
         
         state['current_answer_score'] = evaluation.get('score', 0)
         state['coaching_tip'] = evaluation.get('tip', '')
         state['feedback_log'] = state.get('feedback_log', []) + [evaluation]
-        print(f"   🤔 CriticAgent: Score={evaluation.get('score')}/10, Sentiment={evaluation.get('sentiment')}")
+
+        # Roll one line per answered question into the running summary -
+        # later prompts reference earlier coverage without resending the
+        # transcript, so prompt size stays flat as the interview grows
+        question = state.get('current_question', '')
+        summary_line = (
+            f"Q{state.get('question_count', 0)} ({state.get('interview_stage', 'intro')}): "
+            f"\"{question[:60]}\" scored {evaluation.get('score', 0)}/10"
+        )
+        state['running_summary'] = (state.get('running_summary', '') + "\n" + summary_line).strip()
+        log.debug("   🤔 CriticAgent: Score=%s/10, Sentiment=%s", evaluation.get('score'), evaluation.get('sentiment'))
         state['agent_reasoning'] = f"🤔 Critic: Scored {evaluation['score']}/10 - {evaluation['sentiment']} tone detected"
         
         return state
@@ -545,7 +1312,7 @@ class ReportAgent:
         """
         Generates detailed interview performance report.
         """
-        print(f"   📊 ReportAgent: Generating final report...")
+        log.debug("   📊 ReportAgent: Generating final report...")
         
         feedback_log = state.get('feedback_log', [])
         conversation = state.get('conversation_history', [])
@@ -553,8 +1320,8 @@ class ReportAgent:
         vision_feedback = state.get('vision_feedback_log', [])
         
         avg_score = sum(f.get('score', 0) for f in feedback_log) / max(len(feedback_log), 1)
-        print(f"   📊 ReportAgent: Analyzed {len(feedback_log)} answers, avg score={avg_score:.1f}/10")
-        print(f"   📊 ReportAgent: {len(conversation)} messages in transcript")
+        log.debug("   📊 ReportAgent: Analyzed %s answers, avg score=%.1f/10", len(feedback_log), avg_score)
+        log.debug("   📊 ReportAgent: %s messages in transcript", len(conversation))
         
         # Build conversation transcript
         transcript = []
@@ -587,9 +1354,9 @@ Create a report with:
 
 Be constructive but honest."""
         
-        print(f"   📊 ReportAgent: Calling Gemini Flash to generate report...")
+        log.debug("   📊 ReportAgent: Calling Gemini Flash to generate report...")
         response = self.llm.invoke([HumanMessage(content=prompt)])
-        print(f"   📊 ReportAgent: Generated {len(response.content)} char report")
+        log.debug("   📊 ReportAgent: Generated %s char report", len(response.content))
         
         report = f"""# 🎯 Interview Performance Report
 
@@ -630,19 +1397,49 @@ class VisionCoachAgent:
     
     def __init__(self):
         self.llm = vision_llm  # Gemini Flash with multimodal
-    
-    def analyze_frame(self, image_base64: str, question: str) -> Dict:
+
+    @staticmethod
+    def _shrink(frame) -> bytes:
+        """
+        Downscale a webcam frame to 384x384 JPEG before upload. Vision
+        tokens scale with pixels and coarse body-language cues survive the
+        downscale fine - this cuts payload bytes ~5-10x per frame.
+
+        Frames flow through as raw JPEG bytes end to end (a legacy base64
+        str is decoded once here); the Gemini SDK does its own wire
+        encoding, so base64 round-trips just cost CPU and +33% memory.
+        """
+        import base64
+        import io
+
+        if isinstance(frame, str):
+            frame = base64.b64decode(frame)
+        try:
+            from PIL import Image
+
+            img = Image.open(io.BytesIO(frame))
+            img.thumbnail((384, 384), Image.LANCZOS)
+            buf = io.BytesIO()
+            img.convert("RGB").save(buf, format="JPEG", quality=70, optimize=True)
+            return buf.getvalue()
+        except Exception as e:
+            log.warning(f"   ⚠️ VisionCoach: Frame downscale failed ({e}), sending original")
+            return frame
+
+    def analyze_frame(self, frame, question: str) -> Dict:
         """
         Analyzes a webcam frame for non-verbal cues.
-        
+
         Args:
-            image_base64: Base64 encoded image from webcam
+            frame: Raw JPEG bytes (or legacy base64 str) from webcam
             question: The question being answered (for context)
-        
+
         Returns:
             Dict with analysis (confidence, engagement, body_language)
         """
         try:
+            frame_bytes = self._shrink(frame)
+
             prompt = f"""You are an expert interview coach analyzing a candidate's non-verbal communication.
 
 THE QUESTION THEY'RE ANSWERING: {question}
@@ -663,14 +1460,12 @@ Return JSON:
 
 Return ONLY valid JSON."""
             
-            # Create message with image (Gemini multimodal format)
+            # Create message with image (Gemini multimodal format) - raw
+            # bytes, the SDK handles encoding at the network boundary
             message = HumanMessage(
                 content=[
                     {"type": "text", "text": prompt},
-                    {
-                        "type": "image_url",
-                        "image_url": f"data:image/jpeg;base64,{image_base64}"
-                    }
+                    {"type": "media", "mime_type": "image/jpeg", "data": frame_bytes}
                 ]
             )
             
@@ -697,17 +1492,96 @@ Return ONLY valid JSON."""
                 "coaching_tip": "Enable video for non-verbal feedback"
             }
     
+    def analyze_frames(self, frames: list, question: str) -> list:
+        """
+        Analyzes several webcam frames in ONE multimodal call instead of
+        one round-trip per frame (Gemini accepts multiple inline images).
+
+        Args:
+            frames: List of raw JPEG byte strings, in capture order
+            question: The question being answered (for context)
+
+        Returns:
+            List of analysis dicts, one per frame (same order)
+        """
+        if not frames:
+            return []
+        if len(frames) == 1:
+            return [self.analyze_frame(frames[0], question)]
+
+        try:
+            prompt = f"""You are an expert interview coach analyzing a candidate's non-verbal communication.
+
+THE QUESTION THEY'RE ANSWERING: {question}
+
+You are given {len(frames)} webcam images captured in order during the answer.
+For EACH image evaluate:
+1. **Confidence Level** (1-10): Eye contact, posture, facial expression
+2. **Engagement** (1-10): Attentiveness, energy level
+3. **Body Language Signals**: Fidgeting, slouching, hand gestures
+
+Return a JSON array with one object per image, in order:
+[{{"confidence": 1-10, "engagement": 1-10, "body_language": "Brief description", "coaching_tip": "One specific tip"}}, ...]
+
+Return ONLY valid JSON."""
+
+            content = [{"type": "text", "text": prompt}]
+            for frame in frames:
+                content.append({
+                    "type": "media",
+                    "mime_type": "image/jpeg",
+                    "data": self._shrink(frame)
+                })
+
+            response = self.llm.invoke([HumanMessage(content=content)])
+
+            try:
+                analyses = parse_json_response(response.content)
+                if isinstance(analyses, list):
+                    return analyses
+            except Exception:
+                pass
+            # Batch parse failed - fall back to per-frame calls
+            log.warning("   ⚠️ VisionCoach: Batch analysis unparseable, falling back to per-frame")
+            return [self.analyze_frame(f, question) for f in frames]
+
+        except Exception as e:
+            return [{
+                "confidence": 0,
+                "engagement": 0,
+                "body_language": f"Vision analysis unavailable: {str(e)}",
+                "coaching_tip": "Enable video for non-verbal feedback"
+            } for _ in frames]
+
     def run(self, state: Dict) -> Dict:
         """
-        Processes video frame if available in state.
+        Processes video frame(s) if available in state.
         """
+        current_frames = state.get('current_video_frames', None)
         current_frame = state.get('current_video_frame', None)
         current_question = state.get('current_question', '')
-        
-        if not current_frame:
+
+        if not current_frames and not current_frame:
             state['agent_reasoning'] = "📹 Vision: No video frame available"
             return state
-        
+
+        if current_frames:
+            # Batched path: one multimodal call for all frames this answer
+            analyses = self.analyze_frames(current_frames, current_question)
+            vision_log = state.get('vision_feedback_log', [])
+            for analysis in analyses:
+                vision_log.append({
+                    'question_num': state.get('question_count', 0),
+                    'analysis': analysis.get('body_language', ''),
+                    'confidence': analysis.get('confidence', 0),
+                    'engagement': analysis.get('engagement', 0)
+                })
+            state['vision_feedback_log'] = vision_log
+            analysis = analyses[-1]
+            state['current_vision_analysis'] = analysis
+            state['agent_reasoning'] = f"📹 Vision: Analyzed {len(analyses)} frames in one call (Confidence {analysis.get('confidence', 0)}/10)"
+            return state
+
         analysis = self.analyze_frame(current_frame, current_question)
         
         # Add to vision feedback log
@@ -724,3 +1598,30 @@ Return ONLY valid JSON."""
         state['agent_reasoning'] = f"📹 Vision: Confidence {analysis['confidence']}/10, Engagement {analysis['engagement']}/10"
         
         return state
+
+
+def _prewarm():
+    """
+    Send one-token requests to both providers so the first real agent call
+    skips DNS + TLS handshake and SDK lazy init (~300-800ms on cold start).
+    """
+    try:
+        if groq_llm:
+            groq_llm.invoke([HumanMessage(content="ok")], max_tokens=1)
+            log.info("🔥 Groq connection pre-warmed")
+    except Exception as e:
+        log.warning(f"⚠️ Groq pre-warm failed: {e}")
+    try:
+        if gemini_flash_model:
+            gemini_flash_model.generate_content(
+                "ok", generation_config=genai.types.GenerationConfig(max_output_tokens=1))
+            log.info("🔥 Gemini connection pre-warmed")
+    except Exception as e:
+        log.warning(f"⚠️ Gemini pre-warm failed: {e}")
+
+
+# Opt-in (PREWARM_LLM=1) so plain imports from tests/CLI tools aren't billed.
+# Runs on a daemon thread - app startup never waits on it.
+if os.getenv("PREWARM_LLM") == "1":
+    import threading
+    threading.Thread(target=_prewarm, daemon=True).start()
@@ -7,18 +7,73 @@ This is the "Wow Factor" - users see how AI is judging them in real-time.
 import streamlit as st
 from dotenv import load_dotenv
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from graph import run_preparation_phase, process_user_answer, generate_final_report
+from graph import run_preparation_phase, process_user_answer, stream_user_answer, generate_final_report
 from state import AgentState
 from pdf_processor import extract_resume_from_pdf
-from db_manager import create_session, save_profile, end_session
+from db_manager import ensure_db, create_session, save_profile, end_session
 from resume_analyzer import create_resume_analyzer
+from agents import get_llm_stats
 
 # Load environment variables
 load_dotenv()
 
-# Initialize resume analyzer
-resume_analyzer = create_resume_analyzer()
+
+# Streamlit reruns this whole script on every widget interaction -
+# cache_resource builds the analyzer (and its LLM clients) once per
+# process and shares it across sessions instead of per rerun
+@st.cache_resource
+def get_resume_analyzer():
+    return create_resume_analyzer()
+
+
+resume_analyzer = get_resume_analyzer()
+
+
+# One pool per process, shared across sessions: multi-second agent
+# pipelines run here instead of on the script thread, so the UI stays
+# responsive (and other users' reruns aren't head-of-line blocked)
+# while preparation or report generation is in flight
+@st.cache_resource
+def get_worker_pool():
+    return ThreadPoolExecutor(max_workers=8)
+
+
+# Re-submitting identical text used to re-run the whole LLM pipeline -
+# cache_data keys on the argument values, so same inputs hit cache.
+# _on_progress's leading underscore excludes it from the cache key;
+# cached hits skip it entirely (the full report renders instantly then)
+@st.cache_data(show_spinner=False, ttl=3600)
+def _cached_analyze(resume: str, job_desc: str, company: str,
+                    _on_progress=None) -> dict:
+    return get_resume_analyzer().analyze(resume, job_desc, company,
+                                         on_progress=_on_progress)
+
+
+# Streamlit's default hasher walks nested dicts recursively on every
+# call and is sensitive to key ordering - a reordered analysis dict
+# would silently miss cache and re-bill the LLM. A sorted JSON digest
+# gives a stable, cheap key.
+def _hash_analysis(d: dict) -> str:
+    import hashlib
+    import json
+    return hashlib.sha1(json.dumps(d, sort_keys=True, default=str).encode()).hexdigest()
+
+
+@st.cache_data(show_spinner=False, ttl=3600, hash_funcs={dict: _hash_analysis})
+def _cached_report(analysis: dict) -> str:
+    return get_resume_analyzer().generate_report(analysis)
+
+
+# The uploader widget holds the file across reruns, so without this the
+# PDF was re-parsed on every keystroke in the sibling text areas. Keyed
+# on the raw bytes, which Streamlit hashes natively.
+@st.cache_data(show_spinner=False)
+def _cached_extract(file_bytes: bytes) -> str:
+    import io
+    return extract_resume_from_pdf(io.BytesIO(file_bytes), validate=True)
 
 # Page configuration
 st.set_page_config(
@@ -34,23 +89,27 @@ if 'initialized' not in st.session_state:
     st.session_state.state = {}
     st.session_state.messages = []
     st.session_state.resume_analysis = None
+    st.session_state.pending_prep = None
+    st.session_state.pending_report = None
+    ensure_db()
 
 
 def initialize_interview():
     """
-    Runs the preparation phase (Profiler -> Researcher -> Strategy -> First Question)
+    Kicks off the preparation phase (Profiler -> Researcher -> Strategy ->
+    First Question) on the worker pool and moves to the 'analyzing' phase,
+    which polls the future. The script thread never blocks on the agents.
     """
-    with st.spinner("🤖 Agents are analyzing your profile..."):
-        # Create database session
-        session_id = create_session(
-            candidate_name="Anonymous",
-            company=st.session_state.company,
-            role="Engineering Role",
-            resume_length=len(st.session_state.resume)
-        )
-        
-        # Create initial state
-        initial_state = {
+    # Create database session
+    session_id = create_session(
+        candidate_name="Anonymous",
+        company=st.session_state.company,
+        role="Engineering Role",
+        resume_length=len(st.session_state.resume)
+    )
+
+    # Create initial state
+    initial_state = {
             'session_id': session_id,
             'resume_text': st.session_state.resume,
             'job_description': st.session_state.job_desc,
@@ -68,23 +127,16 @@ def initialize_interview():
             'interviewer_persona': 'neutral',
             'current_question': '',
             'current_answer': '',
+            'running_summary': '',
             'current_answer_score': 0,
             'coaching_tip': ''
         }
         
-        # Run preparation
-        result = run_preparation_phase(initial_state)
-        
-        # Save profile to database
-        if result.get('profile_analysis'):
-            save_profile(session_id, result['profile_analysis'])
-        
-        st.session_state.state = result
-        st.session_state.phase = 'interviewing'
-        st.session_state.messages = [
-            {"role": "assistant", "content": result.get('current_question', 'Let\'s begin!')}
-        ]
-        st.session_state.initialized = True
+    # Run preparation off-thread; the 'analyzing' phase polls this future
+    st.session_state.pending_prep = get_worker_pool().submit(
+        run_preparation_phase, initial_state
+    )
+    st.session_state.phase = 'analyzing'
 
 
 # Header
@@ -92,10 +144,13 @@ st.title("🎯 AI Interview Prep Coach")
 st.markdown("**Multi-Agent Interview Simulator with Real-Time AI Analysis**")
 
 # Sidebar - Agent Reasoning Dashboard
-with st.sidebar:
+# Fragment-scoped: the dashboard re-renders on its own cadence instead of
+# repainting metrics/expanders on every keystroke in the chat input
+@st.fragment
+def render_sidebar():
     st.header("🧠 Live Agent Thoughts")
     st.markdown("*See what the AI is thinking in real-time*")
-    
+
     if st.session_state.phase == 'interviewing' or st.session_state.phase == 'complete':
         state = st.session_state.state
         
@@ -151,6 +206,21 @@ with st.sidebar:
     else:
         st.caption("Agent insights will appear here during the interview.")
 
+    # Observability: a refactor that silently stops hitting a cache
+    # shows up here as a climbing call count, before the API bill does
+    with st.expander("📈 LLM & Cache Stats"):
+        stats = get_llm_stats()
+        if stats:
+            for name in sorted(stats):
+                st.write(f"`{name}`: {stats[name]}")
+            st.caption("Counts are process-wide since startup.")
+        else:
+            st.caption("No LLM calls recorded yet.")
+
+
+with st.sidebar:
+    render_sidebar()
+
 # Main content
 if st.session_state.phase == 'input':
     st.header("📝 Setup Your Interview")
@@ -179,7 +249,7 @@ if st.session_state.phase == 'input':
             if uploaded_file:
                 try:
                     with st.spinner("📄 Extracting text from PDF..."):
-                        resume = extract_resume_from_pdf(uploaded_file, validate=True)
+                        resume = _cached_extract(uploaded_file.getvalue())
                     
                     st.success(f"✅ Extracted {len(resume)} characters from PDF")
                     
@@ -233,13 +303,8 @@ if st.session_state.phase == 'input':
                 st.session_state.resume = resume
                 st.session_state.job_desc = job_desc
                 st.session_state.company = company
-                
-                try:
-                    initialize_interview()
-                    st.rerun()
-                except ValueError as e:
-                    st.error(f"❌ Interview initialization failed: {str(e)}")
-                    st.info("💡 This usually means the AI couldn't generate proper analysis. Check your resume and job description are detailed enough.")
+                initialize_interview()
+                st.rerun()
             else:
                 st.error("⚠️ Please fill in all fields before starting.")
 
@@ -248,18 +313,29 @@ elif st.session_state.phase == 'resume_review':
     
     # Run analysis if not done yet
     if st.session_state.resume_analysis is None:
+        # The verdict fields stream in seconds before the full report -
+        # surface them here as soon as the analyzer spots them
+        early_slot = st.empty()
+
+        def _show_early_verdict(fields: dict):
+            grade = fields.get('overall_grade', '...')
+            ats = fields.get('ats_score', '...')
+            early_slot.info(f"⚡ Early verdict - Grade: **{grade}** | ATS Score: **{ats}/100** (full report coming...)")
+
         with st.spinner("🔍 Analyzing your resume with brutal honesty..."):
             if resume_analyzer:
                 # Pass company name for company-specific fit analysis
-                analysis = resume_analyzer.analyze(
+                analysis = _cached_analyze(
                     st.session_state.resume,
                     st.session_state.job_desc,
-                    st.session_state.company  # NEW: Pass company for researcher agent
+                    st.session_state.company,  # NEW: Pass company for researcher agent
+                    _on_progress=_show_early_verdict
                 )
+                early_slot.empty()
                 st.session_state.resume_analysis = analysis
-                
+
                 # Generate and display report
-                report = resume_analyzer.generate_report(analysis)
+                report = _cached_report(analysis)
                 st.markdown(report)
             else:
                 st.error("❌ Resume analyzer not available")
@@ -267,7 +343,7 @@ elif st.session_state.phase == 'resume_review':
                 st.rerun()
     else:
         # Display cached analysis
-        report = resume_analyzer.generate_report(st.session_state.resume_analysis)
+        report = _cached_report(st.session_state.resume_analysis)
         st.markdown(report)
     
     st.markdown("---")
@@ -282,36 +358,74 @@ elif st.session_state.phase == 'resume_review':
     
     with col2:
         if st.button("✅ Proceed to Interview", type="primary", use_container_width=True):
-            try:
-                initialize_interview()
-                st.rerun()
-            except ValueError as e:
-                st.error(f"❌ Interview initialization failed: {str(e)}")
-                st.info("💡 This usually means the AI couldn't generate proper analysis. Check your resume and job description are detailed enough.")
+            initialize_interview()
+            st.rerun()
+
+elif st.session_state.phase == 'analyzing':
+    st.header("🤖 Preparing Your Interview")
+
+    future = st.session_state.pending_prep
+    if future is not None and future.done():
+        st.session_state.pending_prep = None
+        try:
+            result = future.result()
+        except ValueError as e:
+            st.error(f"❌ Interview initialization failed: {str(e)}")
+            st.info("💡 This usually means the AI couldn't generate proper analysis. Check your resume and job description are detailed enough.")
+            st.session_state.phase = 'input'
+        else:
+            # Save profile to database
+            if result.get('profile_analysis') and result.get('session_id'):
+                save_profile(result['session_id'], result['profile_analysis'])
+
+            st.session_state.state = result
+            st.session_state.phase = 'interviewing'
+            st.session_state.messages = [
+                {"role": "assistant", "content": result.get('current_question', 'Let\'s begin!')}
+            ]
+            st.session_state.initialized = True
+            st.rerun()
+    else:
+        st.info("🤖 Agents are analyzing your profile... you can keep this tab open.")
+        # Poll the future instead of blocking the script thread on it
+        time.sleep(0.5)
+        st.rerun()
 
 elif st.session_state.phase == 'interviewing':
     st.header("💬 Interview in Progress")
-    
-    # Display conversation
-    for msg in st.session_state.messages:
-        with st.chat_message(msg["role"]):
-            st.write(msg["content"])
-    
-    # User input
-    user_answer = st.chat_input("Type your answer here...")
-    
-    if user_answer:
-        # Add user message to chat
-        st.session_state.messages.append({"role": "user", "content": user_answer})
-        
-        with st.spinner("🤔 AI is evaluating your answer..."):
-            # Process answer and get next question
-            result = process_user_answer(st.session_state.state, user_answer)
-            st.session_state.state = result
-            
+
+    # The chat lives in its own fragment: submitting an answer re-runs
+    # only this block, so per-turn render work stays scoped to the
+    # transcript instead of repainting header + sidebar + buttons too
+    @st.fragment
+    def render_chat():
+        # Display conversation
+        for msg in st.session_state.messages:
+            with st.chat_message(msg["role"]):
+                st.write(msg["content"])
+
+        # User input
+        user_answer = st.chat_input("Type your answer here...")
+
+        if user_answer:
+            # Add user message to chat
+            st.session_state.messages.append({"role": "user", "content": user_answer})
+            with st.chat_message("user"):
+                st.write(user_answer)
+
+            # Stream the next question token-by-token instead of blocking
+            # on the full completion - perceived latency drops to TTFT
+            with st.chat_message("assistant"):
+                st.write_stream(stream_user_answer(st.session_state.state, user_answer))
+
+            result = st.session_state.state
+
             # Check if interview is complete
             if result.get('interview_stage') == 'complete':
                 st.session_state.phase = 'complete'
+                # Transcript is no longer rendered; free it
+                st.session_state.messages.clear()
+                st.rerun()
             else:
                 # Add next question
                 next_question = result.get('current_question', '')
@@ -320,9 +434,19 @@ elif st.session_state.phase == 'interviewing':
                         "role": "assistant",
                         "content": next_question
                     })
-        
-        st.rerun()
-    
+                # Bound the rendered transcript: collapse everything but the
+                # last 10 bubbles into one summary message built from the
+                # critic's running summary (no extra LLM call needed)
+                if len(st.session_state.messages) > 20:
+                    summary = result.get('running_summary', '')
+                    st.session_state.messages = [{
+                        "role": "assistant",
+                        "content": f"*Earlier questions (summarized):*\n\n{summary}"
+                    }] + st.session_state.messages[-10:]
+                st.rerun(scope="fragment")
+
+    render_chat()
+
     # Manual end button
     if st.button("🏁 End Interview & Get Report"):
         st.session_state.phase = 'complete'
@@ -331,24 +455,37 @@ elif st.session_state.phase == 'interviewing':
 elif st.session_state.phase == 'complete':
     st.header("📊 Interview Performance Report")
     
-    # Generate report if not already done
+    # Generate report on the worker pool and poll, so the script thread
+    # (and other sessions) aren't blocked for the multi-second LLM call
     if 'final_report' not in st.session_state.state:
-        with st.spinner("📝 Generating comprehensive report..."):
-            result = generate_final_report(st.session_state.state)
-            st.session_state.state = result
-    
-    # Display report
-    report = st.session_state.state.get('final_report', 'Report generation failed.')
-    st.markdown(report)
-    
-    # Download button
-    st.download_button(
-        label="📥 Download Report",
-        data=report,
-        file_name="interview_report.md",
-        mime="text/markdown"
-    )
-    
+        if st.session_state.pending_report is None:
+            st.session_state.pending_report = get_worker_pool().submit(
+                generate_final_report, st.session_state.state
+            )
+        if not st.session_state.pending_report.done():
+            st.info("📝 Generating comprehensive report...")
+            time.sleep(0.5)
+            st.rerun()
+        st.session_state.state = st.session_state.pending_report.result()
+        st.session_state.pending_report = None
+
+    # Fragment-scoped so clicking download reruns only this block instead
+    # of re-diffing the whole (often large) report markdown
+    @st.fragment
+    def render_report():
+        report = st.session_state.state.get('final_report', 'Report generation failed.')
+        st.markdown(report)
+
+        # Download button
+        st.download_button(
+            label="📥 Download Report",
+            data=report,
+            file_name="interview_report.md",
+            mime="text/markdown"
+        )
+
+    render_report()
+
     # Reset button
     if st.button("🔄 Start New Interview"):
         st.session_state.clear()
@@ -6,14 +6,16 @@ Uses FREE APIs: Gemini (multimodal vision) + Groq (fast interviewer)
 import streamlit as st
 from dotenv import load_dotenv
 import os
-import cv2
-import base64
-from PIL import Image
-import io
 import time
+import cv2
+import threading
+import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-from graph import run_preparation_phase, process_user_answer, generate_final_report
+from graph import run_preparation_phase, process_user_answer, stream_user_answer, generate_final_report
 from state import AgentState
+from agents import get_llm_stats
 
 # Load environment variables
 load_dotenv()
@@ -33,40 +35,100 @@ if 'initialized' not in st.session_state:
     st.session_state.messages = []
     st.session_state.video_enabled = False
     st.session_state.last_frame = None
+    st.session_state.pending_prep = None
+    st.session_state.pending_report = None
+    st.session_state.frame_buffer = None
+    st.session_state.sampler_running = False
+
+
+# One pool per process, shared across sessions: multi-second agent
+# pipelines run here instead of on the script thread, so the UI stays
+# responsive while preparation or report generation is in flight
+@st.cache_resource
+def get_worker_pool():
+    return ThreadPoolExecutor(max_workers=8)
+
+
+@st.cache_resource
+def get_camera():
+    """
+    One persistent VideoCapture per process. Opening the device costs
+    300ms-2s (driver negotiation, auto-exposure warmup) - paying that per
+    capture made every frame grab feel like seconds. Released at exit.
+    """
+    import atexit
+    cap = cv2.VideoCapture(0)
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+    # We grab at most one frame per answer - 15fps keeps USB bandwidth
+    # and exposure latency low without affecting capture quality
+    cap.set(cv2.CAP_PROP_FPS, 15)
+    atexit.register(cap.release)
+    return cap
 
 
 def capture_webcam_frame():
-    """Capture a single frame from webcam and return base64 encoded image"""
+    """Capture a single frame from webcam and return raw JPEG bytes"""
     try:
-        cap = cv2.VideoCapture(0)
+        cap = get_camera()
         ret, frame = cap.read()
-        cap.release()
-        
+
         if ret:
-            # Convert BGR to RGB
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            # Convert to PIL Image
-            img = Image.fromarray(frame_rgb)
-            # Resize for efficiency
-            img.thumbnail((640, 480))
-            # Convert to base64
-            buffer = io.BytesIO()
-            img.save(buffer, format='JPEG')
-            img_base64 = base64.b64encode(buffer.getvalue()).decode()
-            return img_base64
+            # Encode straight from the BGR buffer with cv2 - the old
+            # BGR->RGB->PIL->BytesIO chain copied the pixel array three
+            # extra times per capture for the same JPEG. Raw bytes, no
+            # base64: the Gemini SDK encodes at the network boundary
+            frame = cv2.resize(frame, (640, 480), interpolation=cv2.INTER_AREA)
+            ok, buf = cv2.imencode('.jpg', frame, [int(cv2.IMWRITE_JPEG_QUALITY), 75])
+            if ok:
+                return buf.tobytes()
         return None
     except Exception as e:
         st.sidebar.warning(f"📹 Camera access failed: {e}")
         return None
 
 
+def start_frame_sampler():
+    """
+    Samples the webcam every ~2s into a bounded buffer while the user
+    composes their answer. On submit the whole buffer goes to Gemini as
+    one multi-image call, so body language is judged across the answer
+    instead of from a single posed snapshot - with no extra round-trips.
+    """
+    if st.session_state.frame_buffer is None:
+        st.session_state.frame_buffer = deque(maxlen=5)
+    if st.session_state.sampler_running:
+        return
+    st.session_state.sampler_running = True
+
+    # Grab the camera on the script thread; the worker must not touch
+    # st.session_state or cache_resource itself
+    cap = get_camera()
+    buffer = st.session_state.frame_buffer
+
+    def _sample():
+        while True:
+            try:
+                ret, frame = cap.read()
+                if ret:
+                    frame = cv2.resize(frame, (640, 480), interpolation=cv2.INTER_AREA)
+                    ok, buf = cv2.imencode('.jpg', frame, [int(cv2.IMWRITE_JPEG_QUALITY), 75])
+                    if ok:
+                        buffer.append(buf.tobytes())
+            except Exception:
+                pass
+            time.sleep(2.0)
+
+    threading.Thread(target=_sample, daemon=True).start()
+
+
 def initialize_interview():
     """
-    Runs the preparation phase (Profiler → Researcher → Strategy → First Question)
+    Kicks off the preparation phase (Profiler → Researcher → Strategy →
+    First Question) on the worker pool; the 'analyzing' phase polls it.
     """
-    with st.spinner("🤖 Agents are analyzing your profile (using FREE Gemini + Groq APIs)..."):
-        # Create initial state
-        initial_state = {
+    # Create initial state
+    initial_state = {
             'resume_text': st.session_state.resume,
             'job_description': st.session_state.job_desc,
             'company_name': st.session_state.company,
@@ -81,6 +143,7 @@ def initialize_interview():
             'interviewer_persona': 'neutral',
             'current_question': '',
             'current_answer': '',
+            'running_summary': '',
             'current_answer_score': 0,
             'coaching_tip': '',
             'video_enabled': st.session_state.video_enabled,
@@ -89,15 +152,11 @@ def initialize_interview():
             'vision_feedback_log': []
         }
         
-        # Run preparation
-        result = run_preparation_phase(initial_state)
-        
-        st.session_state.state = result
-        st.session_state.phase = 'interviewing'
-        st.session_state.messages = [
-            {"role": "assistant", "content": result.get('current_question', 'Let\'s begin!')}
-        ]
-        st.session_state.initialized = True
+    # Run preparation off-thread; the 'analyzing' phase polls this future
+    st.session_state.pending_prep = get_worker_pool().submit(
+        run_preparation_phase, initial_state
+    )
+    st.session_state.phase = 'analyzing'
 
 
 # Header
@@ -105,10 +164,13 @@ st.title("🎯 AI Interview Prep Coach")
 st.markdown("**Multi-Agent Interview Simulator with FREE APIs (Gemini + Groq) & Live Video Analysis**")
 
 # Sidebar - Agent Reasoning Dashboard
-with st.sidebar:
+# Fragment-scoped: the dashboard re-renders on its own cadence instead of
+# repainting metrics/expanders on every keystroke in the chat input
+@st.fragment
+def render_sidebar():
     st.header("🧠 Live Agent Thoughts")
     st.markdown("*Powered by Google Gemini & Groq (100% FREE)*")
-    
+
     if st.session_state.phase == 'interviewing' or st.session_state.phase == 'complete':
         state = st.session_state.state
         
@@ -160,6 +222,21 @@ with st.sidebar:
         st.success("✅ Groq (Ultra-fast Llama 3.3)")
         st.info("No credit card required!")
 
+    # Observability: a refactor that silently stops hitting a cache
+    # shows up here as a climbing call count, before the API bill does
+    with st.expander("📈 LLM & Cache Stats"):
+        stats = get_llm_stats()
+        if stats:
+            for name in sorted(stats):
+                st.write(f"`{name}`: {stats[name]}")
+            st.caption("Counts are process-wide since startup.")
+        else:
+            st.caption("No LLM calls recorded yet.")
+
+
+with st.sidebar:
+    render_sidebar()
+
 # Main content
 if st.session_state.phase == 'input':
     st.header("📝 Setup Your Interview")
@@ -225,11 +302,32 @@ if st.session_state.phase == 'input':
         else:
             st.error("⚠️ Please fill in all fields before starting.")
 
+elif st.session_state.phase == 'analyzing':
+    st.header("🤖 Preparing Your Interview")
+
+    future = st.session_state.pending_prep
+    if future is not None and future.done():
+        st.session_state.pending_prep = None
+        result = future.result()
+        st.session_state.state = result
+        st.session_state.phase = 'interviewing'
+        st.session_state.messages = [
+            {"role": "assistant", "content": result.get('current_question', 'Let\'s begin!')}
+        ]
+        st.session_state.initialized = True
+        st.rerun()
+    else:
+        st.info("🤖 Agents are analyzing your profile (using FREE Gemini + Groq APIs)...")
+        # Poll the future instead of blocking the script thread on it
+        time.sleep(0.5)
+        st.rerun()
+
 elif st.session_state.phase == 'interviewing':
     st.header("💬 Interview in Progress")
     
     # Video preview (if enabled)
     if st.session_state.state.get('video_enabled'):
+        start_frame_sampler()
         col1, col2 = st.columns([3, 1])
         with col2:
             st.markdown("### 📹 Live Camera")
@@ -253,30 +351,55 @@ elif st.session_state.phase == 'interviewing':
     if user_answer:
         # Add user message to chat
         st.session_state.messages.append({"role": "user", "content": user_answer})
-        
-        # Capture video frame if enabled
+        with st.chat_message("user"):
+            st.write(user_answer)
+
+        # Hand the sampled frames from this answer to the vision agent
+        # (one multi-image Gemini call); fall back to a single capture
+        # if the sampler hasn't produced anything yet
         if st.session_state.state.get('video_enabled'):
-            frame = capture_webcam_frame()
-            if frame:
-                st.session_state.state['current_video_frame'] = frame
-        
-        with st.spinner("🤖 AI analyzing your answer (Gemini + Groq working together)..."):
-            # Process answer and get next question
-            result = process_user_answer(st.session_state.state, user_answer)
-            st.session_state.state = result
-            
-            # Check if interview is complete
-            if result.get('interview_stage') == 'complete':
-                st.session_state.phase = 'complete'
-            else:
-                # Add next question
-                next_question = result.get('current_question', '')
-                if next_question:
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": next_question
-                    })
-        
+            frames = list(st.session_state.frame_buffer or [])
+            if not frames:
+                frame = capture_webcam_frame()
+                if frame:
+                    frames = [frame]
+            if frames:
+                st.session_state.state['current_video_frames'] = frames
+                st.session_state.state['current_video_frame'] = frames[-1]
+            if st.session_state.frame_buffer:
+                st.session_state.frame_buffer.clear()
+
+        # Stream the next question token-by-token instead of spinning on
+        # the full eval + generation round trip - the critique runs in the
+        # background while the question forms on screen
+        with st.chat_message("assistant"):
+            st.write_stream(stream_user_answer(st.session_state.state, user_answer))
+
+        result = st.session_state.state
+
+        # Check if interview is complete
+        if result.get('interview_stage') == 'complete':
+            st.session_state.phase = 'complete'
+            # Transcript is no longer rendered; free it
+            st.session_state.messages.clear()
+        else:
+            # Add next question
+            next_question = result.get('current_question', '')
+            if next_question:
+                st.session_state.messages.append({
+                    "role": "assistant",
+                    "content": next_question
+                })
+            # Bound the rendered transcript: collapse everything but the
+            # last 10 bubbles into one summary message built from the
+            # critic's running summary (no extra LLM call needed)
+            if len(st.session_state.messages) > 20:
+                summary = result.get('running_summary', '')
+                st.session_state.messages = [{
+                    "role": "assistant",
+                    "content": f"*Earlier questions (summarized):*\n\n{summary}"
+                }] + st.session_state.messages[-10:]
+
         st.rerun()
     
     # Manual end button
@@ -290,46 +413,63 @@ elif st.session_state.phase == 'interviewing':
 elif st.session_state.phase == 'complete':
     st.header("📊 Interview Performance Report")
     
-    # Generate report if not already done
+    # Generate report on the worker pool and poll, so the script thread
+    # isn't blocked for the multi-second LLM call
     if 'final_report' not in st.session_state.state:
-        with st.spinner("📝 Generating comprehensive report (powered by Gemini Pro)..."):
-            result = generate_final_report(st.session_state.state)
-            st.session_state.state = result
-    
-    # Display report
-    report = st.session_state.state.get('final_report', 'Report generation failed.')
-    st.markdown(report)
-    
-    # Show video analysis summary if available
-    if st.session_state.state.get('vision_feedback_log'):
-        st.markdown("---")
-        st.markdown("## 🎥 Video Analysis Summary")
-        
-        vision_log = st.session_state.state['vision_feedback_log']
-        avg_confidence = sum(v.get('confidence', 0) for v in vision_log) / max(len(vision_log), 1)
-        avg_engagement = sum(v.get('engagement', 0) for v in vision_log) / max(len(vision_log), 1)
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Average Confidence", f"{avg_confidence:.1f}/10")
+        if st.session_state.pending_report is None:
+            st.session_state.pending_report = get_worker_pool().submit(
+                generate_final_report, st.session_state.state
+            )
+        if not st.session_state.pending_report.done():
+            st.info("📝 Generating comprehensive report (powered by Gemini Pro)...")
+            time.sleep(0.5)
+            st.rerun()
+        st.session_state.state = st.session_state.pending_report.result()
+        st.session_state.pending_report = None
+
+    # Fragment-scoped so clicking download reruns only this block instead
+    # of re-diffing the whole (often large) report markdown
+    @st.fragment
+    def render_report():
+        report = st.session_state.state.get('final_report', 'Report generation failed.')
+        st.markdown(report)
+
+        # Show video analysis summary if available
+        if st.session_state.state.get('vision_feedback_log'):
+            st.markdown("---")
+            st.markdown("## 🎥 Video Analysis Summary")
+
+            vision_log = st.session_state.state['vision_feedback_log']
+            # Single vectorized pass instead of two Python generator sweeps
+            scores = np.array(
+                [[v.get('confidence', 0), v.get('engagement', 0)] for v in vision_log],
+                dtype=np.float64
+            )
+            avg_confidence, avg_engagement = scores.mean(axis=0) if len(scores) else (0.0, 0.0)
+
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Average Confidence", f"{avg_confidence:.1f}/10")
+            with col2:
+                st.metric("Average Engagement", f"{avg_engagement:.1f}/10")
+
+            st.markdown("### Question-by-Question Body Language")
+            for i, v in enumerate(vision_log, 1):
+                st.write(f"**Q{i}:** {v.get('analysis', 'N/A')}")
+
+        # Download button
+        col1, col2, col3 = st.columns([1, 1, 1])
         with col2:
-            st.metric("Average Engagement", f"{avg_engagement:.1f}/10")
-        
-        st.markdown("### Question-by-Question Body Language")
-        for i, v in enumerate(vision_log, 1):
-            st.write(f"**Q{i}:** {v.get('analysis', 'N/A')}")
-    
-    # Download button
-    col1, col2, col3 = st.columns([1, 1, 1])
-    with col2:
-        st.download_button(
-            label="📥 Download Report",
-            data=report,
-            file_name="interview_report.md",
-            mime="text/markdown",
-            use_container_width=True
-        )
-    
+            st.download_button(
+                label="📥 Download Report",
+                data=report,
+                file_name="interview_report.md",
+                mime="text/markdown",
+                use_container_width=True
+            )
+
+    render_report()
+
     # Reset button
     st.markdown("---")
     if st.button("🔄 Start New Interview", use_container_width=True):
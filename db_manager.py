@@ -5,165 +5,372 @@ Persists all interview data, scores, and analysis for later review.
 
 import sqlite3
 import json
+import queue
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional
-import os
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 DB_PATH = 'interview_sessions.db'
 
+# One long-lived connection in WAL mode: every function used to open a
+# fresh connection and pay a full-journal fsync per commit (~1-10ms on
+# spinning disks), twice per answered question. WAL batches syncs and
+# lets readers run alongside the writer. Shared across threads (the
+# async QA saves run on worker threads), hence the lock.
+_conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+# One executescript for the per-connection PRAGMAs - a single parse and
+# round trip instead of one per statement. busy_timeout waits for a busy
+# writer instead of failing, and isolation_level='IMMEDIATE' makes the
+# 'with _conn:' blocks below open with BEGIN IMMEDIATE so the write lock
+# is taken up front - no mid-transaction SQLITE_BUSY upgrades while the
+# viewer's read-only connections hold WAL snapshots
+_conn.executescript('''
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA busy_timeout=5000;
+''')
+_conn.isolation_level = 'IMMEDIATE'
+_db_lock = threading.Lock()
+
+# Core schema as one script: executescript parses and applies it in a
+# single batch instead of a cursor round trip per statement. DDL that
+# needs per-statement error handling (the ALTERs and the FTS5 block)
+# stays in init_db below.
+SCHEMA_SQL = '''
+-- Sessions table - one row per interview
+CREATE TABLE IF NOT EXISTS sessions
+             (id INTEGER PRIMARY KEY AUTOINCREMENT,
+              candidate_name TEXT,
+              company TEXT,
+              role TEXT,
+              start_time TEXT,
+              end_time TEXT,
+              overall_score REAL,
+              final_verdict TEXT,
+              resume_length INTEGER,
+              total_questions INTEGER,
+              early_termination TEXT,
+              avg_score REAL,
+              min_score REAL,
+              max_score REAL,
+              stage_scores_json TEXT);
+
+-- Question-Answer logs - detailed transcript. Kept normalized: a
+-- compressed per-session blob on sessions was considered, but the
+-- (session_id, question_number) index already makes the detail read
+-- a single range scan, rows arrive incrementally from the
+-- write-behind queue (a blob would mean read-modify-write per turn),
+-- and a blob would be opaque to the viewer's SQL aggregates.
+CREATE TABLE IF NOT EXISTS qa_logs
+             (id INTEGER PRIMARY KEY AUTOINCREMENT,
+              session_id INTEGER,
+              question_number INTEGER,
+              stage TEXT,
+              question TEXT,
+              answer TEXT,
+              answer_length INTEGER,
+              critic_score REAL,
+              critic_strengths TEXT,
+              critic_weaknesses TEXT,
+              critic_tip TEXT,
+              sentiment TEXT,
+              timestamp TEXT,
+              FOREIGN KEY(session_id) REFERENCES sessions(id));
+
+-- Profile analysis - what the system learned about the candidate
+CREATE TABLE IF NOT EXISTS profile_analysis
+             (session_id INTEGER PRIMARY KEY,
+              matched_skills TEXT,
+              missing_skills TEXT,
+              strengths TEXT,
+              weaknesses TEXT,
+              experience_level TEXT,
+              red_flags TEXT,
+              FOREIGN KEY(session_id) REFERENCES sessions(id));
+
+-- Covers the transcript read in get_session_stats (WHERE session_id
+-- ORDER BY question_number) so it's an index walk, not a scan + sort
+CREATE INDEX IF NOT EXISTS idx_qa_session
+             ON qa_logs(session_id, question_number);
+
+-- Covers the viewer's list query: ORDER BY start_time DESC becomes
+-- an index walk, and every column the list view selects is in the
+-- index so the scan never touches the table heap
+CREATE INDEX IF NOT EXISTS idx_sessions_start_desc
+             ON sessions(start_time DESC, candidate_name, company, role,
+                         end_time, overall_score, total_questions,
+                         early_termination, final_verdict);
+'''
+
+
 def init_db():
     """Initialize the database with required tables."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = _conn
+    conn.executescript(SCHEMA_SQL)
     c = conn.cursor()
-    
-    # Sessions table - one row per interview
-    c.execute('''CREATE TABLE IF NOT EXISTS sessions
-                 (id INTEGER PRIMARY KEY AUTOINCREMENT,
-                  candidate_name TEXT,
-                  company TEXT,
-                  role TEXT,
-                  start_time TEXT,
-                  end_time TEXT,
-                  overall_score REAL,
-                  final_verdict TEXT,
-                  resume_length INTEGER,
-                  total_questions INTEGER,
-                  early_termination TEXT)''')
-    
-    # Question-Answer logs - detailed transcript
-    c.execute('''CREATE TABLE IF NOT EXISTS qa_logs
-                 (id INTEGER PRIMARY KEY AUTOINCREMENT,
-                  session_id INTEGER,
-                  question_number INTEGER,
-                  stage TEXT,
-                  question TEXT,
-                  answer TEXT,
-                  answer_length INTEGER,
-                  critic_score REAL,
-                  critic_strengths TEXT,
-                  critic_weaknesses TEXT,
-                  critic_tip TEXT,
-                  sentiment TEXT,
-                  timestamp TEXT,
-                  FOREIGN KEY(session_id) REFERENCES sessions(id))''')
-    
-    # Profile analysis - what the system learned about the candidate
-    c.execute('''CREATE TABLE IF NOT EXISTS profile_analysis
-                 (session_id INTEGER PRIMARY KEY,
-                  matched_skills TEXT,
-                  missing_skills TEXT,
-                  strengths TEXT,
-                  weaknesses TEXT,
-                  experience_level TEXT,
-                  red_flags TEXT,
-                  FOREIGN KEY(session_id) REFERENCES sessions(id))''')
-    
+
+    # Aggregates precomputed once at end_session so the viewer's Stats
+    # tab reads four columns instead of re-aggregating the transcript.
+    # ALTER covers databases created before these columns existed; the
+    # duplicate-column error means they're already there.
+    for col, typ in (('avg_score', 'REAL'), ('min_score', 'REAL'),
+                     ('max_score', 'REAL'), ('stage_scores_json', 'TEXT')):
+        try:
+            c.execute(f'ALTER TABLE sessions ADD COLUMN {col} {typ}')
+        except sqlite3.OperationalError:
+            pass
+
+    # Full-text index over the session header fields so the viewer's
+    # company search is an index probe instead of a LIKE '%...%' scan.
+    # External-content (content='sessions') stores only the tokenized
+    # index, not a second copy of the rows; the triggers keep it in
+    # sync with every write. Guarded: FTS5 is compiled into every
+    # bundled CPython sqlite3, but a stripped system build may lack it.
+    try:
+        fts_exists = c.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sessions_fts'").fetchone()
+        c.execute('''CREATE VIRTUAL TABLE IF NOT EXISTS sessions_fts
+                     USING fts5(company, role, candidate_name, final_verdict,
+                                content='sessions', content_rowid='id')''')
+        c.execute('''CREATE TRIGGER IF NOT EXISTS sessions_fts_ai
+                     AFTER INSERT ON sessions BEGIN
+                       INSERT INTO sessions_fts(rowid, company, role,
+                                                candidate_name, final_verdict)
+                       VALUES (new.id, new.company, new.role,
+                               new.candidate_name, new.final_verdict);
+                     END''')
+        c.execute('''CREATE TRIGGER IF NOT EXISTS sessions_fts_ad
+                     AFTER DELETE ON sessions BEGIN
+                       INSERT INTO sessions_fts(sessions_fts, rowid, company,
+                                                role, candidate_name, final_verdict)
+                       VALUES ('delete', old.id, old.company, old.role,
+                               old.candidate_name, old.final_verdict);
+                     END''')
+        c.execute('''CREATE TRIGGER IF NOT EXISTS sessions_fts_au
+                     AFTER UPDATE ON sessions BEGIN
+                       INSERT INTO sessions_fts(sessions_fts, rowid, company,
+                                                role, candidate_name, final_verdict)
+                       VALUES ('delete', old.id, old.company, old.role,
+                               old.candidate_name, old.final_verdict);
+                       INSERT INTO sessions_fts(rowid, company, role,
+                                                candidate_name, final_verdict)
+                       VALUES (new.id, new.company, new.role,
+                               new.candidate_name, new.final_verdict);
+                     END''')
+        if not fts_exists:
+            # First run against a pre-FTS database: index the rows that
+            # predate the triggers
+            c.execute("INSERT INTO sessions_fts(sessions_fts) VALUES('rebuild')")
+    except sqlite3.OperationalError as e:
+        print(f"   ⚠️ FTS5 unavailable - company search will use LIKE: {e}")
+
     conn.commit()
-    conn.close()
     print("✅ Database initialized")
 
+_db_initialized = False
+
+def ensure_db():
+    """Create the tables once per process, the first time they're needed.
+
+    Runs lazily instead of at import so that merely importing this module
+    (e.g. from a script that never touches the DB) costs nothing beyond
+    opening the connection. Double-checked under the lock so concurrent
+    worker threads don't both run the DDL.
+    """
+    global _db_initialized
+    if _db_initialized:
+        return
+    with _db_lock:
+        if not _db_initialized:
+            init_db()
+            _db_initialized = True
+
 def create_session(candidate_name: str, company: str, role: str, resume_length: int) -> int:
     """Create a new interview session and return its ID."""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    
     start_time = datetime.now().isoformat()
-    
-    c.execute('''INSERT INTO sessions 
-                 (candidate_name, company, role, start_time, resume_length, total_questions)
-                 VALUES (?, ?, ?, ?, ?, 0)''',
-              (candidate_name, company, role, start_time, resume_length))
-    
-    session_id = c.lastrowid
-    conn.commit()
-    conn.close()
-    
+
+    with _db_lock, _conn:
+        cur = _conn.execute('''INSERT INTO sessions
+                     (candidate_name, company, role, start_time, resume_length, total_questions)
+                     VALUES (?, ?, ?, ?, ?, 0)''',
+                  (candidate_name, company, role, start_time, resume_length))
+        session_id = cur.lastrowid
+
     print(f"📝 Created session ID: {session_id} for {candidate_name}")
     return session_id
 
-def save_qa_step(session_id: int, question_number: int, stage: str, 
+def save_qa_step(session_id: int, question_number: int, stage: str,
                  question: str, answer: str, feedback: Dict):
     """Save a single question-answer interaction."""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    
-    c.execute('''INSERT INTO qa_logs 
-                 (session_id, question_number, stage, question, answer, answer_length,
-                  critic_score, critic_strengths, critic_weaknesses, critic_tip, sentiment, timestamp)
-                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-              (session_id, question_number, stage, question, answer, len(answer),
-               feedback.get('score', 0),
-               feedback.get('strengths', ''),
-               feedback.get('weaknesses', ''),
-               feedback.get('tip', ''),
-               feedback.get('sentiment', ''),
-               datetime.now().isoformat()))
-    
-    # Update total questions in session
-    c.execute('UPDATE sessions SET total_questions = ? WHERE id = ?',
-              (question_number, session_id))
-    
-    conn.commit()
-    conn.close()
+    # One transaction per turn: the append-only INSERT and the counter
+    # bump land together or not at all, so a crash mid-turn can't leave
+    # the session counter out of sync with the transcript
+    with _db_lock, _conn:
+        conn = _conn
+        conn.execute('''INSERT INTO qa_logs
+                     (session_id, question_number, stage, question, answer, answer_length,
+                      critic_score, critic_strengths, critic_weaknesses, critic_tip, sentiment, timestamp)
+                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+                  (session_id, question_number, stage, question, answer, len(answer),
+                   feedback.get('score', 0),
+                   feedback.get('strengths', ''),
+                   feedback.get('weaknesses', ''),
+                   feedback.get('tip', ''),
+                   feedback.get('sentiment', ''),
+                   datetime.now().isoformat()))
+
+        # MAX() instead of a blind overwrite so out-of-order or concurrent
+        # writers can never move the counter backwards
+        conn.execute('UPDATE sessions SET total_questions = MAX(total_questions, ?) WHERE id = ?',
+                  (question_number, session_id))
+
+
+def save_qa_steps_bulk(rows: List[Dict]):
+    """Insert a batch of Q&A rows in one transaction (one fsync total)."""
+    params = []
+    counters: Dict[int, int] = {}
+    for row in rows:
+        feedback = row.get('feedback', {})
+        params.append((row['session_id'], row['question_number'], row['stage'],
+                       row['question'], row['answer'], len(row['answer']),
+                       feedback.get('score', 0),
+                       feedback.get('strengths', ''),
+                       feedback.get('weaknesses', ''),
+                       feedback.get('tip', ''),
+                       feedback.get('sentiment', ''),
+                       datetime.now().isoformat()))
+        counters[row['session_id']] = max(counters.get(row['session_id'], 0),
+                                          row['question_number'])
+
+    with _db_lock, _conn:
+        _conn.executemany('''INSERT INTO qa_logs
+                     (session_id, question_number, stage, question, answer, answer_length,
+                      critic_score, critic_strengths, critic_weaknesses, critic_tip, sentiment, timestamp)
+                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''', params)
+        for session_id, question_number in counters.items():
+            _conn.execute('UPDATE sessions SET total_questions = MAX(total_questions, ?) WHERE id = ?',
+                          (question_number, session_id))
+
+
+# Write-behind queue: async saves land here and a single daemon flusher
+# batches whatever has accumulated (up to _QA_FLUSH_BATCH, waiting at
+# most _QA_FLUSH_TIMEOUT for stragglers) into one save_qa_steps_bulk
+# call, so a burst of turns costs one transaction instead of one each.
+_qa_queue: "queue.Queue" = queue.Queue()
+_QA_FLUSH_BATCH = 16
+_QA_FLUSH_TIMEOUT = 0.5
+
+
+def _qa_flusher():
+    while True:
+        rows = [_qa_queue.get()]
+        while len(rows) < _QA_FLUSH_BATCH:
+            try:
+                rows.append(_qa_queue.get(timeout=_QA_FLUSH_TIMEOUT))
+            except queue.Empty:
+                break
+        try:
+            save_qa_steps_bulk(rows)
+        except Exception as e:
+            print(f"   ⚠️ Bulk Q&A save failed: {e}")
+        for _ in rows:
+            _qa_queue.task_done()
+
+
+_qa_flusher_thread = threading.Thread(target=_qa_flusher, daemon=True)
+_qa_flusher_thread.start()
+
+
+def save_qa_step_async(session_id: int, question_number: int, stage: str,
+                       question: str, answer: str, feedback: Dict):
+    """Fire-and-forget Q&A save via the write-behind queue.
+
+    The chat flow shouldn't wait on disk I/O; the write is append-only,
+    so ordering with the next turn doesn't matter. end_session drains
+    the queue before finalizing totals.
+    """
+    _qa_queue.put({
+        'session_id': session_id,
+        'question_number': question_number,
+        'stage': stage,
+        'question': question,
+        'answer': answer,
+        'feedback': feedback,
+    })
+
+def _dumps(obj) -> str:
+    """Serialize a value for a TEXT column; orjson when installed (2-5x faster)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
 
 def save_profile(session_id: int, profile: Dict):
     """Save the candidate profile analysis."""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    
-    c.execute('''INSERT OR REPLACE INTO profile_analysis 
+    with _db_lock, _conn:
+        _conn.execute('''INSERT OR REPLACE INTO profile_analysis
                  (session_id, matched_skills, missing_skills, strengths, weaknesses, 
                   experience_level, red_flags)
                  VALUES (?, ?, ?, ?, ?, ?, ?)''',
               (session_id,
-               json.dumps(profile.get('matched_skills', [])),
-               json.dumps(profile.get('missing_skills', [])),
-               json.dumps(profile.get('strengths', [])),
-               json.dumps(profile.get('weaknesses', [])),
+               _dumps(profile.get('matched_skills', [])),
+               _dumps(profile.get('missing_skills', [])),
+               _dumps(profile.get('strengths', [])),
+               _dumps(profile.get('weaknesses', [])),
                profile.get('experience_level', ''),
-               json.dumps(profile.get('red_flags', []))))
-    
-    conn.commit()
-    conn.close()
+               _dumps(profile.get('red_flags', []))))
 
-def end_session(session_id: int, overall_score: float, verdict: str, 
+def end_session(session_id: int, overall_score: float, verdict: str,
                 early_termination: Optional[str] = None):
     """Mark session as complete with final scores."""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    
+    # Drain pending async Q&A saves so the final totals include them
+    _qa_queue.join()
+
     end_time = datetime.now().isoformat()
-    
-    c.execute('''UPDATE sessions 
-                 SET end_time = ?, overall_score = ?, final_verdict = ?, early_termination = ?
-                 WHERE id = ?''',
-              (end_time, overall_score, verdict, early_termination, session_id))
-    
-    conn.commit()
-    conn.close()
-    
+
+    # Aggregate the transcript once, now that it's complete, and store
+    # the results alongside the verdict in the same transaction - every
+    # later view of this session reads the columns instead of re-scanning
+    # qa_logs. Stage order follows question order, not alphabetical.
+    with _db_lock, _conn:
+        avg, mn, mx = _conn.execute(
+            '''SELECT AVG(critic_score), MIN(critic_score), MAX(critic_score)
+               FROM qa_logs WHERE session_id = ?''', (session_id,)).fetchone()
+        stage_rows = _conn.execute(
+            '''SELECT stage, AVG(critic_score), COUNT(*)
+               FROM qa_logs WHERE session_id = ?
+               GROUP BY stage ORDER BY MIN(question_number)''',
+            (session_id,)).fetchall()
+        _conn.execute('''UPDATE sessions
+                     SET end_time = ?, overall_score = ?, final_verdict = ?,
+                         early_termination = ?, avg_score = ?, min_score = ?,
+                         max_score = ?, stage_scores_json = ?
+                     WHERE id = ?''',
+                  (end_time, overall_score, verdict, early_termination,
+                   avg, mn, mx, _dumps([list(r) for r in stage_rows]),
+                   session_id))
+
     print(f"✅ Session {session_id} ended - Score: {overall_score}/10")
 
 def get_session_stats(session_id: int) -> Dict:
     """Get statistics for a session."""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    
-    # Get session info
-    c.execute('SELECT * FROM sessions WHERE id = ?', (session_id,))
-    session = c.fetchone()
-    
-    # Get all QA logs
-    c.execute('SELECT * FROM qa_logs WHERE session_id = ? ORDER BY question_number', 
-              (session_id,))
-    qa_logs = c.fetchall()
-    
-    # Get profile
-    c.execute('SELECT * FROM profile_analysis WHERE session_id = ?', (session_id,))
-    profile = c.fetchone()
-    
-    conn.close()
-    
+    with _db_lock:
+        # Get session info
+        session = _conn.execute('SELECT * FROM sessions WHERE id = ?', (session_id,)).fetchone()
+
+        # Get all QA logs
+        qa_logs = _conn.execute('SELECT * FROM qa_logs WHERE session_id = ? ORDER BY question_number',
+                  (session_id,)).fetchall()
+
+        # Get profile
+        profile = _conn.execute('SELECT * FROM profile_analysis WHERE session_id = ?', (session_id,)).fetchone()
+
     return {
         'session': session,
         'qa_logs': qa_logs,
@@ -172,17 +379,12 @@ def get_session_stats(session_id: int) -> Dict:
 
 def get_recent_sessions(limit: int = 10) -> List[Dict]:
     """Get most recent interview sessions."""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    
-    c.execute('''SELECT id, candidate_name, company, role, start_time, overall_score, total_questions
-                 FROM sessions 
-                 ORDER BY start_time DESC 
-                 LIMIT ?''', (limit,))
-    
-    sessions = c.fetchall()
-    conn.close()
-    
+    with _db_lock:
+        sessions = _conn.execute('''SELECT id, candidate_name, company, role, start_time, overall_score, total_questions
+                     FROM sessions
+                     ORDER BY start_time DESC
+                     LIMIT ?''', (limit,)).fetchall()
+
     return [
         {
             'id': s[0],
@@ -195,7 +397,3 @@ def get_recent_sessions(limit: int = 10) -> List[Dict]:
         }
         for s in sessions
     ]
-
-# Initialize DB on import
-if not os.path.exists(DB_PATH):
-    init_db()
@@ -4,21 +4,44 @@ This is the "brain" - coordinates all agents in a state machine.
 Implements conditional edges for dynamic interview flow.
 """
 
+import asyncio
+import bisect
+import logging
+import logging.handlers
+import os
+import queue
+import string
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Literal
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph, END, START
 from langchain_core.messages import HumanMessage
 
 from state import AgentState
 from agents import (
     ProfilerAgent,
-    ResearcherAgent, 
+    ResearcherAgent,
     StrategyAgent,
     InterviewerAgent,
     CriticAgent,
     ReportAgent,
-    VisionCoachAgent
+    VisionCoachAgent,
+    create_session_context_cache,
+    aclassify_answer_tier,
+    score_tier
 )
-from db_manager import save_qa_step, save_profile, end_session
+from db_manager import save_qa_step_async, save_profile, end_session
+
+# Per-turn traces used print(), which formats and flushes stdout
+# synchronously on the critical path. The QueueHandler below just
+# enqueues the record; a background QueueListener does the formatting
+# and write. Level gated via GRAPH_LOG, same convention as agents.py.
+log = logging.getLogger("graph")
+log.setLevel(os.getenv("GRAPH_LOG", "INFO"))
+if not log.handlers:
+    _log_queue = queue.Queue(-1)
+    log.addHandler(logging.handlers.QueueHandler(_log_queue))
+    _log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+    _log_listener.start()
 
 
 # Initialize all agents
@@ -31,15 +54,83 @@ reporter = ReportAgent()
 vision_coach = VisionCoachAgent()
 
 
+# Rolling window on the verbatim transcript. The Interviewer reads only
+# the last exchange plus state['running_summary'], and the Report is
+# built from feedback_log, so messages beyond the window only grow
+# per-session RAM on long interviews.
+HISTORY_WINDOW = 20
+
+
+# A candidate sitting still produces near-identical frames; each skipped
+# vision call saves a multi-second multimodal round-trip. Frames whose
+# 64-bit average-hash is within this Hamming distance of the last
+# analyzed frame reuse the previous analysis.
+VISION_PHASH_THRESHOLD = 6
+
+
+def _frame_phash(frame) -> int:
+    """64-bit average-hash of a JPEG frame (8x8 grayscale vs mean)."""
+    import base64
+    import io
+    from PIL import Image
+
+    if isinstance(frame, str):  # legacy base64 frames
+        frame = base64.b64decode(frame)
+    img = Image.open(io.BytesIO(frame)).convert('L').resize((8, 8))
+    pixels = list(img.getdata())
+    avg = sum(pixels) / 64
+    bits = 0
+    for px in pixels:
+        bits = (bits << 1) | (px > avg)
+    return bits
+
+
+def _should_analyze_frame(state: Dict) -> bool:
+    """Gate the Vision Coach on actual frame change (see VISION_PHASH_THRESHOLD)."""
+    try:
+        phash = _frame_phash(state['current_video_frame'])
+    except Exception:
+        return True
+    last = state.get('_last_vision_phash')
+    if last is not None and bin(phash ^ last).count('1') <= VISION_PHASH_THRESHOLD:
+        return False
+    state['_last_vision_phash'] = phash
+    return True
+
+
+def _append_history(state: Dict, message) -> None:
+    """Append to the transcript in place and trim to HISTORY_WINDOW.
+
+    The old `history + [msg]` pattern rebuilt the whole list every turn -
+    O(N) copies per answer. In-place append plus a del of the overflow
+    touches only what changed. (A deque would cap for free, but agents
+    slice the history, which deques don't support.)
+    """
+    history = state.setdefault('conversation_history', [])
+    history.append(message)
+    if len(history) > HISTORY_WINDOW:
+        del history[:-HISTORY_WINDOW]
+
+
 # Node functions (wrap agent execution)
+# profile_node and research_node run as parallel branches in the graph,
+# so each returns only the keys it owns - returning the whole state from
+# both would make LangGraph see conflicting concurrent updates.
 def profile_node(state: Dict) -> Dict:
     """Analyze resume and job description"""
-    return profiler.run(state)
+    result = profiler.run(dict(state))
+    return {
+        'profile_analysis': result.get('profile_analysis', {}),
+        'resume_text_compact': result.get('resume_text_compact', ''),
+        'job_description_compact': result.get('job_description_compact', ''),
+        'agent_reasoning': result.get('agent_reasoning', ''),
+    }
 
 
 def research_node(state: Dict) -> Dict:
     """Fetch company intel from web"""
-    return researcher.run(state)
+    result = researcher.run(dict(state))
+    return {'company_intel': result.get('company_intel', '')}
 
 
 def strategy_node(state: Dict) -> Dict:
@@ -60,7 +151,7 @@ def critique_node(state: Dict) -> Dict:
     if 'session_id' in state and state.get('current_question') and state.get('current_answer'):
         try:
             feedback = state.get('feedback_log', [])[-1] if state.get('feedback_log') else {}
-            save_qa_step(
+            save_qa_step_async(
                 session_id=state['session_id'],
                 question_number=state.get('question_count', 0),
                 stage=state.get('interview_stage', 'unknown'),
@@ -68,9 +159,9 @@ def critique_node(state: Dict) -> Dict:
                 answer=state.get('current_answer', ''),
                 feedback=feedback
             )
-            print(f"   💾 Saved Q&A to database (session {state['session_id']})")
+            log.info(f"   💾 Queued Q&A save to database (session {state['session_id']})")
         except Exception as e:
-            print(f"   ⚠️ Database save failed: {e}")
+            log.info(f"   ⚠️ Database save failed: {e}")
     
     return result
 
@@ -80,26 +171,20 @@ def report_node(state: Dict) -> Dict:
     return reporter.run(state)
 
 
-def pushback_node(state: Dict) -> Dict:
-    """
-    PUSHBACK MODE: Don't ask a new question.
-    Instead, aggressively rephrase the SAME question demanding more depth.
-    This is triggered when the candidate gives a weak/vague answer (score <= 2).
-    """
-    print(f"\n   ⚡ PUSHBACK NODE: Demanding better answer to previous question")
-    
-    last_question = state.get('current_question', '')
-    last_answer = state.get('current_answer', '')
-    last_feedback = state.get('feedback_log', [])[-1] if state.get('feedback_log') else {}
-    
-    # Create an aggressive follow-up prompt
-    pushback_prompt = f"""You asked: "{last_question}"
-
-The candidate responded: "{last_answer}"
+# Pool for agent calls nested inside graph nodes. A node may run inside
+# LangGraph's event loop (graph.ainvoke/astream); an agent that reaches
+# for asyncio.run from there would hit "cannot be called from a running
+# event loop". A pool thread has no running loop, so the nested call is
+# safe from either context.
+_AGENT_POOL = ThreadPoolExecutor(max_workers=4)
 
-This answer scored {last_feedback.get('score', 0)}/10 because: {last_feedback.get('weaknesses', 'it lacked depth and specifics')}.
 
-You are a tough senior engineer. You CANNOT accept this weak answer. Respond like a real interviewer would:
+# Static pushback persona + examples, hoisted out of pushback_node so
+# every pushback call starts with a byte-identical prefix. Provider
+# prompt caches match on the longest common prefix, so keeping the
+# dynamic (question, answer, score) fields at the tail lets this
+# few-hundred-token rubric bill at the cached rate instead of full price.
+PUSHBACK_SYSTEM = """You are a tough senior engineer conducting a real interview. The candidate just gave a weak answer and you CANNOT accept it. Respond like a real interviewer would:
 
 EXAMPLE PUSHBACKS:
 - "I'm going to stop you there. That answer is too vague for a [LEVEL] role. Let me be specific: [REPHRASE with technical details required]"
@@ -110,6 +195,38 @@ EXAMPLE PUSHBACKS:
 BE STERN. Make them realize this is a real interview, not a casual chat.
 
 Return ONLY your pushback statement/question."""
+
+# Parsed once at import; pushback_node substitutes only the four dynamic
+# fields instead of re-running f-string formatting over the whole ~1KB
+# prompt each turn
+PUSHBACK_TEMPLATE = string.Template(PUSHBACK_SYSTEM + """
+
+You asked: "${last_question}"
+
+The candidate responded: "${last_answer}"
+
+This answer scored ${score}/10 because: ${weaknesses}.""")
+
+
+def pushback_node(state: Dict) -> Dict:
+    """
+    PUSHBACK MODE: Don't ask a new question.
+    Instead, aggressively rephrase the SAME question demanding more depth.
+    This is triggered when the candidate gives a weak/vague answer (score <= 2).
+    """
+    log.info(f"\n   ⚡ PUSHBACK NODE: Demanding better answer to previous question")
+
+    last_question = state.get('current_question', '')
+    last_answer = state.get('current_answer', '')
+    last_feedback = state.get('feedback_log', [])[-1] if state.get('feedback_log') else {}
+
+    # Static rubric first, dynamic fields at the tail (see PUSHBACK_TEMPLATE)
+    pushback_prompt = PUSHBACK_TEMPLATE.substitute(
+        last_question=last_question,
+        last_answer=last_answer,
+        score=last_feedback.get('score', 0),
+        weaknesses=last_feedback.get('weaknesses', 'it lacked depth and specifics'),
+    )
     
     # Use interviewer agent to generate pushback
     pushback_state = state.copy()
@@ -117,8 +234,8 @@ Return ONLY your pushback statement/question."""
         HumanMessage(content=pushback_prompt)
     ]
     
-    # Generate the pushback question
-    result = interviewer.run(pushback_state)
+    # Generate the pushback question on a pool thread (see _AGENT_POOL)
+    result = _AGENT_POOL.submit(interviewer.run, pushback_state).result()
     
     # Don't increment question counter (same question, different phrasing)
     result['question_count'] = state.get('question_count', 0)
@@ -149,13 +266,13 @@ def should_continue_interview(state: Dict) -> Literal["pushback", "interview", "
         
         # Scores 1-2: Demand better answer (but max 2 attempts per question)
         if last_score <= 2 and pushback_count < 2:
-            print(f"\n   🚨 PUSHBACK: Answer scored {last_score}/10 - demanding elaboration (attempt {pushback_count + 1}/2)")
+            log.info(f"\n   🚨 PUSHBACK: Answer scored {last_score}/10 - demanding elaboration (attempt {pushback_count + 1}/2)")
             state['pushback_count'] = pushback_count + 1
             return "pushback"
         
         # If they failed after 2 pushbacks, move on but note the failure
         if pushback_count >= 2:
-            print(f"\n   ❌ TOPIC FAILED: Moving to next question after {pushback_count} failed attempts")
+            log.info(f"\n   ❌ TOPIC FAILED: Moving to next question after {pushback_count} failed attempts")
             state['pushback_count'] = 0
             state['failed_topics'] = state.get('failed_topics', []) + [state.get('current_question', '')[:50]]
     
@@ -167,43 +284,57 @@ def should_continue_interview(state: Dict) -> Literal["pushback", "interview", "
         if avg_recent < 3.5:
             state['interview_stage'] = 'complete'
             state['early_termination_reason'] = f'Performance below bar (avg {avg_recent:.1f}/10)'
-            print(f"\n   🛑 EARLY TERMINATION: Consistently weak performance")
+            log.info(f"\n   🛑 EARLY TERMINATION: Consistently weak performance")
             return "report"
     
     return "interview"
 
 
+# Question-count -> stage lookup: stage for count c is the first bound
+# >= c (bisect), replacing the if/elif cascade
+_STAGE_BOUNDS = (2, 5, 7, 8)
+_STAGE_NAMES = ('intro', 'technical', 'behavioral', 'closing', 'complete')
+
+
+def _update_score_stats(state: Dict) -> None:
+    """
+    Maintain running aggregates (score_sum/score_count) over feedback_log
+    so the per-turn decision functions read O(1) state instead of
+    rescanning the whole log. Catches up on any entries appended since
+    the last call, so it doesn't matter which path ran the Critic.
+    """
+    feedback_log = state.get('feedback_log', [])
+    seen = state.get('score_count', 0)
+    if seen >= len(feedback_log):
+        return
+    state['score_sum'] = state.get('score_sum', 0) + sum(
+        f.get('score', 0) for f in feedback_log[seen:]
+    )
+    state['score_count'] = len(feedback_log)
+
+
 def advance_stage(state: Dict) -> Dict:
     """
     Progress interview through stages based on question count AND performance.
     Fails candidates early if they're clearly not qualified.
     """
     count = state.get('question_count', 0)
-    feedback_log = state.get('feedback_log', [])
-    
+    _update_score_stats(state)
+
     # Calculate average score if we have feedback
-    if len(feedback_log) >= 2:
-        avg_score = sum(f.get('score', 0) for f in feedback_log) / len(feedback_log)
-        
+    if state.get('score_count', 0) >= 2:
+        avg_score = state['score_sum'] / state['score_count']
+
         # STRICT: End interview early if candidate is clearly failing
         if avg_score < 4 and count >= 3:
             state['interview_stage'] = 'complete'
             state['early_termination_reason'] = f'Performance too low (avg {avg_score:.1f}/10 after {count} questions)'
-            print(f"\n   ⚠️ EARLY TERMINATION: Candidate avg score {avg_score:.1f}/10 - Not meeting bar")
+            log.info(f"\n   ⚠️ EARLY TERMINATION: Candidate avg score {avg_score:.1f}/10 - Not meeting bar")
             return state
-    
+
     # Normal progression
-    if count <= 2:
-        state['interview_stage'] = 'intro'
-    elif count <= 5:
-        state['interview_stage'] = 'technical'
-    elif count <= 7:
-        state['interview_stage'] = 'behavioral'
-    elif count == 8:
-        state['interview_stage'] = 'closing'
-    else:
-        state['interview_stage'] = 'complete'
-    
+    state['interview_stage'] = _STAGE_NAMES[bisect.bisect_left(_STAGE_BOUNDS, count)]
+
     return state
 
 
@@ -212,6 +343,19 @@ def stage_transition_node(state: Dict) -> Dict:
     return advance_stage(state)
 
 
+# The per-turn loop as a flat transition table. The Streamlit apps drive
+# the interactive loop through process_user_answer / stream_user_answer -
+# plain function calls mutating the state dict in place - so the hot path
+# already pays no LangGraph edge dispatch or reducer copies per turn.
+# create_interview_graph builds its loop edges from this same table, and
+# should_continue_interview is the conditional half of the machine.
+INTERVIEW_LOOP = {
+    "interview": "critique",
+    "critique": "stage_check",
+    "pushback": "critique",
+}
+
+
 # Build the graph
 def create_interview_graph():
     """
@@ -236,19 +380,20 @@ def create_interview_graph():
     workflow.add_node("stage_check", stage_transition_node)
     workflow.add_node("report", report_node)
     
-    # Define edges (workflow sequence)
-    workflow.set_entry_point("profile")
-    
-    # Preparation phase
-    workflow.add_edge("profile", "research")
+    # Preparation phase: profile and research are independent I/O, so
+    # fan them out from START and fan back in at strategy - the slower
+    # branch sets prep latency instead of the sum of both
+    workflow.add_edge(START, "profile")
+    workflow.add_edge(START, "research")
+    workflow.add_edge("profile", "strategy")
     workflow.add_edge("research", "strategy")
     workflow.add_edge("strategy", "interview")
     
     # Interview loop (this is the magic)
     # After asking question, we wait for user input (handled by Streamlit)
     # Then critique is called, which feeds back to interview
-    workflow.add_edge("interview", "critique")
-    workflow.add_edge("critique", "stage_check")
+    for source, target in INTERVIEW_LOOP.items():
+        workflow.add_edge(source, target)
     
     # Conditional: Continue, pushback, or finish?
     workflow.add_conditional_edges(
@@ -261,9 +406,6 @@ def create_interview_graph():
         }
     )
     
-    # Pushback also goes to critique (to re-evaluate the new answer)
-    workflow.add_edge("pushback", "critique")
-    
     workflow.add_edge("report", END)
     
     return workflow.compile()
@@ -275,86 +417,244 @@ def run_preparation_phase(state: Dict) -> Dict:
     Runs the initial analysis before starting interview.
     This executes: Profile -> Research -> Strategy -> First Question
     """
-    print("\n" + "="*60)
-    print("🚀 STARTING PREPARATION PHASE")
-    print("="*60)
-    
-    # Run agents sequentially (no graph to avoid loops)
-    print("\n📊 Step 1: Running Profiler Agent...")
-    state = profiler.run(state)
-    print(f"   ✅ {state.get('agent_reasoning', 'Done')}")
-    
-    print("\n🔍 Step 2: Running Researcher Agent...")
-    state = researcher.run(state)
-    print(f"   ✅ {state.get('agent_reasoning', 'Done')}")
-    
-    print("\n🎯 Step 3: Running Strategy Agent...")
+    import time
+
+    log.info("\n" + "="*60)
+    log.info("🚀 STARTING PREPARATION PHASE")
+    log.info("="*60)
+
+    # Profiler (resume/JD) and Researcher (company name) are independent -
+    # run their LLM calls concurrently instead of back-to-back
+    log.info("\n📊 Step 1+2: Running Profiler + Researcher Agents in parallel...")
+    t_prep = time.perf_counter()
+    try:
+        # asyncio.run wants a coroutine, not the Future gather returns
+        # outside a loop - wrap the gather like _speculative_turn does
+        async def _prep():
+            return await asyncio.gather(profiler.arun(dict(state)),
+                                        researcher.arun(dict(state)))
+
+        profile_result, research_result = asyncio.run(_prep())
+        # Merge the two deltas back into the shared state - including
+        # the compact resume/JD copies the Profiler wrote, which the
+        # context cache and downstream prompts read
+        state['profile_analysis'] = profile_result.get('profile_analysis', {})
+        state['resume_text_compact'] = profile_result.get('resume_text_compact', '')
+        state['job_description_compact'] = profile_result.get('job_description_compact', '')
+        state['company_intel'] = research_result.get('company_intel', '')
+        state['agent_reasoning'] = profile_result.get('agent_reasoning', '')
+        log.info(f"   ✅ {profile_result.get('agent_reasoning', 'Done')}")
+        log.info(f"   ✅ {research_result.get('agent_reasoning', 'Done')}")
+    except Exception as e:
+        # Thread-pool fallback stays concurrent even when asyncio can't
+        # run here (e.g. an already-running event loop)
+        log.info(f"   ⚠️ Async prep failed ({e}), falling back to thread pool")
+        profile_future = _AGENT_POOL.submit(profiler.run, dict(state))
+        research_future = _AGENT_POOL.submit(researcher.run, dict(state))
+        profile_result = profile_future.result()
+        research_result = research_future.result()
+        state['profile_analysis'] = profile_result.get('profile_analysis', {})
+        state['resume_text_compact'] = profile_result.get('resume_text_compact', '')
+        state['job_description_compact'] = profile_result.get('job_description_compact', '')
+        state['company_intel'] = research_result.get('company_intel', '')
+        state['agent_reasoning'] = profile_result.get('agent_reasoning', '')
+        log.info(f"   ✅ {profile_result.get('agent_reasoning', 'Done')}")
+        log.info(f"   ✅ {research_result.get('agent_reasoning', 'Done')}")
+    t_prep = time.perf_counter() - t_prep
+
+    log.info("\n🎯 Step 3: Running Strategy Agent...")
+    t_strategy = time.perf_counter()
     state = strategist.run(state)
-    print(f"   ✅ {state.get('agent_reasoning', 'Done')}")
+    t_strategy = time.perf_counter() - t_strategy
+    log.info(f"   ✅ {state.get('agent_reasoning', 'Done')}")
+
+    # Cache the now-complete static session blob on Gemini's side so later
+    # turns only pay for the dynamic delta
+    create_session_context_cache(state)
     
-    print("\n🎤 Step 4: Generating First Question...")
+    log.info("\n🎤 Step 4: Generating First Question...")
+    t_question = time.perf_counter()
     state = interviewer.run(state)
-    print(f"   ✅ {state.get('agent_reasoning', 'Done')}")
-    print(f"   Question: {state.get('current_question', 'N/A')[:100]}...")
+    t_question = time.perf_counter() - t_question
+    log.info(f"   ✅ {state.get('agent_reasoning', 'Done')}")
+    log.info(f"   Question: {state.get('current_question', 'N/A')[:100]}...")
+
+    # Latency attribution per phase - surfaced in the live-thoughts panel
+    # so slow stages are visible without instrumentation
+    state['agent_reasoning'] += (
+        f" | ⏱️ prep {t_prep:.1f}s (parallel), strategy {t_strategy:.1f}s, question {t_question:.1f}s"
+    )
     
-    print("\n" + "="*60)
-    print("✅ PREPARATION COMPLETE")
-    print("="*60 + "\n")
+    log.info("\n" + "="*60)
+    log.info("✅ PREPARATION COMPLETE")
+    log.info("="*60 + "\n")
     
     return state
 
 
+async def _speculative_turn(state: Dict):
+    """
+    Runs Critic and next-question Interviewer in parallel.
+    The Interviewer only needs the score *tier* of the previous answer to
+    pick its feedback branch, so a cheap 8B classifier supplies a hint and
+    both LLM calls overlap; per-turn latency drops from sum to max of the
+    two. Returns (tier_hint, hint_state) - hint_state holds the
+    speculatively generated question, uncommitted.
+    """
+    tier_hint = await aclassify_answer_tier(
+        state.get('current_question', ''), state.get('current_answer', '')
+    )
+    hint_state = dict(state)
+    hint_state['score_tier_hint'] = tier_hint
+    await asyncio.gather(critic.arun(state), interviewer.arun(hint_state))
+    return tier_hint, hint_state
+
+
 def process_user_answer(state: Dict, user_answer: str) -> Dict:
     """
     Processes user's answer and generates next question.
-    This executes: Vision (if enabled) -> Critique -> Stage Check -> Interview
+    This executes: Vision (if enabled) -> Critique + speculative Interview
+    (parallel) -> Stage Check -> commit or regenerate question
     """
-    print("\n" + "="*60)
-    print(f"💬 PROCESSING ANSWER #{state.get('question_count', 0) + 1}")
-    print("="*60)
-    
+    log.info("\n" + "="*60)
+    log.info(f"💬 PROCESSING ANSWER #{state.get('question_count', 0) + 1}")
+    log.info("="*60)
+
     # Add user answer to state
     state['current_answer'] = user_answer
-    state['conversation_history'] = state.get('conversation_history', []) + [
-        HumanMessage(content=user_answer)
-    ]
-    
+    _append_history(state, HumanMessage(content=user_answer))
+
     # Run vision analysis if video enabled and frame available
     if state.get('video_enabled') and state.get('current_video_frame'):
-        print("\n📹 Running Vision Coach...")
-        state = vision_coach.run(state)
-        print(f"   ✅ {state.get('agent_reasoning', 'Done')}")
-    
-    # Run critique
-    print("\n🤔 Running Critic Agent...")
-    state = critic.run(state)
-    print(f"   ✅ {state.get('agent_reasoning', 'Done')}")
-    print(f"   Score: {state.get('current_answer_score', 0)}/10")
-    
+        if _should_analyze_frame(state):
+            log.info("\n📹 Running Vision Coach...")
+            state = vision_coach.run(state)
+            log.info(f"   ✅ {state.get('agent_reasoning', 'Done')}")
+        else:
+            log.info("\n📹 Frame unchanged - reusing last vision analysis")
+
+    # Run critique, with the next question generated speculatively in parallel
+    log.info("\n🤔 Running Critic Agent + speculative Interviewer...")
+    tier_hint, hint_state = None, None
+    try:
+        tier_hint, hint_state = asyncio.run(_speculative_turn(state))
+    except Exception as e:
+        log.info(f"   ⚠️ Speculative turn failed ({e}), falling back to sequential")
+        state = critic.run(state)
+    log.info(f"   ✅ {state.get('agent_reasoning', 'Done')}")
+    log.info(f"   Score: {state.get('current_answer_score', 0)}/10")
+
     # Check stage progression
     state = advance_stage(state)
-    print(f"\n📈 Stage: {state.get('interview_stage', 'N/A').upper()}")
-    
+    log.info(f"\n📈 Stage: {state.get('interview_stage', 'N/A').upper()}")
+
     # Decide next action
     decision = should_continue_interview(state)
-    print(f"🎯 Decision: {decision.upper()}")
-    
+    log.info(f"🎯 Decision: {decision.upper()}")
+
     if decision == "interview":
-        print("\n🎤 Generating Next Question...")
-        state = interviewer.run(state)
-        print(f"   ✅ {state.get('agent_reasoning', 'Done')}")
-        print(f"   Question: {state.get('current_question', 'N/A')[:100]}...")
+        true_tier = score_tier(state.get('current_answer_score', 0))
+        if hint_state is not None and true_tier == tier_hint:
+            # Common case: classifier agreed with the Critic - commit the
+            # speculatively generated question
+            log.info(f"\n🎤 Committing speculative question (tier '{true_tier}' confirmed)")
+            state['current_question'] = hint_state['current_question']
+            state['conversation_history'] = hint_state['conversation_history']
+            state['question_count'] = hint_state['question_count']
+            state['agent_reasoning'] = hint_state['agent_reasoning']
+        else:
+            if hint_state is not None:
+                log.info(f"\n🎤 Tier mismatch (hint '{tier_hint}' vs actual '{true_tier}'), regenerating question...")
+            else:
+                log.info("\n🎤 Generating Next Question...")
+            state = interviewer.run(state)
+        log.info(f"   ✅ {state.get('agent_reasoning', 'Done')}")
+        log.info(f"   Question: {state.get('current_question', 'N/A')[:100]}...")
     else:
-        print("\n📊 Generating Final Report...")
+        log.info("\n📊 Generating Final Report...")
         state = reporter.run(state)
         state['interview_stage'] = 'complete'
-        print(f"   ✅ Report generated")
+        log.info(f"   ✅ Report generated")
     
-    print("="*60 + "\n")
+    log.info("="*60 + "\n")
     
     return state
 
 
+def stream_user_answer(state: Dict, user_answer: str):
+    """
+    Streaming variant of process_user_answer.
+    The Critic runs in a background thread while the next question streams
+    token by token (for st.write_stream) - the user only ever waits for
+    the Interviewer's first token, never for the evaluation. The
+    Interviewer steers off the cheap tier classifier; the full Critic
+    verdict is committed before this generator finishes, so termination
+    and pushback checks pick it up on the following turn.
+    Mutates state in place; the caller keeps its reference.
+    """
+    import threading
+
+    log.info("\n" + "="*60)
+    log.info(f"💬 PROCESSING ANSWER #{state.get('question_count', 0) + 1} (streaming)")
+    log.info("="*60)
+
+    state['current_answer'] = user_answer
+    _append_history(state, HumanMessage(content=user_answer))
+
+    if state.get('video_enabled') and state.get('current_video_frame'):
+        if _should_analyze_frame(state):
+            log.info("\n📹 Running Vision Coach...")
+            vision_coach.run(state)
+        else:
+            log.info("\n📹 Frame unchanged - reusing last vision analysis")
+
+    # Kick the Critic off in the background - the stream below doesn't wait
+    log.info("\n🤔 Running Critic Agent in background...")
+
+    def _critique():
+        try:
+            critic.run(state)
+        except Exception as e:
+            log.info(f"   ⚠️ Background Critic failed: {e}")
+
+    critic_thread = threading.Thread(target=_critique, daemon=True)
+    critic_thread.start()
+
+    # Decide interview-vs-report off the pre-answer record; the new score
+    # lands in feedback_log before the next turn reads it
+    advance_stage(state)
+    decision = should_continue_interview(state)
+    log.info(f"🎯 Decision: {decision.upper()}")
+
+    if decision == "interview":
+        try:
+            tier_hint = asyncio.run(aclassify_answer_tier(
+                state.get('current_question', ''), user_answer))
+        except Exception:
+            tier_hint = None
+        hint_state = dict(state)
+        if tier_hint:
+            hint_state['score_tier_hint'] = tier_hint
+
+        log.info("\n🎤 Streaming Next Question...")
+        yield from interviewer.run_stream(hint_state)
+
+        critic_thread.join()
+        state['current_question'] = hint_state['current_question']
+        state['conversation_history'] = hint_state['conversation_history']
+        state['question_count'] = hint_state['question_count']
+        state['agent_reasoning'] = hint_state['agent_reasoning']
+        log.info(f"   Score: {state.get('current_answer_score', 0)}/10")
+    else:
+        critic_thread.join()
+        log.info("\n📊 Generating Final Report...")
+        reporter.run(state)
+        state['interview_stage'] = 'complete'
+        yield "Thanks - that wraps up the interview. Generating your report..."
+
+    log.info("="*60 + "\n")
+
+
 def generate_final_report(state: Dict) -> Dict:
     """
     Generates comprehensive interview report.
@@ -4,9 +4,14 @@ Robust implementations with error handling and fallbacks.
 """
 
 import streamlit as st
+import functools
+from collections import deque
+import os
 import queue
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeout
 from typing import Optional, Dict, Callable
 import logging
 
@@ -14,42 +19,114 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared pool for engine network calls. The SDK clients (openai, gTTS,
+# elevenlabs) each keep their own pooled HTTP session, so reusing these
+# threads also reuses their TCP/TLS connections across calls.
+_IO_POOL = ThreadPoolExecutor(max_workers=4)
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_openai():
+    """Return the openai module pinned to one pooled HTTP session.
+
+    The legacy module API opens a fresh session (full TLS handshake,
+    ~100-300ms) per call by default; pinning a requests.Session shares
+    keep-alive connections across Whisper STT and TTS calls.
+    """
+    import openai
+    import requests
+    openai.requestssession = requests.Session()
+    return openai
+
 # ============================================================================
 # ROBUST AUDIO TRANSCRIBER WITH FALLBACKS
 # ============================================================================
 
+# Engine probing (imports + env lookups) costs tens of ms and these
+# classes are constructed per Streamlit rerun - detect once per process
+# and let constructors just bind methods to the cached names.
+@functools.lru_cache(maxsize=1)
+def _detect_stt_engines() -> tuple:
+    """Probe installed STT backends once, in priority order."""
+    names = []
+
+    # Try OpenAI Whisper (most accurate)
+    try:
+        import openai  # noqa: F401
+        if os.getenv("OPENAI_API_KEY"):
+            names.append("whisper")
+            logger.info("✅ Whisper STT available")
+    except ImportError:
+        logger.warning("⚠️ OpenAI not installed - Whisper unavailable")
+
+    # Try Google Speech Recognition (free fallback)
+    try:
+        import speech_recognition  # noqa: F401
+        names.append("google")
+        logger.info("✅ Google Speech STT available")
+    except ImportError:
+        logger.warning("⚠️ SpeechRecognition not installed")
+
+    return tuple(names)
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_tts_engines() -> tuple:
+    """Probe installed TTS backends once, in priority order."""
+    names = []
+
+    # Try OpenAI TTS (natural voice)
+    try:
+        import openai  # noqa: F401
+        if os.getenv("OPENAI_API_KEY"):
+            names.append("openai")
+            logger.info("✅ OpenAI TTS available")
+    except ImportError:
+        logger.warning("⚠️ OpenAI not installed")
+
+    # Try ElevenLabs (ultra-realistic)
+    try:
+        from elevenlabs import set_api_key
+        if os.getenv("ELEVENLABS_API_KEY"):
+            set_api_key(os.getenv("ELEVENLABS_API_KEY"))
+            names.append("elevenlabs")
+            logger.info("✅ ElevenLabs TTS available")
+    except ImportError:
+        logger.warning("⚠️ ElevenLabs not installed")
+
+    # Try gTTS (free fallback)
+    try:
+        from gtts import gTTS  # noqa: F401
+        names.append("gtts")
+        logger.info("✅ gTTS available")
+    except ImportError:
+        logger.warning("⚠️ gTTS not installed")
+
+    return tuple(names)
+
+
 class RobustAudioTranscriber:
     """
     Production-ready STT with multiple fallback engines.
     Priority: Whisper → Google → Manual text input
     """
-    
+
     def __init__(self):
         self.engines = []
         self._init_engines()
-    
+
     def _init_engines(self):
-        """Initialize available STT engines in priority order"""
-        
-        # Try OpenAI Whisper (most accurate)
-        try:
-            import openai
-            import os
-            if os.getenv("OPENAI_API_KEY"):
-                self.engines.append(("whisper", self._whisper_transcribe))
-                logger.info("✅ Whisper STT available")
-        except ImportError:
-            logger.warning("⚠️ OpenAI not installed - Whisper unavailable")
-        
-        # Try Google Speech Recognition (free fallback)
-        try:
-            import speech_recognition as sr
-            self.recognizer = sr.Recognizer()
-            self.engines.append(("google", self._google_transcribe))
-            logger.info("✅ Google Speech STT available")
-        except ImportError:
-            logger.warning("⚠️ SpeechRecognition not installed")
-        
+        """Bind the cached engine names to this instance's methods"""
+        methods = {
+            "whisper": self._whisper_transcribe,
+            "google": self._google_transcribe,
+        }
+        for name in _detect_stt_engines():
+            if name == "google":
+                import speech_recognition as sr
+                self.recognizer = sr.Recognizer()
+            self.engines.append((name, methods[name]))
+
         if not self.engines:
             logger.error("❌ No STT engines available!")
             raise RuntimeError("No speech recognition engines available")
@@ -86,8 +163,9 @@ class RobustAudioTranscriber:
     
     def _whisper_transcribe(self, audio_data: bytes, timeout: float) -> str:
         """Transcribe using OpenAI Whisper"""
-        import openai
         import io
+
+        openai = _shared_openai()
         
         audio_file = io.BytesIO(audio_data)
         audio_file.name = "audio.wav"
@@ -128,39 +206,16 @@ class RobustTTSEngine:
     def __init__(self):
         self.engines = []
         self._init_engines()
-    
+
     def _init_engines(self):
-        """Initialize available TTS engines in priority order"""
-        
-        # Try OpenAI TTS (natural voice)
-        try:
-            import openai
-            import os
-            if os.getenv("OPENAI_API_KEY"):
-                self.engines.append(("openai", self._openai_synthesize))
-                logger.info("✅ OpenAI TTS available")
-        except ImportError:
-            logger.warning("⚠️ OpenAI not installed")
-        
-        # Try ElevenLabs (ultra-realistic)
-        try:
-            from elevenlabs import generate, set_api_key
-            import os
-            if os.getenv("ELEVENLABS_API_KEY"):
-                set_api_key(os.getenv("ELEVENLABS_API_KEY"))
-                self.engines.append(("elevenlabs", self._elevenlabs_synthesize))
-                logger.info("✅ ElevenLabs TTS available")
-        except ImportError:
-            logger.warning("⚠️ ElevenLabs not installed")
-        
-        # Try gTTS (free fallback)
-        try:
-            from gtts import gTTS
-            self.engines.append(("gtts", self._gtts_synthesize))
-            logger.info("✅ gTTS available")
-        except ImportError:
-            logger.warning("⚠️ gTTS not installed")
-        
+        """Bind the cached engine names to this instance's methods"""
+        methods = {
+            "openai": self._openai_synthesize,
+            "elevenlabs": self._elevenlabs_synthesize,
+            "gtts": self._gtts_synthesize,
+        }
+        self.engines = [(name, methods[name]) for name in _detect_tts_engines()]
+
         if not self.engines:
             logger.warning("⚠️ No TTS engines - text-only mode")
     
@@ -178,27 +233,38 @@ class RobustTTSEngine:
         # Truncate very long text
         if len(text) > 500:
             text = text[:500] + "..."
-        
-        for engine_name, engine_func in self.engines:
-            try:
-                logger.info(f"🔊 Trying {engine_name} TTS...")
-                audio_bytes = engine_func(text, timeout)
-                
+
+        # Race the engines instead of trying them serially: all are
+        # idempotent network reads, so the fastest one to produce audio
+        # wins and the stragglers finish quietly on the pool. Serial
+        # fallback meant a slow primary added its full timeout to every
+        # call even when a fallback could answer in 200ms.
+        futures = {
+            _IO_POOL.submit(engine_func, text, timeout): engine_name
+            for engine_name, engine_func in self.engines
+        }
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                engine_name = futures[future]
+                try:
+                    audio_bytes = future.result()
+                except Exception as e:
+                    logger.error(f"❌ {engine_name} failed: {e}")
+                    continue
                 if audio_bytes:
                     logger.info(f"✅ {engine_name} synthesized {len(audio_bytes)} bytes")
                     return audio_bytes
-            
-            except Exception as e:
-                logger.error(f"❌ {engine_name} failed: {e}")
-                continue
-        
+        except FuturesTimeout:
+            logger.error(f"❌ TTS timed out after {timeout}s")
+
         logger.error("❌ All TTS engines failed - falling back to text")
         return None
     
     def _openai_synthesize(self, text: str, timeout: float) -> bytes:
         """Synthesize using OpenAI TTS"""
-        import openai
-        
+        openai = _shared_openai()
+
+
         response = openai.Audio.speech.create(
             model="tts-1",
             voice="alloy",
@@ -241,15 +307,33 @@ class ThreadSafeAudioBuffer:
     
     def __init__(self, chunk_duration_seconds: float = 2.0):
         self.chunk_duration = chunk_duration_seconds
-        self.queue = queue.Queue()
+        # Bounded to ~one chunk's worth of 20ms WebRTC frames: if the
+        # transcriber stalls, old frames are dropped instead of letting
+        # the queue grow without limit for the rest of the session
+        self.queue = queue.Queue(maxsize=int(self.chunk_duration * 50))
         self.accumulated_chunks = []
         self.last_flush_time = time.time()
         self.lock = threading.Lock()
         self.transcription_callback: Optional[Callable[[str], None]] = None
-    
+        self._last_drop_warning = 0.0
+
     def add_frame(self, audio_frame):
-        """Add audio frame from WebRTC (thread-safe)"""
-        self.queue.put(audio_frame)
+        """Add audio frame from WebRTC (thread-safe, drops oldest when full)"""
+        try:
+            self.queue.put_nowait(audio_frame)
+        except queue.Full:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait(audio_frame)
+            except queue.Full:
+                pass
+            now = time.time()
+            if now - self._last_drop_warning >= 5.0:
+                self._last_drop_warning = now
+                logger.warning("⚠️ Audio buffer full - dropping oldest frames")
     
     def set_transcription_callback(self, callback: Callable[[str], None]):
         """Set callback to receive transcription results"""
@@ -299,10 +383,37 @@ class ThreadSafeAudioBuffer:
                 continue
     
     def _combine_chunks(self, chunks) -> bytes:
-        """Combine audio chunks into single WAV bytes"""
-        # TODO: Implement proper audio concatenation
-        # This is simplified - production needs pydub or scipy
-        return b""  # Placeholder
+        """
+        Combine audio frames into a single WAV byte string.
+
+        One np.concatenate over the frames' PCM plus a 44-byte header -
+        a single copy of the audio data, vs the O(N^2) traffic of
+        iterative bytes concatenation.
+        """
+        import struct
+        import numpy as np
+
+        if not chunks:
+            return b""
+
+        pcm = np.concatenate([f.to_ndarray() for f in chunks], axis=1)
+        data = pcm.tobytes()
+
+        first = chunks[0]
+        channels = len(first.layout.channels)
+        rate = first.sample_rate
+        sample_width = pcm.dtype.itemsize
+
+        # Canonical 44-byte PCM WAV header around the raw samples
+        header = struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 36 + len(data), b'WAVE',
+            b'fmt ', 16, 1, channels, rate,
+            rate * channels * sample_width, channels * sample_width,
+            sample_width * 8,
+            b'data', len(data)
+        )
+        return header + data
 
 # ============================================================================
 # SMART VIDEO FRAME SAMPLER
@@ -319,9 +430,18 @@ class SmartVideoSampler:
         self.max_interval = max_interval
         self.current_interval = base_interval
         self.last_sample_time = 0
-        self.processing_times = []
+        # Rolling window with a running sum: O(1) per sample instead of
+        # pop(0) (O(N)) plus a sum() scan on every recorded time
+        self.processing_times = deque(maxlen=10)
+        self._processing_time_sum = 0.0
         self.latest_frame = None
         self.lock = threading.Lock()
+        # Single-slot handoff to the encode worker: the WebRTC callback
+        # only drops the newest raw frame here; stale frames are simply
+        # overwritten rather than queued
+        self._pending = None
+        self._encode_scheduled = False
+        self._worker = ThreadPoolExecutor(max_workers=1)
     
     def should_sample(self) -> bool:
         """Check if frame should be sampled (adaptive)"""
@@ -335,14 +455,15 @@ class SmartVideoSampler:
     
     def record_processing_time(self, seconds: float):
         """Record how long frame processing took (for adaptive sampling)"""
+        # Evict the oldest measurement from the running sum before the
+        # bounded deque drops it
+        if len(self.processing_times) == self.processing_times.maxlen:
+            self._processing_time_sum -= self.processing_times[0]
         self.processing_times.append(seconds)
-        
-        # Keep only recent 10 measurements
-        if len(self.processing_times) > 10:
-            self.processing_times.pop(0)
-        
+        self._processing_time_sum += seconds
+
         # Adapt interval based on processing time
-        avg_processing_time = sum(self.processing_times) / len(self.processing_times)
+        avg_processing_time = self._processing_time_sum / len(self.processing_times)
         
         if avg_processing_time > 2.0:
             # Processing is slow - increase interval
@@ -361,40 +482,59 @@ class SmartVideoSampler:
             logger.info(f"✅ Decreasing frame interval to {self.current_interval:.1f}s")
     
     def process_frame(self, frame) -> Optional[str]:
-        """Process frame with timing (returns base64 if sampled)"""
+        """
+        Hand a sampled frame to the encode worker (non-blocking).
+
+        Runs on WebRTC's frame-delivery thread, which is latency
+        sensitive, so the resize/encode/base64 work happens on the
+        single worker instead. Returns the most recently *encoded*
+        frame, which may lag the handed-off one by a sample.
+        """
         if not self.should_sample():
             return None
-        
+
+        with self.lock:
+            self._pending = frame
+            if not self._encode_scheduled:
+                self._encode_scheduled = True
+                self._worker.submit(self._encode_pending)
+
+        return self.latest_frame
+
+    def _encode_pending(self):
+        """Encode the newest pending frame (worker thread)."""
+        with self.lock:
+            frame = self._pending
+            self._pending = None
+            self._encode_scheduled = False
+        if frame is None:
+            return
+
         start_time = time.time()
-        
+
         try:
-            # Convert frame to base64
-            from PIL import Image
-            import io
+            # cv2 resize + imencode run in SIMD native code (official
+            # wheels bundle libjpeg-turbo) and release the GIL, unlike
+            # the old PIL thumbnail/save chain
+            import cv2
             import base64
-            
-            img = frame.to_ndarray(format="rgb24")
-            pil_img = Image.fromarray(img)
-            pil_img.thumbnail((640, 480))
-            
-            buffer = io.BytesIO()
-            pil_img.save(buffer, format="JPEG", quality=85)
-            buffer.seek(0)
-            
-            frame_base64 = base64.b64encode(buffer.read()).decode()
-            
+
+            img = frame.to_ndarray(format="bgr24")
+            img = cv2.resize(img, (640, 480), interpolation=cv2.INTER_AREA)
+            ok, jpg = cv2.imencode('.jpg', img, [int(cv2.IMWRITE_JPEG_QUALITY), 85])
+            if not ok:
+                return
+
+            frame_base64 = base64.b64encode(jpg.tobytes()).decode()
+
             with self.lock:
                 self.latest_frame = frame_base64
-            
+
             # Record timing
-            processing_time = time.time() - start_time
-            self.record_processing_time(processing_time)
-            
-            return frame_base64
-        
+            self.record_processing_time(time.time() - start_time)
+
         except Exception as e:
             logger.error(f"Frame processing error: {e}")
-            return None
 
 # ============================================================================
 # CONNECTION HEALTH MONITOR
@@ -484,9 +624,10 @@ def example_integration():
         """Called for each video frame"""
         health_monitor.update_video()
         
-        # Sample frame if needed
+        # Sample frame if needed (encode happens on the worker; this
+        # returns the most recently completed frame)
         frame_base64 = video_sampler.process_frame(frame)
-        
+
         if frame_base64:
             # Store for vision analysis
             st.session_state.current_video_frame = frame_base64
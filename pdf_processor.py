@@ -3,9 +3,50 @@ PDF Resume Processor
 Extracts text from PDF resumes using multiple methods for robustness.
 """
 
+import hashlib
 import io
+import logging
+import re
+from collections import OrderedDict
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+# Compiled once at import - clean_extracted_text runs on every upload
+# and pattern.sub skips the per-call cache lookup re.sub pays.
+# _RE_CLEAN folds line stripping and space collapsing into one pass:
+# any whitespace run containing a newline becomes '\n', any horizontal
+# run becomes ' ' (newline alternative first so line edges are eaten)
+_RE_MULTI_NEWLINE = re.compile(r'\n{3,}')
+_RE_CLEAN = re.compile(r'[ \t]*\n[ \t]*|[ \t]+')
+
+
+def _clean_repl(match) -> str:
+    return '\n' if '\n' in match.group() else ' '
+
+
+# Common resume keywords - validation passes once 2 distinct ones appear
+_RESUME_KEYWORDS = frozenset({
+    'experience', 'education', 'skills', 'work', 'project',
+    'degree', 'university', 'college', 'company', 'position',
+    'responsibilities', 'achievements', 'email', 'phone',
+})
+_WORD_RE = re.compile(r'[a-z]+')
+
+# Extraction results keyed by content hash - users re-upload the same
+# resume constantly (edit-preview cycles, session restarts) and a repeat
+# upload shouldn't pay the parse again. LRU-bounded OrderedDict because
+# lru_cache can't key on raw bytes sensibly.
+_EXTRACT_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_EXTRACT_CACHE_SIZE = 32
+
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+    print("⚠️ pypdfium2 not installed. Run: pip install pypdfium2")
+
 try:
     import PyPDF2
     PYPDF2_AVAILABLE = True
@@ -36,25 +77,67 @@ def extract_text_from_pdf(pdf_file) -> str:
         ValueError: If no PDF library is available or extraction fails
     """
     
-    if not PYPDF2_AVAILABLE and not PDFPLUMBER_AVAILABLE:
-        raise ValueError("No PDF processing library available. Install PyPDF2 or pdfplumber.")
-    
-    # Read file bytes
+    if not PDFIUM_AVAILABLE and not PYPDF2_AVAILABLE and not PDFPLUMBER_AVAILABLE:
+        raise ValueError("No PDF processing library available. Install pypdfium2, PyPDF2 or pdfplumber.")
+
+    # Read file bytes once; every method below parses from this buffer,
+    # so there's no reason to rewind the upload itself
     pdf_bytes = pdf_file.read()
-    pdf_file.seek(0)  # Reset file pointer for potential re-reads
-    
+
+    # Reject obvious non-PDFs before any library spins up parser state -
+    # pdfplumber's error path alone can burn hundreds of milliseconds
+    if len(pdf_bytes) < 256:
+        raise ValueError("File is too small to be a valid PDF.")
+    if not pdf_bytes.startswith(b'%PDF-'):
+        raise ValueError("Not a PDF file (missing %PDF header).")
+
+    buf = io.BytesIO(pdf_bytes)
+
     text = ""
-    
+
+    # Method 0: Try pypdfium2 (PDFium C++ core - fastest and cleanest text)
+    if PDFIUM_AVAILABLE:
+        try:
+            print("   📄 Trying pypdfium2 extraction...")
+            pdf = pdfium.PdfDocument(pdf_bytes)
+            try:
+                # Pages are extracted serially on purpose: PDFium is not
+                # thread-safe (pypdfium2 documents process isolation as
+                # the only safe way to parallelize), and a process pool
+                # costs more than parsing the typical 2-page resume
+                parts = []
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    parts.append(textpage.get_text_range())
+                    textpage.close()
+                    page.close()
+                text = "\n\n".join(parts)
+            finally:
+                pdf.close()
+
+            if text.strip():
+                print(f"   ✅ pypdfium2: Successfully extracted {len(text)} characters")
+                return clean_extracted_text(text)
+        except Exception as e:
+            print(f"   ⚠️ pypdfium2 failed: {e}")
+            text = ""
+
     # Method 1: Try pdfplumber (better for complex layouts)
     if PDFPLUMBER_AVAILABLE:
         try:
             print("   📄 Trying pdfplumber extraction...")
-            with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
+            with pdfplumber.open(buf) as pdf:
+                parts = []
+                for page in pdf.pages:
                     page_text = page.extract_text()
                     if page_text:
-                        text += page_text + "\n\n"
-                        print(f"      ✅ Extracted page {page_num}: {len(page_text)} chars")
+                        parts.append(page_text)
+                text = "\n\n".join(parts)
+            # One log line after the loop - a print per page takes the
+            # stdout lock and formats a string inside the hot loop
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("pdfplumber pages: %d, per-page lens: %s",
+                             len(parts), [len(p) for p in parts])
             
             if text.strip():
                 print(f"   ✅ pdfplumber: Successfully extracted {len(text)} characters")
@@ -66,12 +149,22 @@ def extract_text_from_pdf(pdf_file) -> str:
     if PYPDF2_AVAILABLE and not text.strip():
         try:
             print("   📄 Trying PyPDF2 extraction...")
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
-            for page_num, page in enumerate(pdf_reader.pages, 1):
+            # Rewind the shared buffer (pdfplumber may have closed it
+            # on some versions - fall back to a fresh view if so)
+            if buf.closed:
+                buf = io.BytesIO(pdf_bytes)
+            else:
+                buf.seek(0)
+            pdf_reader = PyPDF2.PdfReader(buf)
+            parts = []
+            for page in pdf_reader.pages:
                 page_text = page.extract_text()
                 if page_text:
-                    text += page_text + "\n\n"
-                    print(f"      ✅ Extracted page {page_num}: {len(page_text)} chars")
+                    parts.append(page_text)
+            text = "\n\n".join(parts)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("PyPDF2 pages: %d, per-page lens: %s",
+                             len(parts), [len(p) for p in parts])
             
             if text.strip():
                 print(f"   ✅ PyPDF2: Successfully extracted {len(text)} characters")
@@ -96,17 +189,12 @@ def clean_extracted_text(text: str) -> str:
     """
     Clean up extracted text by removing excessive whitespace and formatting issues.
     """
-    # Remove multiple consecutive newlines
-    import re
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    
-    # Remove excessive spaces
-    text = re.sub(r' {2,}', ' ', text)
-    
-    # Remove leading/trailing whitespace from each line
-    lines = [line.strip() for line in text.split('\n')]
-    text = '\n'.join(lines)
-    
+    # One pass: strip line edges + collapse space runs, then cap blank lines.
+    # The old split('\n')/strip/join materialized a list of line objects
+    # (a 500-line resume = 500 strings) on top of two more regex passes.
+    text = _RE_CLEAN.sub(_clean_repl, text)
+    text = _RE_MULTI_NEWLINE.sub('\n\n', text)
+
     return text.strip()
 
 
@@ -122,21 +210,26 @@ def validate_resume_content(text: str) -> bool:
         print(f"   ⚠️ Text too short ({len(text)} chars) - may not be a complete resume")
         return False
     
-    # Check for common resume keywords (at least 2 should be present)
-    resume_keywords = [
-        'experience', 'education', 'skills', 'work', 'project',
-        'degree', 'university', 'college', 'company', 'position',
-        'responsibilities', 'achievements', 'email', 'phone'
-    ]
-    
-    text_lower = text.lower()
-    keyword_count = sum(1 for keyword in resume_keywords if keyword in text_lower)
-    
-    if keyword_count < 2:
-        print(f"   ⚠️ Only {keyword_count} resume keywords found - may not be a resume")
+    # Check for common resume keywords (at least 2 should be present).
+    # One tokenizing scan against a frozenset instead of one full-text
+    # substring pass per keyword - and it stops at the 2nd hit, which
+    # real resumes reach within the first couple of lines. Stays O(N)
+    # however large _RESUME_KEYWORDS grows (set lookup per token); an
+    # Aho-Corasick automaton only becomes worth a C dependency if the
+    # list ever needs multi-word phrases
+    found = set()
+    for match in _WORD_RE.finditer(text.lower()):
+        word = match.group()
+        if word in _RESUME_KEYWORDS:
+            found.add(word)
+            if len(found) >= 2:
+                break
+
+    if len(found) < 2:
+        print(f"   ⚠️ Only {len(found)} resume keywords found - may not be a resume")
         return False
-    
-    print(f"   ✅ Resume validation passed ({len(text)} chars, {keyword_count} keywords)")
+
+    print(f"   ✅ Resume validation passed ({len(text)} chars, {len(found)}+ keywords)")
     return True
 
 
@@ -157,17 +250,33 @@ def extract_resume_from_pdf(pdf_file, validate: bool = True) -> str:
     print("\n📄 Processing PDF resume...")
     print(f"   File name: {pdf_file.name}")
     print(f"   File size: {pdf_file.size} bytes")
-    
+
+    pdf_bytes = pdf_file.read()
+    pdf_file.seek(0)
+
+    # blake2b: fast non-cryptographic-grade keying from the stdlib
+    # (~1GB/s); this is a cache key, not a security boundary, so no need
+    # to pull in xxhash for the last factor of a few
+    key = (hashlib.blake2b(pdf_bytes, digest_size=16).hexdigest(), validate)
+    cached = _EXTRACT_CACHE.get(key)
+    if cached is not None:
+        _EXTRACT_CACHE.move_to_end(key)
+        print("   ⚡ Same file as a previous upload - reusing extracted text")
+        return cached
+
     # Extract text
     text = extract_text_from_pdf(pdf_file)
-    
+
     # Validate if requested
     if validate and not validate_resume_content(text):
         raise ValueError(
             "Extracted text doesn't appear to be a valid resume. "
             "Please check the file or paste your resume text manually."
         )
-    
+
+    _EXTRACT_CACHE[key] = text
+    if len(_EXTRACT_CACHE) > _EXTRACT_CACHE_SIZE:
+        _EXTRACT_CACHE.popitem(last=False)
     return text
 
 
@@ -175,11 +284,12 @@ def extract_resume_from_pdf(pdf_file, validate: bool = True) -> str:
 if __name__ == "__main__":
     print("PDF Processor Test")
     print("=" * 50)
+    print(f"pypdfium2 available: {PDFIUM_AVAILABLE}")
     print(f"PyPDF2 available: {PYPDF2_AVAILABLE}")
     print(f"pdfplumber available: {PDFPLUMBER_AVAILABLE}")
-    
-    if not PYPDF2_AVAILABLE and not PDFPLUMBER_AVAILABLE:
+
+    if not PDFIUM_AVAILABLE and not PYPDF2_AVAILABLE and not PDFPLUMBER_AVAILABLE:
         print("\n❌ No PDF libraries installed!")
-        print("Run: pip install PyPDF2 pdfplumber")
+        print("Run: pip install pypdfium2 PyPDF2 pdfplumber")
     else:
         print("\n✅ PDF processing ready!")
@@ -4,82 +4,31 @@ Provides brutal, honest feedback on resume quality BEFORE the interview starts.
 Identifies loopholes, red flags, ATS issues, and improvement areas.
 """
 
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 from langchain_core.messages import HumanMessage
 import json
+from string import Template
+import re
 
+_JSON_DECODER = json.JSONDecoder()
 
-class ResumeAnalyzerAgent:
-    """
-    Pre-Interview Resume Judge
-    Evaluates resume quality with brutal honesty:
-    - ATS compatibility (will it pass automated screening?)
-    - Red flags (gaps, job hopping, vague descriptions)
-    - Formatting issues
-    - Content quality (quantifiable achievements vs fluff)
-    - Missing critical elements
-    - Company fit analysis (uses Researcher Agent)
-    """
-    
-    def __init__(self, llm, researcher_agent=None):
-        self.llm = llm
-        self.researcher = researcher_agent
-    
-    def analyze(self, resume_text: str, job_description: str = "", company_name: str = "") -> Dict:
-        """
-        Deep resume analysis with actionable feedback.
-        Now includes company-specific insights using Researcher Agent.
-        
-        Returns:
-            Dictionary with:
-            - overall_grade: A-F
-            - ats_score: 0-100 (will it pass automated screening?)
-            - red_flags: List of concerning elements
-            - strengths: What's working well
-            - fatal_flaws: Deal-breakers
-            - improvement_tips: Specific actionable fixes
-            - section_scores: Breakdown by resume section
-            - company_fit: How well candidate matches company expectations
-            - company_gaps: What company expects but resume lacks
-        """
-        print("\n" + "📄"*40)
-        print(" "*30 + "RESUME ANALYSIS")
-        print("📄"*40 + "\n")
-        
-        print(f"   📄 ResumeAnalyzer: Processing {len(resume_text)} char resume...")
-        
-        # Fetch company expectations if company provided
-        company_intel = ""
-        company_expectations = ""
-        if company_name and self.researcher:
-            print(f"   📄 ResumeAnalyzer: Fetching {company_name} expectations via Researcher...")
-            try:
-                research_state = {
-                    'company_name': company_name
-                }
-                result = self.researcher.run(research_state)
-                company_intel = result.get('company_intel', '')
-                
-                if company_intel:
-                    print(f"   📄 ResumeAnalyzer: Got {len(company_intel)} chars of company intel")
-                    company_expectations = f"\n\nCOMPANY EXPECTATIONS:\n{company_intel}\n\nIMPORTANT: Evaluate if this resume matches what {company_name} typically looks for. Does the candidate's experience align with their culture and technical standards?"
-                else:
-                    print(f"   ⚠️ ResumeAnalyzer: No company intel received")
-            except Exception as e:
-                print(f"   ⚠️ ResumeAnalyzer: Company research failed: {e}")
-        
-        # Build comprehensive analysis prompt
-        jd_context = f"\n\nTARGET JOB:\n{job_description}\n\nAnalyze resume fit for THIS SPECIFIC ROLE." if job_description else ""
-        
-        prompt = f"""You are a brutal but fair resume critic with 20 years of hiring experience.
+# Runs the company-intel fetch concurrently with prompt assembly
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+# The instructional body of the analysis prompt is constant - built once
+# here instead of re-materializing a 4KB f-string per call, which also
+# keeps the prefix bytes identical for provider-side prompt caching.
+# string.Template so the JSON example's braces stay literal.
+_PROMPT_HEAD = """You are a brutal but fair resume critic with 20 years of hiring experience.
 Your job: Find EVERY problem in this resume. Be ruthlessly honest.
 
 RESUME:
-{resume_text}
-{jd_context}
-{company_expectations}
+"""
 
-Analyze these dimensions:
+_PROMPT_TAIL = Template("""Analyze these dimensions:
 
 1. **ATS COMPATIBILITY** (0-100 score)
    - Does it use keywords from job description?
@@ -125,9 +74,9 @@ Analyze these dimensions:
 
 7. **COMPANY FIT ANALYSIS** (If company provided)
    - Match Level: Poor/Fair/Good/Excellent
-   - What {company_name} expects: Technical depth, culture fit, experience level
+   - What ${company_name} expects: Technical depth, culture fit, experience level
    - What resume shows: Does it align?
-   - Company-specific gaps: What's missing that {company_name} values
+   - Company-specific gaps: What's missing that ${company_name} values
    - Tailoring suggestions: How to customize resume for THIS company
 
 8. **OVERALL GRADE** (A/B/C/D/F)
@@ -138,27 +87,27 @@ Analyze these dimensions:
    - F: Start from scratch
 
 Return ONLY valid JSON:
-{{
+{
   "overall_grade": "C",
   "ats_score": 65,
   "red_flags": ["Gap from Jan 2023 - Aug 2023 unexplained", "Job hopping: 4 companies in 3 years"],
   "fatal_flaws": ["No quantified achievements - all duties", "90% of experience unrelated to target role"],
   "strengths": ["Good progression from junior to senior", "Strong technical skills listed"],
-  "section_scores": {{
+  "section_scores": {
     "contact_info": 9,
     "summary": 4,
     "work_experience": 5,
     "skills": 6,
     "education": 8,
     "projects": 0
-  }},
-  "company_fit": {{
+  },
+  "company_fit": {
     "match_level": "Fair",
     "company_expects": "Google values scalability, distributed systems expertise, and proven impact at scale",
     "resume_shows": "Some backend experience but no mention of scale (millions of users, distributed systems)",
     "company_gaps": ["No distributed systems experience", "No mentions of scale/performance optimization", "Missing Google-valued skills: Kubernetes, gRPC"],
     "tailoring_tips": ["Add metrics showing scale (X million requests/day)", "Highlight any distributed systems work", "Mention collaboration on large codebases"]
-  }},
+  },
   "improvement_tips": [
     "Add numbers to every achievement. 'Led team' → 'Led team of 5 engineers, shipped product to 100K users'",
     "Explain 8-month gap in 2023 (consulting? learning? sabbatical?)",
@@ -167,25 +116,153 @@ Return ONLY valid JSON:
     "Add a projects section with GitHub links showing actual code"
   ],
   "detailed_feedback": "This resume reads like a job duties checklist, not a results showcase. Hiring managers spend 6 seconds scanning - yours doesn't grab attention..."
-}}
+}
+
+CRITICAL: Return ONLY valid JSON. No markdown, no code blocks.""")
+
+# Root fields that appear in the first few hundred bytes of the model's
+# JSON - streamed out early so the UI can show the verdict while the
+# long tail (tips, detailed feedback) is still generating
+_EARLY_FIELDS = (
+    ('overall_grade', re.compile(r'"overall_grade"\s*:\s*"([^"]+)"')),
+    ('ats_score', re.compile(r'"ats_score"\s*:\s*(\d+)')),
+)
 
-CRITICAL: Return ONLY valid JSON. No markdown, no code blocks."""
+# All 11 possible section score bars, built once - also clamps the
+# occasional out-of-range score the LLM returns
+_SCORE_BARS = tuple("█" * s + "░" * (10 - s) for s in range(11))
+
+
+class ResumeAnalyzerAgent:
+    """
+    Pre-Interview Resume Judge
+    Evaluates resume quality with brutal honesty:
+    - ATS compatibility (will it pass automated screening?)
+    - Red flags (gaps, job hopping, vague descriptions)
+    - Formatting issues
+    - Content quality (quantifiable achievements vs fluff)
+    - Missing critical elements
+    - Company fit analysis (uses Researcher Agent)
+    """
+    
+    # Company intel barely changes within a session - cache fetches for
+    # an hour so re-analyzing for the same company skips the web search
+    _INTEL_TTL = 3600
+    _INTEL_CACHE_SIZE = 64
+
+    def __init__(self, llm, researcher_agent=None):
+        self.llm = llm
+        self.researcher = researcher_agent
+        self._intel_cache: "OrderedDict[str, tuple]" = OrderedDict()
+    
+    def analyze(self, resume_text: str, job_description: str = "",
+                company_name: str = "", on_progress=None) -> Dict:
+        """
+        Deep resume analysis with actionable feedback.
+        Now includes company-specific insights using Researcher Agent.
         
-        print(f"   📄 ResumeAnalyzer: Calling LLM for deep analysis...")
-        response = self.llm.invoke([HumanMessage(content=prompt)])
-        print(f"   📄 ResumeAnalyzer: Received {len(response.content)} chars")
+        Returns:
+            Dictionary with:
+            - overall_grade: A-F
+            - ats_score: 0-100 (will it pass automated screening?)
+            - red_flags: List of concerning elements
+            - strengths: What's working well
+            - fatal_flaws: Deal-breakers
+            - improvement_tips: Specific actionable fixes
+            - section_scores: Breakdown by resume section
+            - company_fit: How well candidate matches company expectations
+            - company_gaps: What company expects but resume lacks
+        """
+        print("\n" + "📄"*40)
+        print(" "*30 + "RESUME ANALYSIS")
+        print("📄"*40 + "\n")
         
-        # Parse response
-        raw_content = response.content.strip()
+        print(f"   📄 ResumeAnalyzer: Processing {len(resume_text)} char resume...")
         
-        # Remove markdown code blocks if present
-        if raw_content.startswith('```'):
-            lines = raw_content.split('\n')
-            raw_content = '\n'.join(lines[1:-1]) if len(lines) > 2 else raw_content
-            raw_content = raw_content.replace('```json', '').replace('```', '').strip()
+        # Fetch company expectations if company provided. The fetch is a
+        # web-search round trip that shares no data with the prompt
+        # sections below, so it runs on the executor while they build.
+        company_intel = ""
+        company_expectations = ""
+        intel_future = None
+        cache_key = company_name.lower()
+        if company_name and self.researcher:
+            cached = self._intel_cache.get(cache_key)
+            if cached and time.time() - cached[0] < self._INTEL_TTL:
+                self._intel_cache.move_to_end(cache_key)
+                company_intel = cached[1]
+                print(f"   📄 ResumeAnalyzer: Reusing cached {company_name} intel")
+            else:
+                print(f"   📄 ResumeAnalyzer: Fetching {company_name} expectations via Researcher...")
+                intel_future = _EXECUTOR.submit(self.researcher.run,
+                                                {'company_name': company_name})
+
+        # Build the static prompt sections while the fetch is in flight
+        jd_context = f"\n\nTARGET JOB:\n{job_description}\n\nAnalyze resume fit for THIS SPECIFIC ROLE." if job_description else ""
+
+        if intel_future is not None:
+            try:
+                result = intel_future.result(timeout=10)
+                company_intel = result.get('company_intel', '')
+
+                if company_intel:
+                    print(f"   📄 ResumeAnalyzer: Got {len(company_intel)} chars of company intel")
+                    self._intel_cache[cache_key] = (time.time(), company_intel)
+                    if len(self._intel_cache) > self._INTEL_CACHE_SIZE:
+                        self._intel_cache.popitem(last=False)
+                else:
+                    print(f"   ⚠️ ResumeAnalyzer: No company intel received")
+            except Exception as e:
+                print(f"   ⚠️ ResumeAnalyzer: Company research failed: {e}")
+
+        if company_intel:
+            company_expectations = f"\n\nCOMPANY EXPECTATIONS:\n{company_intel}\n\nIMPORTANT: Evaluate if this resume matches what {company_name} typically looks for. Does the candidate's experience align with their culture and technical standards?"
+
+        # Build comprehensive analysis prompt from the precompiled
+        # static head/tail - only the resume/JD/company parts vary
+        prompt = "".join((
+            _PROMPT_HEAD,
+            resume_text, "\n",
+            jd_context, "\n",
+            company_expectations, "\n\n",
+            # safe_substitute: the prompt's literal "$Y saved" must not
+            # be treated as a placeholder
+            _PROMPT_TAIL.safe_substitute(company_name=company_name),
+        ))
+
         
+        print(f"   📄 ResumeAnalyzer: Calling LLM for deep analysis...")
+        if on_progress is not None and hasattr(self.llm, 'stream'):
+            # Stream so the grade/ATS score (emitted first by the model)
+            # reach the UI seconds before fatal_flaws finish generating
+            chunks = []
+            early = {}
+            for chunk in self.llm.stream([HumanMessage(content=prompt)]):
+                chunks.append(chunk)
+                if len(early) < len(_EARLY_FIELDS):
+                    head = ''.join(chunks)
+                    for field, pattern in _EARLY_FIELDS:
+                        if field not in early:
+                            match = pattern.search(head)
+                            if match:
+                                early[field] = match.group(1)
+                                on_progress(dict(early))
+            raw_content = ''.join(chunks)
+        else:
+            response = self.llm.invoke([HumanMessage(content=prompt)])
+            raw_content = response.content
+        print(f"   📄 ResumeAnalyzer: Received {len(raw_content)} chars")
+
+        # Parse response: decode the first JSON object in place.
+        # raw_decode handles markdown fences and trailing prose without
+        # the old split/join/replace passes over the whole response.
+        raw_content = raw_content.strip()
+
         try:
-            analysis = json.loads(raw_content)
+            start = raw_content.find('{')
+            if start < 0:
+                raise ValueError("No JSON object in LLM response")
+            analysis, _ = _JSON_DECODER.raw_decode(raw_content, start)
             print(f"   📄 ResumeAnalyzer: ✅ Successfully parsed analysis")
             
             # Print summary
@@ -227,12 +304,14 @@ CRITICAL: Return ONLY valid JSON. No markdown, no code blocks."""
             'A': '🌟', 'B': '✅', 'C': '⚠️', 'D': '❌', 'F': '🚨'
         }.get(grade, '❓')
         
-        report = f"""# {grade_emoji} Resume Analysis Report
+        parts: list = []
+        append = parts.append
+        append(f"""# {grade_emoji} Resume Analysis Report
 
 ## Overall Grade: **{grade}**
 ## ATS Compatibility Score: **{ats_score}/100**
 
-"""
+""")
         
         # Company Fit Analysis (NEW - most important for tailoring)
         company_fit = analysis.get('company_fit', {})
@@ -242,72 +321,72 @@ CRITICAL: Return ONLY valid JSON. No markdown, no code blocks."""
                 'Excellent': '🌟', 'Good': '✅', 'Fair': '⚠️', 'Poor': '❌'
             }.get(match_level, '❓')
             
-            report += f"### {match_emoji} COMPANY FIT: **{match_level}**\n\n"
-            report += f"**What the company expects:**\n{company_fit.get('company_expects', 'N/A')}\n\n"
-            report += f"**What your resume shows:**\n{company_fit.get('resume_shows', 'N/A')}\n\n"
+            append(f"### {match_emoji} COMPANY FIT: **{match_level}**\n\n")
+            append(f"**What the company expects:**\n{company_fit.get('company_expects', 'N/A')}\n\n")
+            append(f"**What your resume shows:**\n{company_fit.get('resume_shows', 'N/A')}\n\n")
             
             company_gaps = company_fit.get('company_gaps', [])
             if company_gaps:
-                report += "**Critical gaps for this company:**\n"
+                append("**Critical gaps for this company:**\n")
                 for gap in company_gaps:
-                    report += f"- ❌ {gap}\n"
-                report += "\n"
+                    append(f"- ❌ {gap}\n")
+                append("\n")
             
             tailoring_tips = company_fit.get('tailoring_tips', [])
             if tailoring_tips:
-                report += "**How to tailor for this company:**\n"
+                append("**How to tailor for this company:**\n")
                 for tip in tailoring_tips:
-                    report += f"- 💡 {tip}\n"
-                report += "\n"
+                    append(f"- 💡 {tip}\n")
+                append("\n")
             
-            report += "---\n\n"
+            append("---\n\n")
         
         # Fatal Flaws (most important)
         fatal_flaws = analysis.get('fatal_flaws', [])
         if fatal_flaws:
-            report += "### 🚨 FATAL FLAWS (Fix These First)\n\n"
+            append("### 🚨 FATAL FLAWS (Fix These First)\n\n")
             for flaw in fatal_flaws:
-                report += f"- **{flaw}**\n"
-            report += "\n"
+                append(f"- **{flaw}**\n")
+            append("\n")
         
         # Red Flags
         red_flags = analysis.get('red_flags', [])
         if red_flags:
-            report += "### ⚠️ RED FLAGS\n\n"
+            append("### ⚠️ RED FLAGS\n\n")
             for flag in red_flags:
-                report += f"- {flag}\n"
-            report += "\n"
+                append(f"- {flag}\n")
+            append("\n")
         
         # Strengths
         strengths = analysis.get('strengths', [])
         if strengths:
-            report += "### ✅ STRENGTHS (Keep These)\n\n"
+            append("### ✅ STRENGTHS (Keep These)\n\n")
             for strength in strengths:
-                report += f"- {strength}\n"
-            report += "\n"
+                append(f"- {strength}\n")
+            append("\n")
         
         # Section Breakdown
         section_scores = analysis.get('section_scores', {})
         if section_scores:
-            report += "### 📊 SECTION SCORES\n\n"
+            append("### 📊 SECTION SCORES\n\n")
             for section, score in section_scores.items():
-                score_bar = "█" * score + "░" * (10 - score)
-                report += f"**{section.replace('_', ' ').title()}**: {score_bar} {score}/10\n"
-            report += "\n"
+                score_bar = _SCORE_BARS[max(0, min(10, int(score)))]
+                append(f"**{section.replace('_', ' ').title()}**: {score_bar} {score}/10\n")
+            append("\n")
         
         # Improvement Tips
         tips = analysis.get('improvement_tips', [])
         if tips:
-            report += "### 💡 TOP IMPROVEMENTS TO MAKE\n\n"
+            append("### 💡 TOP IMPROVEMENTS TO MAKE\n\n")
             for i, tip in enumerate(tips, 1):
-                report += f"{i}. {tip}\n\n"
+                append(f"{i}. {tip}\n\n")
         
         # Detailed Feedback
         detailed = analysis.get('detailed_feedback', '')
         if detailed:
-            report += f"### 📝 DETAILED ANALYSIS\n\n{detailed}\n"
+            append(f"### 📝 DETAILED ANALYSIS\n\n{detailed}\n")
         
-        return report
+        return "".join(parts)
 
 
 # Initialize with Gemini Flash (fast and accurate) + Researcher for company intel
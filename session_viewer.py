@@ -5,27 +5,125 @@ View past interview sessions with full transcript and analysis.
 
 import streamlit as st
 import sqlite3
-from datetime import datetime
+import queue
+from contextlib import contextmanager
+import html
 import json
 from typing import Dict, List
 
 DB_PATH = 'interview_sessions.db'
 
-def get_all_sessions() -> List[Dict]:
-    """Get all interview sessions sorted by date."""
+_READER_POOL_SIZE = 4
+
+# SQL lives in module constants so sqlite3's per-connection statement
+# cache sees byte-identical text every call and skips re-parsing
+_LIST_SQL = '''SELECT id, candidate_name, company, role, start_time, end_time,
+                 overall_score, total_questions, early_termination, final_verdict
+                 FROM sessions'''
+
+_DETAILS_SQL = '''SELECT
+                 (SELECT json_array(id, candidate_name, company, role, start_time,
+                                    end_time, overall_score, final_verdict,
+                                    resume_length, total_questions, early_termination)
+                  FROM sessions WHERE id = :sid),
+                 (SELECT json_group_array(json_array(question_number, stage, question,
+                                                     answer, answer_length, critic_score,
+                                                     critic_strengths, critic_weaknesses,
+                                                     critic_tip, sentiment, timestamp))
+                  FROM (SELECT * FROM qa_logs WHERE session_id = :sid
+                        ORDER BY question_number)),
+                 (SELECT json_array(session_id, matched_skills, missing_skills,
+                                    strengths, weaknesses, experience_level, red_flags)
+                  FROM profile_analysis WHERE session_id = :sid)'''
+
+
+@st.cache_resource
+def get_reader_pool() -> "queue.Queue":
+    """Pool of read-only connections, created once per process.
+
+    Opening a fresh connection per rerun re-opened the DB/WAL/SHM files
+    on every widget interaction. These read-only connections ride along
+    with the interview app's WAL writer without blocking it (the writer
+    sets journal_mode; readers can't and don't need to).
+    """
+    pool = queue.Queue()
+    for _ in range(_READER_POOL_SIZE):
+        conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True,
+                               check_same_thread=False, cached_statements=256)
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-65536')
+        conn.execute('PRAGMA mmap_size=268435456')
+        try:
+            # Warm the statement cache so first renders skip the parse
+            conn.execute(_DETAILS_SQL, {'sid': -1}).fetchone()
+        except sqlite3.Error:
+            pass  # tables may not exist yet
+        pool.put(conn)
+    return pool
+
+
+@contextmanager
+def reader():
+    """Check a connection out of the pool for the duration of a query."""
+    pool = get_reader_pool()
+    conn = pool.get()
     try:
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        
-        c.execute('''SELECT id, candidate_name, company, role, start_time, end_time, 
-                     overall_score, total_questions, early_termination, final_verdict
-                     FROM sessions 
-                     ORDER BY start_time DESC''')
-        
-        sessions = c.fetchall()
-        conn.close()
-        
-        return [
+        yield conn
+    finally:
+        pool.put(conn)
+
+
+# Short TTL: reruns triggered by unrelated widgets reuse the cached
+# page; new sessions written by the interview app (a separate process,
+# so cache_data.clear() can't reach this one) appear within 30s
+@st.cache_data(ttl=30, show_spinner=False)
+def get_all_sessions(company_filter: str = "", min_score: float = 0.0,
+                     since_days: int = 90, limit: int = 50,
+                     offset: int = 0) -> List[Dict]:
+    """Get one page of interview sessions, filtered and sorted in SQL.
+
+    The filters, time window and pagination all run in SQLite instead
+    of shipping every row to Python and dropping most of them in list
+    comprehensions - render cost stays O(page) as the history grows.
+    Ordered by id (the rowid PK) rather than start_time: same ordering
+    for append-only sessions, cheaper scan.
+    """
+    try:
+        clauses = ["start_time >= datetime('now', ?)"]
+        params = [f'-{int(since_days)} days']
+        if min_score > 0:
+            clauses.append('overall_score >= ?')
+            params.append(min_score)
+        tail = ' ORDER BY id DESC LIMIT ? OFFSET ?'
+
+        with reader() as conn:
+            if company_filter:
+                try:
+                    # Probe the FTS5 index db_manager keeps in sync via
+                    # triggers - a tokenized prefix match instead of a
+                    # LIKE '%...%' scan over every row in the window
+                    fts_clauses = clauses + [
+                        'id IN (SELECT rowid FROM sessions_fts'
+                        ' WHERE sessions_fts MATCH ?)']
+                    match = 'company:"%s"*' % company_filter.replace('"', '""')
+                    sessions = conn.execute(
+                        _LIST_SQL + ' WHERE ' + ' AND '.join(fts_clauses) + tail,
+                        params + [match, limit, offset]).fetchall()
+                except sqlite3.OperationalError:
+                    # DB predates the FTS table or this build lacks FTS5
+                    clauses.append('company LIKE ?')
+                    params.append(f'%{company_filter}%')
+                    sessions = conn.execute(
+                        _LIST_SQL + ' WHERE ' + ' AND '.join(clauses) + tail,
+                        params + [limit, offset]).fetchall()
+            else:
+                sessions = conn.execute(
+                    _LIST_SQL + ' WHERE ' + ' AND '.join(clauses) + tail,
+                    params + [limit, offset]).fetchall()
+
+        # Dict-per-row is fine at one page (<=50 rows); a columnar
+        # layout only paid off when the whole history crossed here
+        rows = [
             {
                 'id': s[0],
                 'name': s[1],
@@ -40,89 +138,168 @@ def get_all_sessions() -> List[Dict]:
             }
             for s in sessions
         ]
+
+        if rows:
+            import pandas as pd
+            # Format the display dates for the whole page in one
+            # vectorized parse + strftime, inside the cache - the cards
+            # used to try/except fromisoformat one row at a time on
+            # every rerun. Unparseable values keep the raw string.
+            dates = pd.to_datetime([r['start_time'] for r in rows],
+                                   errors='coerce')
+            formatted = dates.strftime('%B %d, %Y at %I:%M %p')
+            for row, ok, date_str in zip(rows, dates.notna(), formatted):
+                row['date_str'] = date_str if ok else row['start_time']
+
+        return rows
     except Exception as e:
         st.error(f"❌ Database error: {e}")
         return []
 
+# Completed sessions are immutable, so a longer TTL is safe here
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
 def get_session_details(session_id: int) -> Dict:
     """Get full details for a specific session."""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    
-    # Session info
-    c.execute('SELECT * FROM sessions WHERE id = ?', (session_id,))
-    session = c.fetchone()
-    
-    # QA logs
-    c.execute('''SELECT question_number, stage, question, answer, answer_length,
-                 critic_score, critic_strengths, critic_weaknesses, critic_tip, 
-                 sentiment, timestamp
-                 FROM qa_logs WHERE session_id = ? ORDER BY question_number''', 
-              (session_id,))
-    qa_logs = c.fetchall()
-    
-    # Profile analysis
-    c.execute('SELECT * FROM profile_analysis WHERE session_id = ?', (session_id,))
-    profile = c.fetchone()
-    
-    conn.close()
-    
+    # One statement, one round trip: each correlated subquery packs its
+    # result set into a JSON value (via the JSON1 extension), so the
+    # session row, the ordered transcript and the profile all come back
+    # in a single fetchone instead of three cursor trips
+    with reader() as conn:
+        session_j, qa_j, profile_j = conn.execute(
+            _DETAILS_SQL, {'sid': session_id}).fetchone()
+
+    # Decode the profile's JSON columns here, once per cache fill - the
+    # Profile tab used to json.loads each blob on every rerun
+    profile = None
+    if profile_j:
+        raw = json.loads(profile_j)
+        profile = {
+            'matched_skills': json.loads(raw[1]) if raw[1] else [],
+            'missing_skills': json.loads(raw[2]) if raw[2] else [],
+            'strengths': json.loads(raw[3]) if raw[3] else [],
+            'weaknesses': json.loads(raw[4]) if raw[4] else [],
+            'experience_level': raw[5],
+            'red_flags': json.loads(raw[6]) if raw[6] else [],
+        }
+
     return {
-        'session': session,
-        'qa_logs': qa_logs,
+        'session': tuple(json.loads(session_j)) if session_j else None,
+        'qa_logs': [tuple(row) for row in json.loads(qa_j)] if qa_j else [],
         'profile': profile
     }
 
-def display_session_card(session: Dict):
-    """Display a session as a card in the list."""
+@st.cache_data(ttl=300, show_spinner=False)
+def compute_stats(session_id: int):
+    """Aggregates for the Stats tab: chart series, stage breakdown, summary.
+
+    end_session precomputes avg/min/max and the per-stage breakdown into
+    columns on sessions at finalization, so for sessions finished on
+    current code this is a four-column read. Older rows (and sessions
+    still in progress) fall back to the same aggregates computed in SQL
+    - SQLite walks the (session_id, question_number) index; no transcript
+    columns cross into Python beyond what the chart needs. stage_stats
+    is a list of (stage, mean, count) tuples in question order either way.
+    """
+    import numpy as np
+    import pandas as pd
+
+    qa_logs = get_session_details(session_id)['qa_logs']
+    if not qa_logs:
+        return None, None, None
+
+    scores = np.fromiter((qa[5] for qa in qa_logs), dtype=np.float32,
+                         count=len(qa_logs))
+    # The per-question chart always needs the transcript rows, but those
+    # are already in hand from the cached details fetch
+    chart = pd.Series(scores, index=[f"Q{qa[0]}" for qa in qa_logs],
+                      name='Score')
+
+    summary = stage_stats = None
+    try:
+        with reader() as conn:
+            row = conn.execute(
+                '''SELECT avg_score, max_score, min_score, stage_scores_json
+                   FROM sessions WHERE id = ?''', (session_id,)).fetchone()
+        if row and row[0] is not None:
+            summary = (row[0], row[1], row[2])
+            stage_stats = ([tuple(s) for s in json.loads(row[3])]
+                           if row[3] else [])
+    except sqlite3.OperationalError:
+        pass  # DB predates the precomputed columns
+
+    if summary is None:
+        # Same aggregation end_session runs at finalization, done by
+        # SQLite instead of a pandas groupby over the full rows
+        with reader() as conn:
+            avg, mn, mx = conn.execute(
+                '''SELECT AVG(critic_score), MIN(critic_score),
+                          MAX(critic_score)
+                   FROM qa_logs WHERE session_id = ?''',
+                (session_id,)).fetchone()
+            stage_rows = conn.execute(
+                '''SELECT stage, AVG(critic_score), COUNT(*)
+                   FROM qa_logs WHERE session_id = ?
+                   GROUP BY stage ORDER BY MIN(question_number)''',
+                (session_id,)).fetchall()
+        summary = (avg, mx, mn)
+        stage_stats = [tuple(r) for r in stage_rows]
+    return chart, stage_stats, summary
+
+
+# Fragment decorator: interactions inside a fragment (expander toggles,
+# buttons) rerun just that function instead of the whole script. The
+# requirements don't pin Streamlit, so fall back through the
+# experimental name to a plain pass-through on older versions.
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+if _fragment is None:
+    def _fragment(func):
+        return func
+
+
+_LIST_TABLE_HEAD = ('<table style="width:100%">'
+                    '<tr><th></th><th>Candidate</th><th>Company</th>'
+                    '<th>Role</th><th>Date</th><th>Score</th>'
+                    '<th>Questions</th><th></th></tr>')
+
+
+def _session_row(session: Dict) -> str:
+    """One <tr> for the session list table."""
     # Determine status emoji
     if session['early_termination']:
         status_emoji = "🚫"
-        status_text = "Terminated Early"
     elif session['score'] is None:
         status_emoji = "⏸️"
-        status_text = "In Progress"
     elif session['score'] >= 7:
         status_emoji = "🌟"
-        status_text = "Strong Performance"
     elif session['score'] >= 5:
         status_emoji = "✅"
-        status_text = "Passed"
     else:
         status_emoji = "❌"
-        status_text = "Needs Improvement"
-    
-    # Format date
-    try:
-        start_dt = datetime.fromisoformat(session['start_time'])
-        date_str = start_dt.strftime("%B %d, %Y at %I:%M %p")
-    except:
-        date_str = session['start_time']
-    
+
     # Score display
     score_str = f"{session['score']:.1f}/10" if session['score'] else "N/A"
-    
-    with st.container():
-        col1, col2, col3 = st.columns([3, 2, 1])
-        
-        with col1:
-            st.markdown(f"### {status_emoji} {session['name']}")
-            st.markdown(f"**{session['company']}** - {session['role']}")
-            st.caption(f"📅 {date_str}")
-        
-        with col2:
-            st.metric("Score", score_str)
-            st.caption(f"📝 {session['questions']} questions")
-        
-        with col3:
-            if st.button("View Details", key=f"view_{session['id']}"):
-                st.session_state.selected_session = session['id']
-                st.rerun()
-        
-        st.markdown("---")
+
+    # target=_self keeps the navigation in this tab; main() picks the
+    # id back up from st.query_params
+    return (f'<tr><td>{status_emoji}</td>'
+            f'<td><b>{html.escape(str(session["name"]))}</b></td>'
+            f'<td>{html.escape(str(session["company"]))}</td>'
+            f'<td>{html.escape(str(session["role"]))}</td>'
+            f'<td>📅 {html.escape(str(session["date_str"]))}</td>'
+            f'<td>{score_str}</td>'
+            f'<td>📝 {session["questions"]}</td>'
+            f'<td><a href="?session_id={session["id"]}" target="_self">'
+            'View Details</a></td></tr>')
 
 def display_qa_log(qa_log, index: int):
-    """Display a single Q&A interaction."""
+    """Display a single Q&A interaction.
+
+    Collapsed expanders still render their children on every rerun -
+    that's Streamlit's model, so fetch-on-open would mean replacing
+    expanders with manual toggle + rerun per click. Not worth it: the
+    rows come from the cached get_session_details, so reruns only pay
+    markdown serialization, not SQL.
+    """
     question_num, stage, question, answer, answer_len, score, strengths, weaknesses, tip, sentiment, timestamp = qa_log
     
     # Score emoji
@@ -157,6 +334,176 @@ def display_qa_log(qa_log, index: int):
         if sentiment:
             st.caption(f"🎭 Sentiment: {sentiment}")
 
+@_fragment
+def render_session_list(company_filter: str, min_score: float, since_days: int,
+                        page: int, show_terminated: bool, show_incomplete: bool):
+    """List view, isolated as a fragment: card buttons rerun this
+    function only, not the whole script."""
+    st.header("All Interview Sessions")
+
+    page_size = 50
+    sessions = get_all_sessions(company_filter, min_score,
+                                since_days=since_days, limit=page_size,
+                                offset=(page - 1) * page_size)
+
+    if not sessions:
+        st.info("📭 No interview sessions found. Complete an interview to see history here!")
+        return
+
+    # Checkbox filters stay in Python (cheap booleans on the rows
+    # already fetched); company/score filtering happened in SQL
+    filtered = sessions
+    if not show_terminated:
+        filtered = [s for s in filtered if not s['early_termination']]
+    if not show_incomplete:
+        filtered = [s for s in filtered if s['score'] is not None]
+
+    st.caption(f"Showing {len(filtered)} sessions (page {page})")
+
+    # One markdown element for the whole page: the old per-session card
+    # was a container + three columns + a button widget each, so every
+    # rerun registered O(rows) widgets. Selection happens through plain
+    # links instead - main() reads ?session_id= from st.query_params
+    rows = ''.join(_session_row(s) for s in filtered)
+    st.markdown(_LIST_TABLE_HEAD + rows + '</table>', unsafe_allow_html=True)
+
+
+@_fragment
+def render_session_detail(session_id: int):
+    """Detail view fragment: expander and tab interactions rerun just
+    this function against the cached details."""
+    details = get_session_details(session_id)
+
+    if not details['session']:
+        st.error("❌ Session not found")
+        return
+
+    session = details['session']
+    qa_logs = details['qa_logs']
+    profile = details['profile']
+
+    # Session header
+    st.header(f"Session #{session_id}: {session[1]}")  # candidate_name
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Company", session[2])  # company
+    with col2:
+        st.metric("Role", session[3])  # role
+    with col3:
+        score = session[6] if session[6] else 0
+        st.metric("Overall Score", f"{score:.1f}/10")
+    with col4:
+        st.metric("Questions", session[9])  # total_questions
+
+    # Early termination warning
+    if session[10]:  # early_termination
+        st.error(f"🚫 **Interview Terminated Early:** {session[10]}")
+
+    # Tabs for different views
+    tab1, tab2, tab3, tab4 = st.tabs(["📝 Q&A Transcript", "👤 Profile Analysis", "📊 Stats", "🔍 Raw Data"])
+
+    with tab1:
+        st.subheader("Interview Transcript")
+
+        if not qa_logs:
+            st.info("No Q&A logs found")
+        else:
+            for idx, qa_log in enumerate(qa_logs):
+                display_qa_log(qa_log, idx)
+
+    with tab2:
+        st.subheader("Candidate Profile Analysis")
+
+        if not profile:
+            st.info("No profile analysis found")
+        else:
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.markdown("### ✅ Matched Skills")
+                matched = profile['matched_skills']
+                if matched:
+                    for skill in matched:
+                        st.success(f"✓ {skill}")
+                else:
+                    st.caption("_None recorded_")
+
+                st.markdown("### 💪 Strengths")
+                strengths = profile['strengths']
+                if strengths:
+                    for strength in strengths:
+                        st.info(f"• {strength}")
+                else:
+                    st.caption("_None recorded_")
+
+            with col2:
+                st.markdown("### ❌ Missing Skills")
+                missing = profile['missing_skills']
+                if missing:
+                    for skill in missing:
+                        st.error(f"✗ {skill}")
+                else:
+                    st.caption("_None recorded_")
+
+                st.markdown("### ⚠️ Weaknesses")
+                weaknesses = profile['weaknesses']
+                if weaknesses:
+                    for weakness in weaknesses:
+                        st.warning(f"• {weakness}")
+                else:
+                    st.caption("_None recorded_")
+
+            if profile['experience_level']:
+                st.markdown(f"**Experience Level:** {profile['experience_level']}")
+
+            if profile['red_flags']:
+                st.markdown("### 🚩 Red Flags")
+                for flag in profile['red_flags']:
+                    st.error(f"🚩 {flag}")
+
+    with tab3:
+        st.subheader("Performance Statistics")
+
+        chart, stage_stats, summary = compute_stats(session_id)
+        if chart is not None:
+            avg_score, max_score, min_score = summary
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Average Score", f"{avg_score:.1f}/10")
+            with col2:
+                st.metric("Best Question", f"{max_score:.1f}/10")
+            with col3:
+                st.metric("Worst Question", f"{min_score:.1f}/10")
+
+            # Score distribution
+            st.markdown("### Score Distribution")
+            st.bar_chart(chart)
+
+            # Stage breakdown
+            st.markdown("### Performance by Stage")
+            for stage, mean, count in stage_stats:
+                st.metric(f"{stage.upper()} Stage", f"{mean:.1f}/10",
+                          f"{int(count)} questions")
+
+    with tab4:
+        st.subheader("Raw Session Data")
+        st.json({
+            'session_id': session[0],
+            'candidate_name': session[1],
+            'company': session[2],
+            'role': session[3],
+            'start_time': session[4],
+            'end_time': session[5],
+            'overall_score': session[6],
+            'final_verdict': session[7],
+            'resume_length': session[8],
+            'total_questions': session[9],
+            'early_termination': session[10]
+        })
+
+
 def main():
     st.set_page_config(page_title="Interview Session History", page_icon="📚", layout="wide")
     
@@ -166,203 +513,53 @@ def main():
     # Initialize session state
     if 'selected_session' not in st.session_state:
         st.session_state.selected_session = None
-    
+
+    # The list table's View Details links navigate via ?session_id=N
+    # (no button widget per row); pick the selection up here. Guarded
+    # for pre-1.30 Streamlit without st.query_params.
+    if hasattr(st, 'query_params'):
+        qp_sid = st.query_params.get('session_id')
+    else:
+        qp_sid = st.experimental_get_query_params().get('session_id', [None])[0]
+    if qp_sid:
+        try:
+            st.session_state.selected_session = int(qp_sid)
+        except (TypeError, ValueError):
+            pass
+
     # Sidebar filters
     with st.sidebar:
         st.header("🔍 Filters")
         
         if st.button("🏠 Back to All Sessions"):
             st.session_state.selected_session = None
+            # Drop the deep link too, or it would reselect on rerun
+            if hasattr(st, 'query_params'):
+                st.query_params.clear()
+            else:
+                st.experimental_set_query_params()
             st.rerun()
         
         st.markdown("---")
         
         filter_company = st.text_input("Filter by Company", "")
         filter_min_score = st.slider("Minimum Score", 0.0, 10.0, 0.0, 0.5)
-        
+
         show_terminated = st.checkbox("Show Early Terminations", True)
         show_incomplete = st.checkbox("Show Incomplete", True)
+
+        st.markdown("---")
+        filter_days = st.number_input("Days of history", min_value=1, value=90)
+        page = st.number_input("Page", min_value=1, value=1)
     
-    # Main content
+    # Main content. Sidebar widgets above still rerun the whole script
+    # (they live outside the fragments); interactions inside each view
+    # rerun only that view's fragment.
     if st.session_state.selected_session is None:
-        # List view
-        st.header("All Interview Sessions")
-        
-        sessions = get_all_sessions()
-        
-        if not sessions:
-            st.info("📭 No interview sessions found. Complete an interview to see history here!")
-            return
-        
-        # Apply filters
-        filtered = sessions
-        if filter_company:
-            filtered = [s for s in filtered if filter_company.lower() in s['company'].lower()]
-        if filter_min_score > 0:
-            filtered = [s for s in filtered if s['score'] and s['score'] >= filter_min_score]
-        if not show_terminated:
-            filtered = [s for s in filtered if not s['early_termination']]
-        if not show_incomplete:
-            filtered = [s for s in filtered if s['score'] is not None]
-        
-        st.caption(f"Showing {len(filtered)} of {len(sessions)} sessions")
-        
-        # Display sessions
-        for session in filtered:
-            display_session_card(session)
-    
+        render_session_list(filter_company, filter_min_score, filter_days,
+                            page, show_terminated, show_incomplete)
     else:
-        # Detail view
-        session_id = st.session_state.selected_session
-        details = get_session_details(session_id)
-        
-        if not details['session']:
-            st.error("❌ Session not found")
-            return
-        
-        session = details['session']
-        qa_logs = details['qa_logs']
-        profile = details['profile']
-        
-        # Session header
-        st.header(f"Session #{session_id}: {session[1]}")  # candidate_name
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Company", session[2])  # company
-        with col2:
-            st.metric("Role", session[3])  # role
-        with col3:
-            score = session[6] if session[6] else 0
-            st.metric("Overall Score", f"{score:.1f}/10")
-        with col4:
-            st.metric("Questions", session[9])  # total_questions
-        
-        # Early termination warning
-        if session[10]:  # early_termination
-            st.error(f"🚫 **Interview Terminated Early:** {session[10]}")
-        
-        # Tabs for different views
-        tab1, tab2, tab3, tab4 = st.tabs(["📝 Q&A Transcript", "👤 Profile Analysis", "📊 Stats", "🔍 Raw Data"])
-        
-        with tab1:
-            st.subheader("Interview Transcript")
-            
-            if not qa_logs:
-                st.info("No Q&A logs found")
-            else:
-                for idx, qa_log in enumerate(qa_logs):
-                    display_qa_log(qa_log, idx)
-        
-        with tab2:
-            st.subheader("Candidate Profile Analysis")
-            
-            if not profile:
-                st.info("No profile analysis found")
-            else:
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown("### ✅ Matched Skills")
-                    matched = json.loads(profile[1]) if profile[1] else []
-                    if matched:
-                        for skill in matched:
-                            st.success(f"✓ {skill}")
-                    else:
-                        st.caption("_None recorded_")
-                    
-                    st.markdown("### 💪 Strengths")
-                    strengths = json.loads(profile[3]) if profile[3] else []
-                    if strengths:
-                        for strength in strengths:
-                            st.info(f"• {strength}")
-                    else:
-                        st.caption("_None recorded_")
-                
-                with col2:
-                    st.markdown("### ❌ Missing Skills")
-                    missing = json.loads(profile[2]) if profile[2] else []
-                    if missing:
-                        for skill in missing:
-                            st.error(f"✗ {skill}")
-                    else:
-                        st.caption("_None recorded_")
-                    
-                    st.markdown("### ⚠️ Weaknesses")
-                    weaknesses = json.loads(profile[4]) if profile[4] else []
-                    if weaknesses:
-                        for weakness in weaknesses:
-                            st.warning(f"• {weakness}")
-                    else:
-                        st.caption("_None recorded_")
-                
-                if profile[5]:  # experience_level
-                    st.markdown(f"**Experience Level:** {profile[5]}")
-                
-                if profile[6]:  # red_flags
-                    red_flags = json.loads(profile[6])
-                    if red_flags:
-                        st.markdown("### 🚩 Red Flags")
-                        for flag in red_flags:
-                            st.error(f"🚩 {flag}")
-        
-        with tab3:
-            st.subheader("Performance Statistics")
-            
-            if qa_logs:
-                scores = [qa[5] for qa in qa_logs]  # critic_score
-                avg_score = sum(scores) / len(scores)
-                max_score = max(scores)
-                min_score = min(scores)
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Average Score", f"{avg_score:.1f}/10")
-                with col2:
-                    st.metric("Best Question", f"{max_score:.1f}/10")
-                with col3:
-                    st.metric("Worst Question", f"{min_score:.1f}/10")
-                
-                # Score distribution
-                st.markdown("### Score Distribution")
-                import pandas as pd
-                df = pd.DataFrame({
-                    'Question': [f"Q{qa[0]}" for qa in qa_logs],
-                    'Score': [qa[5] for qa in qa_logs],
-                    'Stage': [qa[1] for qa in qa_logs]
-                })
-                st.bar_chart(df.set_index('Question')['Score'])
-                
-                # Stage breakdown
-                st.markdown("### Performance by Stage")
-                stages = {}
-                for qa in qa_logs:
-                    stage = qa[1]
-                    score = qa[5]
-                    if stage not in stages:
-                        stages[stage] = []
-                    stages[stage].append(score)
-                
-                for stage, scores in stages.items():
-                    avg = sum(scores) / len(scores)
-                    st.metric(f"{stage.upper()} Stage", f"{avg:.1f}/10", f"{len(scores)} questions")
-        
-        with tab4:
-            st.subheader("Raw Session Data")
-            st.json({
-                'session_id': session[0],
-                'candidate_name': session[1],
-                'company': session[2],
-                'role': session[3],
-                'start_time': session[4],
-                'end_time': session[5],
-                'overall_score': session[6],
-                'final_verdict': session[7],
-                'resume_length': session[8],
-                'total_questions': session[9],
-                'early_termination': session[10]
-            })
+        render_session_detail(st.session_state.selected_session)
 
 if __name__ == "__main__":
     main()
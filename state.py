@@ -7,15 +7,24 @@ from typing import TypedDict, List, Dict, Literal
 from langchain_core.messages import BaseMessage
 
 
-class AgentState(TypedDict):
+class AgentState(TypedDict, total=False):
     """
     Central state object passed between all agents in the graph.
     This is the "brain" of the system - all agents read and write to this.
+
+    Deliberately a TypedDict rather than a slots dataclass: LangGraph
+    state schemas must be dict-shaped so nodes can return partial key
+    updates (the parallel prep branches rely on this), and the one full
+    copy per turn (pushback_node) is a single ~20-slot dict allocation.
+    total=False because states are built incrementally - the input phase
+    only populates a handful of keys and nodes add the rest.
     """
     # Input Phase
     resume_text: str
     job_description: str
     company_name: str
+    resume_text_compact: str  # Truncated once by the Profiler - downstream prompts read these
+    job_description_compact: str
     
     # Research Phase
     company_intel: str  # Live data from web search
@@ -30,6 +39,7 @@ class AgentState(TypedDict):
     conversation_history: List[BaseMessage]
     current_question: str
     current_answer: str
+    running_summary: str  # One line per answered question - O(1) prompt growth
     
     # Shadow Critic (Hidden scoring)
     feedback_log: List[Dict[str, any]]  # Real-time evaluations
@@ -38,7 +48,7 @@ class AgentState(TypedDict):
     
     # Vision Analysis (NEW - Multimodal)
     video_enabled: bool  # Whether webcam is active
-    current_video_frame: str  # Base64 encoded frame
+    current_video_frame: bytes  # Raw JPEG frame
     current_vision_analysis: Dict[str, any]  # Gemini's body language analysis
     vision_feedback_log: List[Dict[str, any]]  # Non-verbal tracking
     
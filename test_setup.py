@@ -3,6 +3,7 @@ Quick test script to verify all agents work correctly.
 Run this before launching the full Streamlit app.
 """
 
+import importlib.util
 import os
 from dotenv import load_dotenv
 
@@ -92,42 +93,26 @@ except Exception as e:
     print(f"   ❌ Agent test failed: {e}")
 
 # Test 4: Check dependencies
+# find_spec only checks installability - actually importing these (cv2,
+# streamlit, the langchain stack) costs seconds of cold start just to
+# print a checkmark; the functional test above does the real imports
 print("\n4. Checking Dependencies...")
-try:
-    import langchain
-    print("   ✅ langchain installed")
-except:
-    print("   ❌ langchain missing - run: pip install langchain")
-
-try:
-    import langgraph
-    print("   ✅ langgraph installed")
-except:
-    print("   ❌ langgraph missing - run: pip install langgraph")
-
-try:
-    import streamlit
-    print("   ✅ streamlit installed")
-except:
-    print("   ❌ streamlit missing - run: pip install streamlit")
-
-try:
-    from langchain_google_genai import ChatGoogleGenerativeAI
-    print("   ✅ langchain-google-genai installed (Gemini)")
-except:
-    print("   ❌ langchain-google-genai missing - run: pip install langchain-google-genai")
-
-try:
-    from langchain_groq import ChatGroq
-    print("   ✅ langchain-groq installed (Fast Llama)")
-except:
-    print("   ⚠️  langchain-groq missing - run: pip install langchain-groq")
-
-try:
-    import cv2
-    print("   ✅ opencv-python installed (webcam)")
-except:
-    print("   ⚠️  opencv-python missing - run: pip install opencv-python")
+_DEPENDENCY_CHECKS = [
+    ('langchain', 'langchain installed', '❌ langchain missing - run: pip install langchain'),
+    ('langgraph', 'langgraph installed', '❌ langgraph missing - run: pip install langgraph'),
+    ('streamlit', 'streamlit installed', '❌ streamlit missing - run: pip install streamlit'),
+    ('langchain_google_genai', 'langchain-google-genai installed (Gemini)',
+     '❌ langchain-google-genai missing - run: pip install langchain-google-genai'),
+    ('langchain_groq', 'langchain-groq installed (Fast Llama)',
+     '⚠️  langchain-groq missing - run: pip install langchain-groq'),
+    ('cv2', 'opencv-python installed (webcam)',
+     '⚠️  opencv-python missing - run: pip install opencv-python'),
+]
+for module_name, ok_msg, missing_msg in _DEPENDENCY_CHECKS:
+    if importlib.util.find_spec(module_name):
+        print(f"   ✅ {ok_msg}")
+    else:
+        print(f"   {missing_msg}")
 
 print("\n" + "=" * 50)
 print("\n✨ Test Complete!")